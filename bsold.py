@@ -1,12 +1,22 @@
 import streamlit as st
-import requests
 import pandas as pd
 from datetime import datetime, timedelta
 import time
 import openai
 import os
-import feedparser
 import random
+import http_client
+import llm_cache
+import podcast_feeds
+import provider_health
+import ranking
+import records
+import research
+import response_cache
+import search_index
+import spotify_api
+import trending
+import youtube_api
 
 # Initialize session state only
 if "current_platform" not in st.session_state:
@@ -456,6 +466,13 @@ else:  # PRODUCTION
 
 st.sidebar.markdown("---")
 
+# YouTube quota ledger (resets at midnight Pacific Time)
+youtube_usage = youtube_api.usage()
+st.sidebar.caption(f"YouTube quota: {youtube_usage['used']:,} / {youtube_api.DAILY_QUOTA:,} units used today")
+st.sidebar.progress(min(youtube_usage['used'] / youtube_api.DAILY_QUOTA, 1.0))
+if youtube_api.budget_low():
+    st.sidebar.caption("Quota is low - YouTube results are served from cache where possible")
+
 # ============ MAIN CONTENT ============
 
 def get_relevant_subreddits_for_creator(creator_name, api_key):
@@ -598,19 +615,18 @@ def get_reddit_posts(subreddit, category="hot", limit=5):
     }
   ]
   
-  for url in urls_to_try:
+  # Try whichever mirror has been answering best lately first
+  for url in provider_health.rank(urls_to_try):
     for headers in headers_variants:
       try:
-        time.sleep(2)
         params = {'limit': limit, 'raw_json': 1}
-        response = requests.get(url, headers=headers, params=params, timeout=15)
+        response = http_client.get(url, headers=headers, params=params, timeout=15)
         
         if response.status_code == 200:
           data = response.json()
           if 'data' in data and 'children' in data['data'] and data['data']['children']:
             return data['data']['children'][:limit]  # Force slice to limit
         elif response.status_code == 429:
-          time.sleep(5)
           continue
       except:
         continue
@@ -622,8 +638,7 @@ def get_top_comments(subreddit, post_id, limit=3):
   url = f"https://www.reddit.com/r/{subreddit}/comments/{post_id}.json"
   
   try:
-    time.sleep(2)
-    response = requests.get(url, headers=HEADERS, timeout=15)
+    response = http_client.get(url, headers=HEADERS, timeout=15)
     
     if response.status_code == 200:
       data = response.json()
@@ -846,7 +861,7 @@ def get_top_comments(subreddit, post_id, limit=3):
 #         print(f"Error extracting facts: {e}")
 #         return facts
 
-def search_with_perplexity(query, api_key, search_type="comprehensive"):
+def search_with_perplexity(query, api_key, search_type="comprehensive", refresh=False):
     """
     Use Perplexity AI to search and analyze information about a case
     search_type: "comprehensive", "quick", "news", "academic"
@@ -920,10 +935,9 @@ def search_with_perplexity(query, api_key, search_type="comprehensive"):
             Use academic and professional sources.
             """
         
-        # Make the API call to Perplexity
-        response = client.chat.completions.create(
-            model="sonar",  # Correct model name from Perplexity docs
-            messages=[
+        request = {
+            "model": "sonar",  # Correct model name from Perplexity docs
+            "messages": [
                 {
                     "role": "system",
                     "content": "You are a true crime researcher helping Bailey Sarian research cases for Murder, Mystery & Makeup. Provide accurate, detailed information with sources."
@@ -933,9 +947,23 @@ def search_with_perplexity(query, api_key, search_type="comprehensive"):
                     "content": prompt
                 }
             ],
-            temperature=0.2,  # Lower temperature for more factual responses
-            max_tokens=2000
-        )
+            "temperature": 0.2,  # Lower temperature for more factual responses
+            "max_tokens": 2000
+        }
+        
+        # "Latest news" answers go stale within hours, background research lasts days
+        use_case = "news" if search_type == "news" else "case_research"
+        summary = llm_cache.get(use_case, "perplexity", request, refresh=refresh)
+        if summary is not None:
+            return {
+                'summary': summary,
+                'model': request['model'],
+                'usage': None  # nothing was spent
+            }
+        
+        # Make the API call to Perplexity
+        response = client.chat.completions.create(**request)
+        llm_cache.put(use_case, "perplexity", request, response.choices[0].message.content, usage=response.usage)
         
         return {
             'summary': response.choices[0].message.content,
@@ -947,7 +975,7 @@ def search_with_perplexity(query, api_key, search_type="comprehensive"):
         st.error(f"Perplexity API Error: {str(e)}")
         return None
 
-def get_perplexity_case_analysis(case_name, perplexity_api_key):
+def get_perplexity_case_analysis(case_name, perplexity_api_key, refresh=False):
     """
     Get comprehensive case analysis using Perplexity's online model
     """
@@ -962,9 +990,9 @@ def get_perplexity_case_analysis(case_name, perplexity_api_key):
             base_url="https://api.perplexity.ai"
         )
         
-        response = client.chat.completions.create(
-            model="sonar",
-            messages=[{
+        request = {
+            "model": "sonar",
+            "messages": [{
                 "role": "user",
                 "content": f"""Provide comprehensive information about the {case_name} case.
                 
@@ -981,11 +1009,16 @@ def get_perplexity_case_analysis(case_name, perplexity_api_key):
                 
                 Focus on factual, verified information from reliable sources."""
             }],
-            temperature=0.2,
-            max_tokens=2000
-        )
+            "temperature": 0.2,
+            "max_tokens": 2000
+        }
         
-        content = response.choices[0].message.content
+        # Identical prompts are answered from the LLM cache unless a refresh is asked for
+        content = llm_cache.get("case_overview", "perplexity", request, refresh=refresh)
+        if content is None:
+            response = client.chat.completions.create(**request)
+            content = response.choices[0].message.content
+            llm_cache.put("case_overview", "perplexity", request, content, usage=response.usage)
         
         # Process the content to remove the bracket citations since they're not clickable
         import re
@@ -1001,6 +1034,36 @@ def get_perplexity_case_analysis(case_name, perplexity_api_key):
         st.error(f"Perplexity API error: {str(e)}")
         return None
         
+def stream_reddit_by_keywords(query, subreddits, limit=5):
+  """Search several subreddits at once, yielding (subreddit, top posts so far) as each lands.
+
+  Requests share the Reddit rate limiter in http_client, so the fan-out
+  only removes the waiting between them. The searches run on research's
+  "reddit" pool. The last yield holds the final top limit*3 posts by score.
+  """
+  def search_subreddit(subreddit):
+    search_url = f"https://www.reddit.com/r/{subreddit}/search.json"
+    params = {
+      'q': query,
+      'restrict_sr': 'true',
+      'sort': 'top',
+      't': 'day',
+      'limit': limit
+    }
+    response = http_client.get(search_url, headers=HEADERS, params=params, timeout=15)
+    if response.status_code != 200:
+      return []
+    posts = response.json().get('data', {}).get('children', [])
+    return [records.RedditPost.from_reddit(post['data'], subreddit) for post in posts]
+  
+  best = ranking.TopK(limit * 3, key=lambda x: x.score)
+  tasks = {subreddit: (lambda subreddit=subreddit: search_subreddit(subreddit)) for subreddit in subreddits}
+  for subreddit, posts, error in research.fan_out(tasks, pool="reddit"):
+    if error is None:
+      best.extend(posts)
+    yield subreddit, best.items()
+
+@response_cache.cached("reddit", text_args=("query",))
 def search_reddit_by_keywords(query, subreddits, limit=5):
   """Search Reddit for posts containing specific keywords"""
   all_results = []
@@ -1016,67 +1079,129 @@ def search_reddit_by_keywords(query, subreddits, limit=5):
         'limit': limit * 2,
         'type': 'link'
       }
-      time.sleep(2)
-      response = requests.get(search_url, headers=HEADERS, params=params, timeout=15)
+      response = http_client.get(search_url, headers=HEADERS, params=params, timeout=15)
       
       if response.status_code == 200:
         data = response.json()
         if 'data' in data and 'children' in data['data']:
           posts = data['data']['children']
-          for post in posts:
-            post['data']['source_subreddit'] = post['data']['subreddit']
-          all_results.extend(posts)
+          all_results.extend(records.RedditPost.from_reddit(post['data']) for post in posts)
     except:
       # Fallback to popular subreddits if all Reddit search fails
       subreddits = ["Conservative", "Politics", "News", "WorldNews", "AskReddit", "PublicFreakout"]
   
-  # Search specific subreddits
+  # Search specific subreddits concurrently
   if subreddits != ["all"]:
-    for subreddit in subreddits:
-      try:
-        search_url = f"https://www.reddit.com/r/{subreddit}/search.json"
+    top_results = []
+    for _, top_results in stream_reddit_by_keywords(query, subreddits, limit):
+      pass
+    return top_results
+  
+  # Return the top results by score
+  return ranking.top_k(all_results, limit * 3, key=lambda x: x.score)
+
+def calculate_trending_score(upvotes, comments, created_utc):
+  """Calculate a trending score based on upvotes, comments, and recency"""
+  return ranking.decayed_trend_score(upvotes, comments, created_utc)
+
+def search_reddit_for_case(case_name):
+    """Search all of Reddit for posts about a case.
+
+    Pushshift, the Reddit search variations and the true crime subreddit
+    searches are raced together. Results are taken in that priority order
+    until there are enough, so the last-name-only subreddit searches only
+    fill gaps, then sorted by score.
+    """
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+    }
+    
+    def pushshift():
+        # Pushshift (Reddit archive) has the best search but is often down
         params = {
-          'q': query,
-          'restrict_sr': 'true',
-          'sort': 'top',
-          't': 'day',
-          'limit': limit
+            'q': case_name,
+            'size': 100,
+            'sort': 'score',
+            'sort_type': 'desc'
         }
-        time.sleep(2)
-        response = requests.get(search_url, headers=HEADERS, params=params, timeout=15)
+        response = http_client.get("https://api.pushshift.io/reddit/search/submission/", params=params, timeout=10)
+        if response.status_code != 200:
+            return []
+        return [records.RedditPost.from_pushshift(item) for item in response.json().get('data', [])]
+    
+    def reddit_search(search_term):
+        # Search across all Reddit
+        params = {
+            'q': f'{search_term} (murder OR killer OR crime OR death)',  # Add context
+            'sort': 'relevance',
+            'limit': 100,
+            't': 'all',
+            'type': 'link',
+            'raw_json': 1
+        }
+        response = http_client.get("https://www.reddit.com/search.json", headers=headers, params=params, timeout=15)
+        if response.status_code != 200:
+            return []
+        results = []
+        for post in response.json().get('data', {}).get('children', []):
+            title_lower = post['data']['title'].lower()
+            
+            # Check if relevant to our search
+            if any(word.lower() in title_lower for word in case_name.split()):
+                results.append(records.RedditPost.from_reddit(post['data']))
+        return results
+    
+    def subreddit_search(subreddit):
+        params = {
+            'q': case_name.split()[-1],  # Just last name
+            'restrict_sr': 'on',
+            'sort': 'relevance',
+            'limit': 50,
+            't': 'all',
+            'raw_json': 1
+        }
+        response = http_client.get(f"https://www.reddit.com/r/{subreddit}/search.json", headers=headers, params=params, timeout=10)
+        if response.status_code != 200:
+            return []
+        return [records.RedditPost.from_reddit(post['data'])
+                for post in response.json().get('data', {}).get('children', [])]
+    
+    reddit_results = []
+    try:
+        # Search variations to improve results
+        search_variations = [
+            case_name,  # Full name
+            ' '.join(case_name.split()[:2]) if len(case_name.split()) > 2 else case_name,  # First two words
+            case_name.split()[-1] if len(case_name.split()) > 1 else case_name,  # Last word only
+        ]
+        crime_subreddits = ["serialkillers", "TrueCrime", "UnresolvedMysteries"]
         
-        if response.status_code == 200:
-          data = response.json()
-          if 'data' in data and 'children' in data['data']:
-            posts = data['data']['children']
+        tasks = [('pushshift', pushshift)]
+        tasks += [(f"search:{term}", lambda term=term: reddit_search(term)) for term in dict.fromkeys(search_variations)]
+        tasks += [(f"r/{subreddit}", lambda subreddit=subreddit: subreddit_search(subreddit)) for subreddit in crime_subreddits]
+        
+        # Fill from the highest-priority sources first, skipping duplicates
+        seen = set()
+        for _, posts in research.hedge(tasks, enough=20):
             for post in posts:
-              post['data']['source_subreddit'] = subreddit
-            all_results.extend(posts)
-      except:
-        continue
-  
-  # Sort by score and return top results
-  all_results.sort(key=lambda x: x['data']['score'], reverse=True)
-  return all_results[:limit * 3]
+                post_id = post.id or post.title
+                if post_id not in seen:
+                    seen.add(post_id)
+                    reddit_results.append(post)
+            if len(reddit_results) >= 20:
+                break
 
-def calculate_trending_score(upvotes, comments, created_utc):
-  """Calculate a trending score based on upvotes, comments, and recency"""
-  # Convert created_utc to hours ago
-  hours_ago = (datetime.now() - datetime.fromtimestamp(created_utc)).total_seconds() / 3600
-  
-  # Prevent division by zero and give recent posts a boost
-  time_factor = 1 / (hours_ago + 2) # +2 to prevent extreme values for very new posts
-  
-  # Engagement score
-  engagement = upvotes + (comments * 2) # Comments weighted more heavily
-  
-  # Calculate trending score
-  trending_score = engagement * time_factor
-  
-  return int(trending_score)
+        # Keep the top 20 by score
+        reddit_results = ranking.top_k(reddit_results, 20, key=lambda x: x.score)
+
+    except Exception as e:
+        print(f"Reddit search error: {e}")
+    
+    return reddit_results
 
 # ============ TRUE CRIME RESEARCH API FUNCTIONS ============
 
+@response_cache.cached("wikidata", text_args=("query",))
 def search_wikidata(query, limit=25):
     """Search Wikidata for people, cases, or events - AI-filtered for Bailey Sarian relevance"""
     url = "https://www.wikidata.org/w/api.php"
@@ -1090,7 +1215,7 @@ def search_wikidata(query, limit=25):
     }
     
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = http_client.get(url, params=params, timeout=10)
         if response.status_code == 200:
             data = response.json()
             all_results = []
@@ -1174,6 +1299,7 @@ If the search term itself is clearly not crime-related, return "NONE"."""
     
     return []
 
+@response_cache.cached("wikipedia")
 def get_wikipedia_content(article_title, max_chars=3000):
     """Fetch actual Wikipedia article content"""
     import urllib.parse
@@ -1192,7 +1318,7 @@ def get_wikipedia_content(article_title, max_chars=3000):
     }
     
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = http_client.get(url, params=params, timeout=10)
         if response.status_code == 200:
             data = response.json()
             pages = data.get("query", {}).get("pages", {})
@@ -1204,7 +1330,7 @@ def get_wikipedia_content(article_title, max_chars=3000):
     
     return ""
 
-def search_with_gemini(query, gemini_api_key):
+def search_with_gemini(query, gemini_api_key, refresh=False):
     """Use Gemini with grounding to search the real-time web"""
     if not gemini_api_key:
         return None
@@ -1235,10 +1361,10 @@ Please search for and provide:
 Focus on true crime, murder cases, or criminal activities if applicable.
 Include specific dates, locations, and verified facts from your web search."""
 
-        # Generate with grounding enabled
-        response = model.generate_content(search_prompt)
-        
-        return response.text
+        # Generate with grounding enabled - identical searches are served from the LLM cache
+        request = {"model": "gemini-1.5-flash-latest", "tools": ["google_search_retrieval"], "prompt": search_prompt}
+        return llm_cache.cached_call("web_search", "gemini", request,
+                                     lambda: model.generate_content(search_prompt).text, refresh=refresh)
         
     except Exception as e:
         print(f"Gemini search error: {e}")
@@ -1256,6 +1382,7 @@ Focus on any criminal cases, murders, or true crime connections."""
             
         except Exception as e2:
             return f"Error: {str(e2)}"    
+@response_cache.cached("courtlistener", text_args=("query",))
 def search_courtlistener(query, limit=20):
     """Search CourtListener for court documents and opinions"""
     url = "https://www.courtlistener.com/api/rest/v3/search/"
@@ -1266,7 +1393,7 @@ def search_courtlistener(query, limit=20):
     }
     
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = http_client.get(url, params=params, timeout=10)
         if response.status_code == 200:
             data = response.json()
             results = []
@@ -1288,21 +1415,12 @@ def count_youtube_videos(query, youtube_key):
     if not youtube_key:
         return 0
     
-    url = "https://www.googleapis.com/youtube/v3/search"
-    params = {
-        "key": youtube_key,
-        "part": "id",
-        "q": query,
-        "type": "video",
-        "maxResults": 50  # Just to get a count
-    }
-    
     try:
-        response = requests.get(url, params=params, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
+        # Shares one cached search with the YouTube tab; skipped when the quota is low
+        result = youtube_api.search_videos(query, youtube_key)
+        if result:
             # Total results gives us an estimate
-            return data.get("pageInfo", {}).get("totalResults", 0)
+            return result['total_results']
     except:
         pass
     return 0
@@ -1365,7 +1483,7 @@ def calculate_real_case_score(case_data):
     
     return max(0, min(100, score))
 
-def analyze_with_ai(post_title, post_content, comments, api_key, creator_name, image_url=None):
+def analyze_with_ai(post_title, post_content, comments, api_key, creator_name, image_url=None, refresh=False):
   """Analyze post and comments with OpenAI"""
   if not api_key:
     return None
@@ -1405,14 +1523,18 @@ CONTROVERSY LEVEL: How polarizing this content would be for {creator_name} (1-10
 
 Important: Base your analysis on {creator_name}'s actual known personality, political positions, and communication style."""
 
+  request = {
+    "model": "gpt-4.1-nano",
+    "messages": [{"role": "user", "content": creator_prompt}],
+    "max_tokens": 600
+  }
+  
   try:
-    response = openai.ChatCompletion.create(
-      model="gpt-4.1-nano",
-      messages=[{"role": "user", "content": creator_prompt}],
-      max_tokens=600,
-      timeout=20
+    return llm_cache.cached_call(
+      "post_analysis", "openai", request,
+      lambda: openai.ChatCompletion.create(timeout=20, **request).choices[0].message.content,
+      refresh=refresh
     )
-    return response.choices[0].message.content
   except Exception as e:
     return f"AI Analysis Error: {str(e)}"
 
@@ -1638,7 +1760,7 @@ def get_youtube_trending(api_key=None, region='US', max_results=15):
       'videoCategoryId': '25' # News & Politics category
     }
     
-    response = requests.get(url, params=params, timeout=15)
+    response = youtube_api.get(url, params=params, timeout=15)
     
     if response.status_code == 200:
       data = response.json()
@@ -1819,7 +1941,7 @@ def search_youtube_videos(query, api_key=None, max_results=10, timeframe="week",
         'key': api_key
       }
       
-      channel_response = requests.get(search_url, params=channel_params, timeout=15)
+      channel_response = youtube_api.get(search_url, params=channel_params, timeout=15)
       
       if channel_response.status_code == 200:
         channel_data = channel_response.json()
@@ -1848,11 +1970,13 @@ def search_youtube_videos(query, api_key=None, max_results=10, timeframe="week",
           
           video_params['publishedAfter'] = published_after
           
-          video_response = requests.get(search_url, params=video_params, timeout=15)
+          video_response = youtube_api.get(search_url, params=video_params, timeout=15)
           
           if video_response.status_code == 200:
             video_data = video_response.json()
             search_results = []
+            video_ids = [item.get('id', {}).get('videoId', '') for item in video_data.get('items', [])]
+            video_stats = youtube_api.get_video_stats(video_ids, api_key)
             
             for item in video_data.get('items', []):
               snippet = item.get('snippet', {})
@@ -1860,11 +1984,11 @@ def search_youtube_videos(query, api_key=None, max_results=10, timeframe="week",
               video_data_item = {
                 'title': snippet.get('title', 'No title'),
                 'channel': snippet.get('channelTitle', 'Unknown Channel'),
-                'published': format_youtube_date(snippet.get('publishedAt', 'Unknown')),
+                'published': youtube_api.format_date(snippet.get('publishedAt', 'Unknown')),
                 'video_id': item.get('id', {}).get('videoId', ''),
                 'description': snippet.get('description', '')[:200] + '...' if snippet.get('description') else '',
                 'thumbnail': snippet.get('thumbnails', {}).get('medium', {}).get('url', ''),
-                'views': get_video_views(item.get('id', {}).get('videoId', ''), api_key)
+                'views': youtube_api.format_views(video_stats.get(item.get('id', {}).get('videoId', '')))
               }
               search_results.append(video_data_item)
             
@@ -1893,11 +2017,13 @@ def search_youtube_videos(query, api_key=None, max_results=10, timeframe="week",
         'publishedAfter': published_after
       }
       
-      response = requests.get(url, params=params, timeout=15)
+      response = youtube_api.get(url, params=params, timeout=15)
       
       if response.status_code == 200:
         data = response.json()
         search_results = []
+        video_ids = [item.get('id', {}).get('videoId', '') for item in data.get('items', [])]
+        video_stats = youtube_api.get_video_stats(video_ids, api_key)
         
         for item in data.get('items', []):
           snippet = item.get('snippet', {})
@@ -1905,11 +2031,11 @@ def search_youtube_videos(query, api_key=None, max_results=10, timeframe="week",
           video_data = {
             'title': snippet.get('title', 'No title'),
             'channel': snippet.get('channelTitle', 'Unknown Channel'),
-            'published': format_youtube_date(snippet.get('publishedAt', 'Unknown')),
+            'published': youtube_api.format_date(snippet.get('publishedAt', 'Unknown')),
             'video_id': item.get('id', {}).get('videoId', ''),
             'description': snippet.get('description', '')[:200] + '...' if snippet.get('description') else '',
             'thumbnail': snippet.get('thumbnails', {}).get('medium', {}).get('url', ''),
-            'views': get_video_views(item.get('id', {}).get('videoId', ''), api_key)
+            'views': youtube_api.format_views(video_stats.get(item.get('id', {}).get('videoId', '')))
           }
           search_results.append(video_data)
         
@@ -1947,54 +2073,6 @@ def extract_view_count_for_sorting(views_string):
     except:
         return 0
     
-def get_video_views(video_id, api_key):
-    """Get view count for a specific video"""
-    if not api_key or not video_id or video_id.startswith('sample'):
-        return "N/A"
-    
-    try:
-        url = "https://www.googleapis.com/youtube/v3/videos"
-        params = {
-            'part': 'statistics',
-            'id': video_id,
-            'key': api_key
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('items') and len(data['items']) > 0:
-                stats = data['items'][0].get('statistics', {})
-                view_count = stats.get('viewCount')
-                if view_count:
-                    views = int(view_count)
-                    if views >= 1000000:
-                        return f"{views/1000000:.1f}M views"
-                    elif views >= 1000:
-                        return f"{views/1000:.0f}K views"
-                    else:
-                        return f"{views:,} views"
-        return "N/A"
-    except:
-        return "N/A"
-
-def format_youtube_date(date_string):
-    """Convert YouTube API date to MM/DD/YY format"""
-    if not date_string or date_string in ['Unknown', 'N/A']:
-        return date_string
-    
-    try:
-        from datetime import datetime
-        if 'T' in date_string:
-            clean_date = date_string.replace('Z', '').split('T')[0]
-            dt = datetime.strptime(clean_date, '%Y-%m-%d')
-        else:
-            dt = datetime.fromisoformat(date_string.replace('Z', '+00:00'))
-        return dt.strftime('%m/%d/%y')
-    except:
-        return date_string
-
 def get_youtube_comments(video_id, api_key=None, max_results=20):
   """Get comments from a YouTube video"""
   if not api_key:
@@ -2019,7 +2097,7 @@ def get_youtube_comments(video_id, api_key=None, max_results=20):
       'key': api_key
     }
     
-    response = requests.get(url, params=params, timeout=15)
+    response = youtube_api.get(url, params=params, timeout=15)
     
     if response.status_code == 200:
       data = response.json()
@@ -2078,7 +2156,7 @@ def get_video_by_id(video_id, api_key=None):
       'key': api_key
     }
     
-    response = requests.get(url, params=params, timeout=15)
+    response = youtube_api.get(url, params=params, timeout=15)
     
     if response.status_code == 200:
       data = response.json()
@@ -2090,8 +2168,8 @@ def get_video_by_id(video_id, api_key=None):
         return {
           'title': snippet.get('title', 'No title'),
           'channel': snippet.get('channelTitle', 'Unknown Channel'),
-          'published': format_youtube_date(snippet.get('publishedAt', 'Unknown')),
-          'views': get_video_views(item.get('id', ''), youtube_api_key),
+          'published': youtube_api.format_date(snippet.get('publishedAt', 'Unknown')),
+          'views': youtube_api.format_views(stats),
           'video_id': video_id,
           'description': snippet.get('description', '')[:200] + '...' if snippet.get('description') else '',
           'thumbnail': snippet.get('thumbnails', {}).get('medium', {}).get('url', '')
@@ -2259,7 +2337,7 @@ def get_youtube_podcast_channels(api_key=None, category="general", max_results=2
             'key': api_key
         }
         
-        response = requests.get(url, params=params, timeout=15)
+        response = youtube_api.get(url, params=params, timeout=15)
         
         if response.status_code == 200:
             data = response.json()
@@ -2288,35 +2366,12 @@ def get_youtube_podcast_channels(api_key=None, category="general", max_results=2
 # ============ SPOTIFY API FUNCTIONS ============
 
 def get_spotify_token(client_id, client_secret):
-    """Get Spotify access token using Client Credentials Flow"""
+    """Get a Spotify access token from the shared, expiry-aware token manager"""
     if not client_id or not client_secret:
         return None
     
     try:
-        import base64
-        
-        # Encode credentials
-        credentials = f"{client_id}:{client_secret}"
-        encoded_credentials = base64.b64encode(credentials.encode()).decode()
-        
-        # Get token
-        url = "https://accounts.spotify.com/api/token"
-        headers = {
-            "Authorization": f"Basic {encoded_credentials}",
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
-        data = {
-            "grant_type": "client_credentials"
-        }
-        
-        response = requests.post(url, headers=headers, data=data)
-        
-        if response.status_code == 200:
-            return response.json()['access_token']
-        else:
-            st.error(f"❌ Spotify Auth Error: {response.status_code}")
-            return None
-            
+        return spotify_api.get_access_token(client_id, client_secret)
     except Exception as e:
         st.error(f"❌ Spotify Token Error: {str(e)}")
         return None
@@ -2353,7 +2408,7 @@ def search_podcasts_by_genre(token, genre="all", limit=10):
         
         url = "https://api.spotify.com/v1/search"
         
-        response = requests.get(url, headers=headers, params=params)
+        response = http_client.get(url, headers=headers, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -2385,7 +2440,7 @@ def search_podcasts_by_genre(token, genre="all", limit=10):
                 search_query = f"{genre} podcast"
                 params['q'] = search_query
                 
-                response = requests.get(url, headers=headers, params=params)
+                response = http_client.get(url, headers=headers, params=params)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -2432,7 +2487,7 @@ def get_show_episodes(token, show_id, limit=10):
             "market": "US"
         }
         
-        response = requests.get(url, headers=headers, params=params)
+        response = http_client.get(url, headers=headers, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -2472,7 +2527,7 @@ def search_podcasts_by_topic(token, topic, limit=20):
             "market": "US"
         }
         
-        response = requests.get(url, headers=headers, params=params)
+        response = http_client.get(url, headers=headers, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -2480,14 +2535,10 @@ def search_podcasts_by_topic(token, topic, limit=20):
             
             items = data.get('episodes', {}).get('items', [])
             
-            # First, collect all episodes with their show IDs
+            # First, collect the episodes - search results omit the show, so it is resolved in a batch below
             episode_list = []
-            show_ids = set()
             
             for ep in items:
-                # Extract show ID from the episode href
-                # The href looks like: "https://api.spotify.com/v1/episodes/6FjEzvYK4hXVhV1X5hh2XP"
-                # We need to get the show ID by fetching the full episode details
                 episode_id = ep.get('id', '')
                 
                 episode_data = {
@@ -2503,22 +2554,11 @@ def search_podcasts_by_topic(token, topic, limit=20):
                 }
                 episode_list.append(episode_data)
             
-            # Now fetch full episode details to get show IDs
-            for i, ep_data in enumerate(episode_list):
-                if ep_data['id']:
-                    ep_url = f"https://api.spotify.com/v1/episodes/{ep_data['id']}"
-                    ep_response = requests.get(ep_url, headers=headers, params={"market": "US"})
-                    
-                    if ep_response.status_code == 200:
-                        full_episode = ep_response.json()
-                        if 'show' in full_episode:
-                            show_id = full_episode['show'].get('id')
-                            show_name = full_episode['show'].get('name', 'Unknown Show')
-                            episode_list[i]['show_id'] = show_id
-                            episode_list[i]['show_name'] = show_name
-                        
-                        # Small delay to respect rate limits
-                        time.sleep(0.1)
+            # Resolve every episode's show with batched multi-ID lookups
+            episode_shows = spotify_api.get_episode_shows(token, [ep_data['id'] for ep_data in episode_list])
+            for ep_data in episode_list:
+                if ep_data['id'] in episode_shows:
+                    ep_data.update(episode_shows[ep_data['id']])
             
             return episode_list
             
@@ -2548,7 +2588,7 @@ def get_new_episodes_today(token, limit=20):
             "market": "US"
         }
         
-        response = requests.get(url, headers=headers, params=params)
+        response = http_client.get(url, headers=headers, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -2576,6 +2616,7 @@ def get_new_episodes_today(token, limit=20):
     except Exception as e:
         return None
     
+@response_cache.cached("itunes")
 def get_itunes_top_podcasts(genre_id=None, limit=20):
     """Get top podcasts from iTunes/Apple Podcasts"""
     try:
@@ -2608,7 +2649,7 @@ def get_itunes_top_podcasts(genre_id=None, limit=20):
         else:
             url = f"https://itunes.apple.com/us/rss/toppodcasts/limit={limit}/json"
         
-        response = requests.get(url, timeout=10)
+        response = http_client.get(url, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -2640,46 +2681,18 @@ def get_itunes_top_podcasts(genre_id=None, limit=20):
 
 def get_itunes_podcast_episodes(podcast_id, limit=5):
     """Get recent episodes for a specific podcast from iTunes"""
-    try:
-        # iTunes lookup API to get podcast details and feed URL
-        lookup_url = f"https://itunes.apple.com/lookup?id={podcast_id}"
-        response = requests.get(lookup_url, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('results'):
-                podcast_info = data['results'][0]
-                feed_url = podcast_info.get('feedUrl')
-                
-                if feed_url:
-                    # Parse the podcast RSS feed
-                    feed = feedparser.parse(feed_url)
-                    episodes = []
-                    
-                    for entry in feed.entries[:limit]:
-                        episode_data = {
-                            'title': entry.get('title', 'Unknown'),
-                            'published': entry.get('published', 'Unknown'),
-                            'duration': entry.get('itunes_duration', 'Unknown'),
-                            'description': entry.get('summary', '')[:300] + '...',
-                            'link': entry.get('link', '')
-                        }
-                        episodes.append(episode_data)
-                    
-                    return episodes
-        return []
-    except:
-        return []
+    return podcast_feeds.get_podcast_episodes(podcast_id, limit=limit)
   
     
 # ============ TMDB API FUNCTIONS ============
 
+@response_cache.cached("tmdb")
 def get_tmdb_genres(api_key, media_type='movie'):
     """Get list of genres from TMDb"""
     try:
         url = f"https://api.themoviedb.org/3/genre/{media_type}/list"
         params = {'api_key': api_key}
-        response = requests.get(url, params=params)
+        response = http_client.get(url, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -2688,6 +2701,7 @@ def get_tmdb_genres(api_key, media_type='movie'):
     except:
         return {}
 
+@response_cache.cached("tmdb", text_args=("query",))
 def search_tmdb(api_key, query=None, media_type='movie', genre_id=None, year=None, 
                 company_id=None, sort_by='popularity.desc', page=1):
     """Search TMDb for movies or TV shows"""
@@ -2721,7 +2735,7 @@ def search_tmdb(api_key, query=None, media_type='movie', genre_id=None, year=Non
             if company_id:
                 params['with_companies'] = company_id
         
-        response = requests.get(url, params=params)
+        response = http_client.get(url, params=params)
         
         if response.status_code == 200:
             return response.json()
@@ -2730,6 +2744,7 @@ def search_tmdb(api_key, query=None, media_type='movie', genre_id=None, year=Non
         st.error(f"TMDb API Error: {str(e)}")
         return None
 
+@response_cache.cached("tmdb")
 def get_tmdb_item_details(api_key, item_id, media_type='movie'):
     """Get detailed information about a movie or TV show"""
     try:
@@ -2739,7 +2754,7 @@ def get_tmdb_item_details(api_key, item_id, media_type='movie'):
             'append_to_response': 'credits,videos,keywords'
         }
         
-        response = requests.get(url, params=params)
+        response = http_client.get(url, params=params)
         
         if response.status_code == 200:
             return response.json()
@@ -2770,7 +2785,7 @@ def search_tmdb_multiple_companies(api_key, company_ids, media_type='movie', sor
                 else:
                     params['first_air_date_year'] = year
             
-            response = requests.get(url, params=params)
+            response = http_client.get(url, params=params)
             
             if response.status_code == 200:
                 data = response.json()
@@ -2809,7 +2824,7 @@ def search_tmdb_companies(api_key, query):
             'query': query
         }
         
-        response = requests.get(url, params=params)
+        response = http_client.get(url, params=params)
         
         if response.status_code == 200:
             return response.json()['results']
@@ -2818,7 +2833,7 @@ def search_tmdb_companies(api_key, query):
         return []
 
 def analyze_movie_tv_trend(title, overview, popularity, vote_average, media_type, 
-                          genre_names, creator_name, api_key):
+                          genre_names, creator_name, api_key, refresh=False):
     """Analyze how a creator should cover a trending movie/TV show"""
     if not api_key:
         return None
@@ -2868,66 +2883,20 @@ HASHTAGS: Relevant hashtags for maximum reach
 
 CONTROVERSY/DISCUSSION POINTS: What aspects would generate the most engagement and discussion?"""
     
-    try:
-        response = openai.ChatCompletion.create(
-            model="gpt-4.1-nano",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=800,
-            timeout=30
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        return f"AI Analysis Error: {str(e)}"
-        
-# First, add this function with your other YouTube functions (before the platform section):
-
-def get_relevant_channels_for_creator(creator_name, api_key):
-    """Use AI to find 5 most relevant YouTube channels for a creator"""
-    if not api_key:
-        return None
-    
-    prompt = f"""You are a YouTube content strategist. Find 5 YouTube channels that are most similar to "{creator_name}" in terms of:
-    - Content style and format
-    - Target audience
-    - Topic/niche overlap
-    - Production quality level
-    
-    Focus on channels that would have similar audiences and content approaches.
-    
-    Return ONLY a Python list of 5 channel names like this:
-    ["Channel Name 1", "Channel Name 2", "Channel Name 3", "Channel Name 4", "Channel Name 5"]
-    
-    Make sure channel names are exact and searchable on YouTube. No extra text, just the list."""
+    request = {
+        "model": "gpt-4.1-nano",
+        "messages": [{"role": "user", "content": prompt}],
+        "max_tokens": 800
+    }
     
     try:
-        import openai
-        openai.api_key = api_key
-        
-        response = openai.ChatCompletion.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=200,
-            temperature=0.3,
-            timeout=30
+        return llm_cache.cached_call(
+            "trend_analysis", "openai", request,
+            lambda: openai.ChatCompletion.create(timeout=30, **request).choices[0].message.content,
+            refresh=refresh
         )
-        
-        result = response.choices[0].message.content.strip()
-        
-        # Parse the list from the AI response
-        import ast
-        try:
-            channels = ast.literal_eval(result)
-            if isinstance(channels, list) and len(channels) <= 5:
-                return [channel.strip() for channel in channels if channel.strip()]
-        except:
-            # Fallback parsing if AI doesn't return perfect list format
-            import re
-            channels = re.findall(r'"([^"]*)"', result)
-            return channels[:5] if channels else None
-            
     except Exception as e:
-        print(f"Error getting relevant channels: {e}")
-        return None
+        return f"AI Analysis Error: {str(e)}"
 
 def search_youtube_by_channel(channel_name, api_key=None, max_results=5):
     """Search YouTube for recent videos from a specific channel"""
@@ -2951,7 +2920,7 @@ def search_youtube_by_channel(channel_name, api_key=None, max_results=5):
             'key': api_key
         }
         
-        search_response = requests.get(search_url, params=search_params, timeout=15)
+        search_response = youtube_api.get(search_url, params=search_params, timeout=15)
         
         if search_response.status_code == 200:
             search_data = search_response.json()
@@ -2970,20 +2939,22 @@ def search_youtube_by_channel(channel_name, api_key=None, max_results=5):
                     'publishedAfter': (datetime.now() - timedelta(days=30)).isoformat() + 'Z'
                 }
                 
-                videos_response = requests.get(videos_url, params=videos_params, timeout=15)
+                videos_response = youtube_api.get(videos_url, params=videos_params, timeout=15)
                 
                 if videos_response.status_code == 200:
                     videos_data = videos_response.json()
                     channel_videos = []
+                    video_ids = [item.get('id', {}).get('videoId', '') for item in videos_data.get('items', [])]
+                    video_stats = youtube_api.get_video_stats(video_ids, api_key)
                     
                     for item in videos_data.get('items', []):
                         snippet = item.get('snippet', {})
                         video_data = {
                           'title': snippet.get('title', 'No title'),
                           'channel': snippet.get('channelTitle', 'Unknown Channel'),
-                          'views': get_video_views(item.get('id', ''), api_key),
-                          'published': format_youtube_date(snippet.get('publishedAt', 'Unknown')),
-                          'video_id': item.get('id', ''),
+                          'views': youtube_api.format_views(video_stats.get(item.get('id', {}).get('videoId', ''))),
+                          'published': youtube_api.format_date(snippet.get('publishedAt', 'Unknown')),
+                          'video_id': item.get('id', {}).get('videoId', ''),
                           'description': snippet.get('description', '')[:200] + '...' if snippet.get('description') else '',
                           'thumbnail': snippet.get('thumbnails', {}).get('medium', {}).get('url', '')
                         }                        
@@ -2997,492 +2968,72 @@ def search_youtube_by_channel(channel_name, api_key=None, max_results=5):
     except Exception as e:
         return search_youtube_by_channel(channel_name)  # Return sample data on error
 
-# Now replace your entire YouTube Intelligence platform section with this:
+# Get the API keys
+api_key, youtube_api_key, spotify_client_id, spotify_client_secret, tmdb_key, gemini_api_key, serper_api_key, perplexity_api_key = get_api_keys()
 
-# First, add this function with your other YouTube functions (before the platform section):
+# Initialize page state
+if 'current_page' not in st.session_state:
+    st.session_state.current_page = "Case Search"
 
-def get_video_views(video_id, api_key):
-    """Get view count for a specific video"""
-    if not api_key or not video_id:
-        return "N/A"
+# Display content based on current page
+if st.session_state.current_page == "Case Search":
+    st.markdown("### Search Cases")
     
-    try:
-        url = "https://www.googleapis.com/youtube/v3/videos"
-        params = {
-            'part': 'statistics',
-            'id': video_id,
-            'key': api_key
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('items'):
-                view_count = data['items'][0].get('statistics', {}).get('viewCount', 'N/A')
-                if view_count != 'N/A':
-                    # Format view count nicely (e.g., 1,234,567 -> 1.2M)
-                    try:
-                        views = int(view_count)
-                        if views >= 1000000:
-                            return f"{views/1000000:.1f}M views"
-                        elif views >= 1000:
-                            return f"{views/1000:.0f}K views"
-                        else:
-                            return f"{views} views"
-                    except:
-                        return f"{view_count} views"
-                return view_count
-        return "N/A"
-    except:
-        return "N/A"
-
-def get_relevant_channels_for_creator(creator_name, api_key):
-    """Search YouTube for recent videos from a specific channel"""
-    if not api_key:
-        # Return sample channel results
-        sample_results = [
-            {"title": f"Latest Video from {channel_name}", "views": "156K views", "published": "2 days ago", "description": f"Recent content from {channel_name}...", "video_id": f"sample_{channel_name}_1"},
-            {"title": f"{channel_name}'s Hot Take on Current Events", "views": "89K views", "published": "1 day ago", "description": f"Commentary and analysis from {channel_name}...", "video_id": f"sample_{channel_name}_2"},
-            {"title": f"Breaking: {channel_name} Responds", "views": "234K views", "published": "3 hours ago", "description": f"Response video from {channel_name}...", "video_id": f"sample_{channel_name}_3"},
-        ]
-        return sample_results
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        case_search = st.text_input(
+            "Search for a case, victim, or perpetrator",
+            placeholder="e.g., 'Lizzie Borden', 'Black Dahlia', 'hotel murder 1970s'",
+            key="case_search_input"
+        )
     
-    try:
-        # First, get the channel ID
-        search_url = "https://www.googleapis.com/youtube/v3/search"
-        search_params = {
-            'part': 'snippet',
-            'q': channel_name,
-            'type': 'channel',
-            'maxResults': 1,
-            'key': api_key
-        }
-        
-        search_response = requests.get(search_url, params=search_params, timeout=15)
-        
-        if search_response.status_code == 200:
-            search_data = search_response.json()
-            if search_data.get('items'):
-                channel_id = search_data['items'][0]['id']['channelId']
-                
-                # Now get recent videos from this channel
-                videos_url = "https://www.googleapis.com/youtube/v3/search"
-                videos_params = {
-                    'part': 'snippet',
-                    'channelId': channel_id,
-                    'type': 'video',
-                    'order': 'date',
-                    'maxResults': max_results,
-                    'key': api_key,
-                    'publishedAfter': (datetime.now() - timedelta(days=30)).isoformat() + 'Z'
-                }
-                
-                videos_response = requests.get(videos_url, params=videos_params, timeout=15)
+    with col2:
+        search_filter = st.selectbox(
+            "Time Period",
+            ["All Time", "1800s", "1900-1950", "1950-1980", "1980-2000", "2000-2010", "2010-2020", "2020-Present"],
+            key="time_period_filter"
+        )
+    
+    if st.button("SEARCH", key="search_cases_btn", type="primary", use_container_width=True):
+        if not case_search:
+            st.warning("Please enter a search term")
+        else:
+            # Create a progress bar and status text (no spinner)
+            progress_bar = st.progress(0)
+            status_text = st.empty()
+            
+            # Local index hits show instantly while the network sources run
+            local_hits = search_index.search(case_search)
+            local_slot = st.empty()
+            if local_hits:
+                with local_slot.container():
+                    st.markdown(f"**Instant matches from earlier research ({len(local_hits)})**")
+                    for hit in local_hits:
+                        st.caption(f"{search_index.KIND_LABELS[hit['kind']]} · **{hit['title']}** — {hit['snippet']}")
+            
+            # Search all sources with progress updates
+            status_text.text("Searching Wikipedia...")
+            progress_bar.progress(10)
+            wikidata_results = search_wikidata(case_search, 10)
+            search_index.add_wikidata(wikidata_results, case_search)
+            
+            status_text.text("Checking YouTube...")
+            progress_bar.progress(25)
+            youtube_count = count_youtube_videos(case_search, youtube_api_key) if youtube_api_key else 0
+            
+            status_text.text("Analyzing case...")
+            progress_bar.progress(40)
+            # Use Perplexity for comprehensive case research
+            web_search_results = None
+            if perplexity_api_key:
+                # Get comprehensive case information from Perplexity
+                perplexity_data = get_perplexity_case_analysis(case_search, perplexity_api_key)
                 
-                if videos_response.status_code == 200:
-                    videos_data = videos_response.json()
-                    channel_videos = []
+                if perplexity_data:
+                    search_index.add_overview(case_search, perplexity_data.get('overview', ''))
                     
-                    for item in videos_data.get('items', []):
-                        snippet = item.get('snippet', {})
-                        video_data = {
-                          'title': snippet.get('title', 'No title'),
-                          'channel': snippet.get('channelTitle', 'Unknown Channel'),
-                          'views': get_video_views(item.get('id', ''), api_key),
-                          'published': format_youtube_date(snippet.get('publishedAt', 'Unknown')),
-                          'video_id': item.get('id', ''),
-                          'description': snippet.get('description', '')[:200] + '...' if snippet.get('description') else '',
-                          'thumbnail': snippet.get('thumbnails', {}).get('medium', {}).get('url', '')
-                        }   
-                        channel_videos.append(video_data)
-                    
-                    return channel_videos
-        
-        # Fallback to sample data if API fails
-        return search_youtube_by_channel(channel_name)
-        
-    except Exception as e:
-        return search_youtube_by_channel(channel_name)  # Return sample data on error
-
-# Now replace your entire YouTube Intelligence platform section with this:
-
-# First, add this function with your other YouTube functions (before the platform section):
-
-def get_video_views(video_id, api_key):
-    """Get view count for a specific video"""
-    if not api_key or not video_id:
-        return "N/A"
-    
-    try:
-        url = "https://www.googleapis.com/youtube/v3/videos"
-        params = {
-            'part': 'statistics',
-            'id': video_id,
-            'key': api_key
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('items'):
-                view_count = data['items'][0].get('statistics', {}).get('viewCount', 'N/A')
-                if view_count != 'N/A':
-                    # Format view count nicely (e.g., 1,234,567 -> 1.2M)
-                    try:
-                        views = int(view_count)
-                        if views >= 1000000:
-                            return f"{views/1000000:.1f}M views"
-                        elif views >= 1000:
-                            return f"{views/1000:.0f}K views"
-                        else:
-                            return f"{views} views"
-                    except:
-                        return f"{view_count} views"
-                return view_count
-        return "N/A"
-    except:
-        return "N/A"
-    """Use AI to find 5 most relevant YouTube channels for a creator"""
-    if not api_key:
-        return None
-    
-    prompt = f"""You are a YouTube content strategist. Find 5 YouTube channels that are most similar to "{creator_name}" in terms of:
-    - Content style and format
-    - Target audience
-    - Topic/niche overlap
-    - Production quality level
-    
-    Focus on channels that would have similar audiences and content approaches.
-    
-    Return ONLY a Python list of 5 channel names like this:
-    ["Channel Name 1", "Channel Name 2", "Channel Name 3", "Channel Name 4", "Channel Name 5"]
-    
-    Make sure channel names are exact and searchable on YouTube. No extra text, just the list."""
-    
-    try:
-        import openai
-        openai.api_key = api_key
-        
-        response = openai.ChatCompletion.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=200,
-            temperature=0.3,
-            timeout=30
-        )
-        
-        result = response.choices[0].message.content.strip()
-        
-        # Parse the list from the AI response
-        import ast
-        try:
-            channels = ast.literal_eval(result)
-            if isinstance(channels, list) and len(channels) <= 5:
-                return [channel.strip() for channel in channels if channel.strip()]
-        except:
-            # Fallback parsing if AI doesn't return perfect list format
-            import re
-            channels = re.findall(r'"([^"]*)"', result)
-            return channels[:5] if channels else None
-            
-    except Exception as e:
-        print(f"Error getting relevant channels: {e}")
-        return None
-
-def get_relevant_channels_for_creator(creator_name, api_key):
-    """Search YouTube for recent videos from a specific channel"""
-    if not api_key:
-        # Return sample channel results
-        sample_results = [
-            {"title": f"Latest Video from {channel_name}", "views": "156K views", "published": "2 days ago", "description": f"Recent content from {channel_name}...", "video_id": f"sample_{channel_name}_1"},
-            {"title": f"{channel_name}'s Hot Take on Current Events", "views": "89K views", "published": "1 day ago", "description": f"Commentary and analysis from {channel_name}...", "video_id": f"sample_{channel_name}_2"},
-            {"title": f"Breaking: {channel_name} Responds", "views": "234K views", "published": "3 hours ago", "description": f"Response video from {channel_name}...", "video_id": f"sample_{channel_name}_3"},
-        ]
-        return sample_results
-    
-    try:
-        # First, get the channel ID
-        search_url = "https://www.googleapis.com/youtube/v3/search"
-        search_params = {
-            'part': 'snippet',
-            'q': channel_name,
-            'type': 'channel',
-            'maxResults': 1,
-            'key': api_key
-        }
-        
-        search_response = requests.get(search_url, params=search_params, timeout=15)
-        
-        if search_response.status_code == 200:
-            search_data = search_response.json()
-            if search_data.get('items'):
-                channel_id = search_data['items'][0]['id']['channelId']
-                
-                # Now get recent videos from this channel
-                videos_url = "https://www.googleapis.com/youtube/v3/search"
-                videos_params = {
-                    'part': 'snippet',
-                    'channelId': channel_id,
-                    'type': 'video',
-                    'order': 'date',
-                    'maxResults': max_results,
-                    'key': api_key,
-                    'publishedAfter': (datetime.now() - timedelta(days=30)).isoformat() + 'Z'
-                }
-                
-                videos_response = requests.get(videos_url, params=videos_params, timeout=15)
-                
-                if videos_response.status_code == 200:
-                    videos_data = videos_response.json()
-                    channel_videos = []
-                    
-                    for item in videos_data.get('items', []):
-                        snippet = item.get('snippet', {})
-                        video_data = {
-                            'title': snippet.get('title', 'No title'),
-                            'published': snippet.get('publishedAt', 'Unknown'),
-                            'video_id': item.get('id', {}).get('videoId', ''),
-                            'description': snippet.get('description', '')[:200] + '...' if snippet.get('description') else '',
-                            'channel': snippet.get('channelTitle', channel_name),
-                            'views': 'N/A'  # Would need additional API call to get view count
-                        }
-                        channel_videos.append(video_data)
-                    
-                    return channel_videos
-        
-        # Fallback to sample data if API fails
-        return search_youtube_by_channel(channel_name)
-        
-    except Exception as e:
-        return search_youtube_by_channel(channel_name)  # Return sample data on error
-
-# First, add this function with your other YouTube functions (before the platform section):
-
-def get_video_views(video_id, api_key):
-    """Get view count for a specific video"""
-    if not api_key or not video_id or video_id.startswith('sample'):
-        return "N/A"
-    
-    try:
-        url = "https://www.googleapis.com/youtube/v3/videos"
-        params = {
-            'part': 'statistics',
-            'id': video_id,
-            'key': api_key
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('items') and len(data['items']) > 0:
-                stats = data['items'][0].get('statistics', {})
-                view_count = stats.get('viewCount')
-                if view_count:
-                    # Format view count nicely (e.g., 1,234,567 -> 1.2M)
-                    try:
-                        views = int(view_count)
-                        if views >= 1000000:
-                            return f"{views/1000000:.1f}M views"
-                        elif views >= 1000:
-                            return f"{views/1000:.0f}K views"
-                        else:
-                            return f"{views:,} views"
-                    except:
-                        return f"{view_count} views"
-        return "N/A"
-    except Exception as e:
-        print(f"Error fetching views for {video_id}: {e}")
-        return "N/A"
-    """Use AI to find 5 most relevant YouTube channels for a creator"""
-    if not api_key:
-        return None
-    
-    prompt = f"""You are a YouTube content strategist. Find 5 YouTube channels that are most similar to "{creator_name}" in terms of:
-    - Content style and format
-    - Target audience
-    - Topic/niche overlap
-    - Production quality level
-    
-    Focus on channels that would have similar audiences and content approaches.
-    
-    Return ONLY a Python list of 5 channel names like this:
-    ["Channel Name 1", "Channel Name 2", "Channel Name 3", "Channel Name 4", "Channel Name 5"]
-    
-    Make sure channel names are exact and searchable on YouTube. No extra text, just the list."""
-    
-    try:
-        import openai
-        openai.api_key = api_key
-        
-        response = openai.ChatCompletion.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=200,
-            temperature=0.3,
-            timeout=30
-        )
-        
-        result = response.choices[0].message.content.strip()
-        
-        # Parse the list from the AI response
-        import ast
-        try:
-            channels = ast.literal_eval(result)
-            if isinstance(channels, list) and len(channels) <= 5:
-                return [channel.strip() for channel in channels if channel.strip()]
-        except:
-            # Fallback parsing if AI doesn't return perfect list format
-            import re
-            channels = re.findall(r'"([^"]*)"', result)
-            return channels[:5] if channels else None
-            
-    except Exception as e:
-        print(f"Error getting relevant channels: {e}")
-        return None
-
-def format_youtube_date(date_string):
-    """Convert YouTube API date to MM/DD/YY format"""
-    if not date_string or date_string in ['Unknown', 'N/A'] or date_string.startswith('sample'):
-        return date_string
-    
-    try:
-        from datetime import datetime
-        # Handle both formats: 2025-08-08T14:00:36Z and other ISO formats
-        if 'T' in date_string:
-            # Remove timezone info and parse
-            clean_date = date_string.replace('Z', '').split('T')[0]
-            dt = datetime.strptime(clean_date, '%Y-%m-%d')
-        else:
-            dt = datetime.fromisoformat(date_string.replace('Z', '+00:00'))
-        
-        return dt.strftime('%m/%d/%y')
-    except Exception as e:
-        print(f"Error formatting date {date_string}: {e}")
-        return date_string
-    """Search YouTube for recent videos from a specific channel"""
-    if not api_key:
-        # Return sample channel results
-        sample_results = [
-            {"title": f"Latest Video from {channel_name}", "views": "156K views", "published": "2 days ago", "description": f"Recent content from {channel_name}...", "video_id": f"sample_{channel_name}_1"},
-            {"title": f"{channel_name}'s Hot Take on Current Events", "views": "89K views", "published": "1 day ago", "description": f"Commentary and analysis from {channel_name}...", "video_id": f"sample_{channel_name}_2"},
-            {"title": f"Breaking: {channel_name} Responds", "views": "234K views", "published": "3 hours ago", "description": f"Response video from {channel_name}...", "video_id": f"sample_{channel_name}_3"},
-        ]
-        return sample_results
-    
-    try:
-        # First, get the channel ID
-        search_url = "https://www.googleapis.com/youtube/v3/search"
-        search_params = {
-            'part': 'snippet',
-            'q': channel_name,
-            'type': 'channel',
-            'maxResults': 1,
-            'key': api_key
-        }
-        
-        search_response = requests.get(search_url, params=search_params, timeout=15)
-        
-        if search_response.status_code == 200:
-            search_data = search_response.json()
-            if search_data.get('items'):
-                channel_id = search_data['items'][0]['id']['channelId']
-                
-                # Now get recent videos from this channel
-                videos_url = "https://www.googleapis.com/youtube/v3/search"
-                videos_params = {
-                    'part': 'snippet',
-                    'channelId': channel_id,
-                    'type': 'video',
-                    'order': 'date',
-                    'maxResults': max_results,
-                    'key': api_key,
-                    'publishedAfter': (datetime.now() - timedelta(days=30)).isoformat() + 'Z'
-                }
-                
-                videos_response = requests.get(videos_url, params=videos_params, timeout=15)
-                
-                if videos_response.status_code == 200:
-                    videos_data = videos_response.json()
-                    channel_videos = []
-                    
-                    for item in videos_data.get('items', []):
-                        snippet = item.get('snippet', {})
-                        video_data = {
-                            'title': snippet.get('title', 'No title'),
-                            'published': snippet.get('publishedAt', 'Unknown'),
-                            'video_id': item.get('id', {}).get('videoId', ''),
-                            'description': snippet.get('description', '')[:200] + '...' if snippet.get('description') else '',
-                            'channel': snippet.get('channelTitle', channel_name),
-                            'views': 'N/A'  # Would need additional API call to get view count
-                        }
-                        channel_videos.append(video_data)
-                    
-                    return channel_videos
-        
-        # Fallback to sample data if API fails
-        return search_youtube_by_channel(channel_name)
-        
-    except Exception as e:
-        return search_youtube_by_channel(channel_name)  # Return sample data on error
-
-
-# Get the API keys
-api_key, youtube_api_key, spotify_client_id, spotify_client_secret, tmdb_key, gemini_api_key, serper_api_key, perplexity_api_key = get_api_keys()
-
-# Initialize page state
-if 'current_page' not in st.session_state:
-    st.session_state.current_page = "Case Search"
-
-# Display content based on current page
-if st.session_state.current_page == "Case Search":
-    st.markdown("### Search Cases")
-    
-    col1, col2 = st.columns([3, 1])
-    with col1:
-        case_search = st.text_input(
-            "Search for a case, victim, or perpetrator",
-            placeholder="e.g., 'Lizzie Borden', 'Black Dahlia', 'hotel murder 1970s'",
-            key="case_search_input"
-        )
-    
-    with col2:
-        search_filter = st.selectbox(
-            "Time Period",
-            ["All Time", "1800s", "1900-1950", "1950-1980", "1980-2000", "2000-2010", "2010-2020", "2020-Present"],
-            key="time_period_filter"
-        )
-    
-    if st.button("SEARCH", key="search_cases_btn", type="primary", use_container_width=True):
-        if not case_search:
-            st.warning("Please enter a search term")
-        else:
-            # Create a progress bar and status text (no spinner)
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
-            # Search all sources with progress updates
-            status_text.text("Searching Wikipedia...")
-            progress_bar.progress(10)
-            wikidata_results = search_wikidata(case_search, 10)
-            
-            status_text.text("Checking YouTube...")
-            progress_bar.progress(25)
-            youtube_count = count_youtube_videos(case_search, youtube_api_key) if youtube_api_key else 0
-            
-            status_text.text("Analyzing case...")
-            progress_bar.progress(40)
-            # Use Perplexity for comprehensive case research
-            web_search_results = None
-            if perplexity_api_key:
-                # Get comprehensive case information from Perplexity
-                perplexity_data = get_perplexity_case_analysis(case_search, perplexity_api_key)
-                
-                if perplexity_data:
-                    # Format the results for display
-                    formatted_results = []
+                    # Format the results for display
+                    formatted_results = []
                     
                     formatted_results.append("## Case Overview\n")
                     formatted_results.append(perplexity_data.get('overview', 'No overview available'))
@@ -3497,122 +3048,8 @@ if st.session_state.current_page == "Case Search":
             status_text.text("Searching Reddit discussions...")
             progress_bar.progress(75)
             # Search Reddit - ALL of Reddit for titles containing the search term
-            reddit_results = []
-            try:
-                # Use Pushshift API (Reddit archive) for better search
-                pushshift_url = "https://api.pushshift.io/reddit/search/submission/"
-                
-                # Try Pushshift first (better search)
-                params = {
-                    'q': case_search,
-                    'size': 100,
-                    'sort': 'score',
-                    'sort_type': 'desc'
-                }
-                
-                try:
-                    response = requests.get(pushshift_url, params=params, timeout=10)
-                    if response.status_code == 200:
-                        data = response.json()
-                        for item in data.get('data', []):
-                            # Convert Pushshift format to Reddit format
-                            reddit_results.append({
-                                'data': {
-                                    'title': item.get('title', ''),
-                                    'selftext': item.get('selftext', ''),
-                                    'subreddit': item.get('subreddit', ''),
-                                    'score': item.get('score', 0),
-                                    'num_comments': item.get('num_comments', 0),
-                                    'permalink': f"/r/{item.get('subreddit')}/comments/{item.get('id')}/",
-                                    'url': item.get('url', ''),
-                                    'created_utc': item.get('created_utc', 0)
-                                }
-                            })
-                except:
-                    pass  # Pushshift might be down, continue to Reddit search
-                
-                # Update progress
-                progress_bar.progress(85)
-                
-                # If Pushshift didn't work or found nothing, use Reddit search with better parameters
-                if not reddit_results:
-                    # Search variations to improve results
-                    search_variations = [
-                        case_search,  # Full name
-                        ' '.join(case_search.split()[:2]) if len(case_search.split()) > 2 else case_search,  # First two words
-                        case_search.split()[-1] if len(case_search.split()) > 1 else case_search,  # Last word only
-                    ]
-                    
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-                    }
-                    
-                    for search_term in search_variations:
-                        # Search across all Reddit
-                        search_url = "https://www.reddit.com/search.json"
-                        params = {
-                            'q': f'{search_term} (murder OR killer OR crime OR death)',  # Add context
-                            'sort': 'relevance',
-                            'limit': 100,
-                            't': 'all',
-                            'type': 'link',
-                            'raw_json': 1
-                        }
-                        
-                        time.sleep(1)
-                        response = requests.get(search_url, headers=headers, params=params, timeout=15)
-                        
-                        if response.status_code == 200:
-                            data = response.json()
-                            if 'data' in data and 'children' in data['data']:
-                                for post in data['data']['children']:
-                                    post_data = post['data']
-                                    title_lower = post_data['title'].lower()
-                                    
-                                    # Check if relevant to our search
-                                    if any(word.lower() in title_lower for word in case_search.split()):
-                                        reddit_results.append(post)
-                        
-                        if reddit_results:
-                            break  # Stop if we found results
-                    
-                    # Update progress
-                    progress_bar.progress(90)
-                    
-                    # Last resort: search specific true crime subreddits
-                    if not reddit_results:
-                        crime_subreddits = ["serialkillers", "TrueCrime", "UnresolvedMysteries"]
-                        
-                        for subreddit in crime_subreddits:
-                            url = f"https://www.reddit.com/r/{subreddit}/search.json"
-                            params = {
-                                'q': case_search.split()[-1],  # Just last name
-                                'restrict_sr': 'on',
-                                'sort': 'relevance',
-                                'limit': 50,
-                                't': 'all',
-                                'raw_json': 1
-                            }
-                            
-                            response = requests.get(url, headers=headers, params=params, timeout=10)
-                            if response.status_code == 200:
-                                data = response.json()
-                                for post in data.get('data', {}).get('children', []):
-                                    reddit_results.append(post)
-                
-                # Remove duplicates and sort by score
-                seen = set()
-                unique_results = []
-                for post in reddit_results:
-                    post_id = post['data'].get('id', post['data'].get('title', ''))
-                    if post_id not in seen:
-                        seen.add(post_id)
-                        unique_results.append(post)
-                
-                reddit_results = sorted(unique_results, key=lambda x: x['data'].get('score', 0), reverse=True)[:20]
-                
-            except Exception as e:
-                print(f"Reddit search error: {e}")
+            reddit_results = search_reddit_for_case(case_search)
+            search_index.add_reddit_posts(reddit_results, case_search)
             
             # Complete the progress
             progress_bar.progress(100)
@@ -3622,6 +3059,7 @@ if st.session_state.current_page == "Case Search":
             time.sleep(0.5)
             progress_bar.empty()
             status_text.empty()
+            local_slot.empty()
             
             # Store all results in session state
             st.session_state.search_performed = True
@@ -3724,76 +3162,20 @@ if st.session_state.current_page == "Case Search":
                     st.markdown("---")
                     st.markdown("### Top Performing Content")
                     
-                    # Search for videos
-                    yt_url = "https://www.googleapis.com/youtube/v3/search"
-                    yt_params = {
-                        "key": youtube_api_key,
-                        "part": "snippet",
-                        "q": case_search,  # This should use the search query from session state
-                        "type": "video",
-                        "order": "viewCount",  # Order by view count
-                        "maxResults": 50,  # Get more to separate shorts/videos
-                    }
+                    # Search for videos - the same cached search.list the video count used
+                    yt_search = youtube_api.search_videos(case_search, youtube_api_key)
                     
                     try:
-                        yt_response = requests.get(yt_url, params=yt_params, timeout=10)
-                        if yt_response.status_code == 200:
-                            yt_data = yt_response.json()
-                            
+                        if yt_search:
                             # Get video IDs
-                            video_ids = [item['id']['videoId'] for item in yt_data.get('items', [])]
+                            video_ids = yt_search['video_ids']
                             
                             if video_ids:
-                                # Get video details including duration and view count
-                                details_url = "https://www.googleapis.com/youtube/v3/videos"
-                                details_params = {
-                                    "key": youtube_api_key,
-                                    "part": "contentDetails,statistics,snippet",
-                                    "id": ",".join(video_ids)
-                                }
-                                
-                                details_response = requests.get(details_url, params=details_params, timeout=10)
-                                if details_response.status_code == 200:
-                                    details_data = details_response.json()
-                                    
-                                    regular_videos = []
-                                    shorts = []
-                                    
-                                    for video in details_data.get('items', []):
-                                        # Parse duration (PT1M30S format)
-                                        duration_str = video['contentDetails']['duration']
-                                        
-                                        # Convert ISO 8601 duration to seconds
-                                        import re
-                                        match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', duration_str)
-                                        if match:
-                                            hours = int(match.group(1) or 0)
-                                            minutes = int(match.group(2) or 0) 
-                                            seconds = int(match.group(3) or 0)
-                                            total_seconds = hours * 3600 + minutes * 60 + seconds
-                                        else:
-                                            total_seconds = 0
-                                        
-                                        video_info = {
-                                            'id': video['id'],
-                                            'title': video['snippet']['title'],
-                                            'channel': video['snippet']['channelTitle'],
-                                            'thumbnail': video['snippet']['thumbnails']['medium']['url'],
-                                            'views': int(video['statistics'].get('viewCount', 0)),
-                                            'duration': total_seconds,
-                                            'url': f"https://www.youtube.com/watch?v={video['id']}",
-                                            'publishedAt': video['snippet'].get('publishedAt', '')  # Add this line
-                                        }
-                                        
-                                        # Separate shorts from regular videos based on duration
-                                        if total_seconds > 0 and total_seconds <= 180:
-                                            shorts.append(video_info)
-                                        else:
-                                            regular_videos.append(video_info)
-                                    
-                                    # Sort by views
-                                    regular_videos.sort(key=lambda x: x['views'], reverse=True)
-                                    shorts.sort(key=lambda x: x['views'], reverse=True)
+                                # Normalize the batch once - durations are parsed and shorts classified in one pass
+                                videos = youtube_api.normalize_videos(youtube_api.get_videos(video_ids, youtube_api_key).values())
+                                if len(videos):
+                                    regular_videos = youtube_api.top_videos(videos, shorts=False)
+                                    shorts = youtube_api.top_videos(videos, shorts=True)
                                     
                                     # Display top 5 of each
                                     col1, col2 = st.columns(2)
@@ -3890,14 +3272,13 @@ if st.session_state.current_page == "Case Search":
                                         else:
                                             st.info("No shorts found")
                                 else:
-                                    st.error(f"Could not fetch video details. Status: {details_response.status_code}")
+                                    st.error("Could not fetch video details.")
                             else:
                                 st.info("No videos found for this search")
+                        elif youtube_api.budget_low():
+                            st.warning("YouTube quota is running low - only previously cached searches are shown until it resets at midnight Pacific Time.")
                         else:
-                            if yt_response.status_code == 403:
-                                st.error("YouTube API quota exceeded. Please try again later or add more API keys.")
-                            else:
-                                st.error(f"YouTube search failed. Status: {yt_response.status_code}")
+                            st.error("YouTube search failed. The API quota may be exceeded - please try again later.")
                                 
                     except Exception as e:
                         st.error(f"Error fetching YouTube videos: {str(e)}")
@@ -3945,16 +3326,17 @@ if st.session_state.current_page == "Case Search":
                     with col2:
                         st.markdown("#### Sample Shorts")
                         st.info("Add YouTube API key to see real shorts")
+            elif youtube_api.budget_low():
+                st.warning("YouTube quota is running low, so the video count was skipped for this search.")
             else:
                 st.info("No YouTube videos found for this search term")
 
         with source_tabs[2]:  # Reddit (index 2)
             if reddit_results:
                 for post in reddit_results[:10]:
-                    post_data = post['data']
-                    st.write(f"**{post_data['title']}**")
-                    st.caption(f"r/{post_data.get('source_subreddit', 'unknown')} - {post_data['score']} upvotes")
-                    st.write(f"[View](https://reddit.com{post_data['permalink']})")
+                    st.write(f"**{post.title}**")
+                    st.caption(f"r/{post.get('source_subreddit', 'unknown')} - {post.score} upvotes")
+                    st.write(f"[View](https://reddit.com{post.permalink})")
                     st.write("---")
             else:
                 st.info("No Reddit discussions found")
@@ -4002,7 +3384,7 @@ if st.session_state.current_page == "Case Search":
                         }
                         
                         try:
-                            wiki_response = requests.get(wiki_url, params=wiki_params, timeout=10)
+                            wiki_response = http_client.get(wiki_url, params=wiki_params, timeout=10)
                             if wiki_response.status_code == 200:
                                 wiki_data = wiki_response.json()
                                 pages = wiki_data.get("query", {}).get("pages", {})
@@ -4035,7 +3417,7 @@ if st.session_state.current_page == "Case Search":
                     
                     reddit_context = ""
                     if reddit_results:
-                        top_posts = [f"- {post['data']['title']} (r/{post['data'].get('subreddit', 'unknown')}, {post['data']['score']} upvotes)" 
+                        top_posts = [f"- {post.title} (r/{post.get('subreddit', 'unknown')}, {post.score} upvotes)" 
                                     for post in reddit_results[:5]]
                         reddit_context = "Top Reddit discussions:\n" + "\n".join(top_posts) + "\n"
                     
@@ -4202,7 +3584,7 @@ elif st.session_state.current_page == "Trending Cases":
                     }
                     
                     headers = {'User-Agent': 'Mozilla/5.0'}
-                    response = requests.get(url, headers=headers, params=params, timeout=10)
+                    response = http_client.get(url, headers=headers, params=params, timeout=10)
                     
                     if response.status_code == 200:
                         data = response.json()
@@ -4220,7 +3602,7 @@ elif st.session_state.current_page == "Trending Cases":
                                 title = post_data['title']
                                 
                                 # Calculate trending score (combination of upvotes and comments)
-                                trending_score = post_data['score'] + (post_data['num_comments'] * 10)
+                                trending_score = ranking.trend_score(post_data['score'], post_data['num_comments'])
                                 
                                 all_trending.append({
                                     'title': title,
@@ -4235,7 +3617,6 @@ elif st.session_state.current_page == "Trending Cases":
                                 })
 
                     
-                    time.sleep(0.3)  # Rate limiting
                 except:
                     continue
             
@@ -4257,7 +3638,7 @@ elif st.session_state.current_page == "Trending Cases":
                         'raw_json': 1
                     }
                     
-                    response = requests.get(search_url, headers=headers, params=params, timeout=10)
+                    response = http_client.get(search_url, headers=headers, params=params, timeout=10)
                     
                     if response.status_code == 200:
                         data = response.json()
@@ -4273,7 +3654,7 @@ elif st.session_state.current_page == "Trending Cases":
                                     for crime_word in ['crime', 'mystery', 'murder', 'missing']):
                                 
                                 if post_data['score'] >= min_score:
-                                    trending_score = post_data['score'] + (post_data['num_comments'] * 10)
+                                    trending_score = ranking.trend_score(post_data['score'], post_data['num_comments'])
                                     
                                     all_trending.append({
                                         'title': post_data['title'],
@@ -4287,32 +3668,25 @@ elif st.session_state.current_page == "Trending Cases":
                                         'awards': post_data.get('total_awards_received', 0)
                                     })
                     
-                    time.sleep(0.5)
                 except:
                     continue
             
-            # Remove duplicates based on title similarity
-            seen_titles = set()
-            unique_trending = []
-            for item in all_trending:
-                # Simple deduplication - you could make this more sophisticated
-                title_key = item['title'][:50].lower()
-                if title_key not in seen_titles:
-                    seen_titles.add(title_key)
-                    unique_trending.append(item)
-            
-            # Sort by trending score
-            unique_trending.sort(key=lambda x: x['trending_score'], reverse=True)
+            # Merge cross-posts of the same story, then keep the top results by trending score
+            unique_trending = trending.merge_near_duplicates(all_trending)
+            top_trending = ranking.top_k(unique_trending, num_results, key=lambda x: x['trending_score'])
             
             if unique_trending:
                 st.success(f"Found {len(unique_trending)} trending cases across {len(subreddits)} subreddits")
                 
                 # Display trending cases
-                for i, case in enumerate(unique_trending[:num_results], 1):
+                for i, case in enumerate(top_trending, 1):
                     with st.container():
                         # Just show the title without any research button
                         st.markdown(f"**#{i}. {case['title']}**")
-                        st.caption(f"r/{case['subreddit']} • by u/{case['author']}")
+                        subreddits_line = " • ".join(f"r/{sub}" for sub in case['subreddits'])
+                        if case['post_count'] > 1:
+                            subreddits_line += f" • {case['post_count']} posts"
+                        st.caption(f"{subreddits_line} • by u/{case['author']}")
                         
                         # Metrics
                         col1, col2, col3, col4, col5 = st.columns(5)
@@ -4345,17 +3719,17 @@ elif st.session_state.current_page == "Trending Cases":
                 col1, col2, col3 = st.columns(3)
                 
                 with col1:
-                    avg_upvotes = sum(c['upvotes'] for c in unique_trending[:num_results]) / len(unique_trending[:num_results])
+                    avg_upvotes = sum(c['upvotes'] for c in top_trending) / len(top_trending)
                     st.metric("Avg. Upvotes", f"{avg_upvotes:,.0f}")
                 
                 with col2:
-                    total_comments = sum(c['comments'] for c in unique_trending[:num_results])
+                    total_comments = sum(c['comments'] for c in top_trending)
                     st.metric("Total Comments", f"{total_comments:,}")
                 
                 with col3:
                     # Most active subreddit
                     sub_counts = {}
-                    for c in unique_trending[:num_results]:
+                    for c in top_trending:
                         sub_counts[c['subreddit']] = sub_counts.get(c['subreddit'], 0) + 1
                     most_active = max(sub_counts.items(), key=lambda x: x[1])
                     st.metric("Most Active Sub", f"r/{most_active[0]}")
@@ -4368,13 +3742,14 @@ elif st.session_state.current_page == "True Crime Podcasts":
     
     # Authenticate with Spotify only when on this page
     if spotify_client_id and spotify_client_secret and spotify_client_id != "YOUR_SPOTIFY_CLIENT_ID_HERE":
-        if 'spotify_token' not in st.session_state:
-            with st.spinner("Authenticating with Spotify..."):
-                token = get_spotify_token(spotify_client_id, spotify_client_secret)
-                if token:
-                    st.session_state.spotify_token = token
-                else:
-                    st.warning("Could not authenticate with Spotify. Topic search will be unavailable.")
+        # The token manager reuses one token across sessions and refreshes it before expiry
+        with st.spinner("Authenticating with Spotify..."):
+            token = get_spotify_token(spotify_client_id, spotify_client_secret)
+        if token:
+            st.session_state.spotify_token = token
+        else:
+            st.session_state.pop('spotify_token', None)
+            st.warning("Could not authenticate with Spotify. Topic search will be unavailable.")
     
     # Radio buttons for view selection
     podcast_view = st.radio(
@@ -4430,42 +3805,40 @@ elif st.session_state.current_page == "True Crime Podcasts":
                     all_episodes = []
                     
                     progress_bar = st.progress(0)
+                    summary_slot = st.empty()
+                    results_slot = st.empty()
                     
-                    for idx, podcast in enumerate(podcasts):
-                        progress_bar.progress((idx + 1) / len(podcasts))
+                    # Feeds are fetched in parallel; re-render the ranked list as each one lands
+                    for done, (podcast, episodes) in enumerate(podcast_feeds.fetch_latest_episodes(podcasts, limit=2), 1):  # Get 2 latest episodes
+                        progress_bar.progress(done / len(podcasts))
                         
-                        if podcast.get('url'):
-                            podcast_id = podcast['url'].split('/id')[-1].split('?')[0]
-                            episodes = get_itunes_podcast_episodes(podcast_id, limit=2)  # Get 2 latest episodes
-                            
-                            for ep in episodes:
-                                ep['podcast_name'] = podcast['name']
-                                ep['podcast_artist'] = podcast['artist']
-                                ep['podcast_rank'] = podcast['rank']
-                                all_episodes.append(ep)
+                        for ep in episodes:
+                            ep.podcast_name = podcast['name']
+                            ep.podcast_artist = podcast['artist']
+                            ep.podcast_rank = podcast['rank']
+                            all_episodes.append(ep)
+                        
+                        # Sort by podcast rank (maintains chart order)
+                        all_episodes.sort(key=lambda x: x.get('podcast_rank', 999))
                         
-                        time.sleep(0.1)  # Rate limiting
+                        with results_slot.container():
+                            for i, ep in enumerate(all_episodes[:30], 1):
+                                with st.expander(f"{i:02d} | {ep.title[:60]}... - {ep.podcast_name}", expanded=(i <= 3)):
+                                    st.markdown(f"**Show:** {ep.podcast_name}")
+                                    st.markdown(f"**Host:** {ep.podcast_artist}")
+                                    st.markdown(f"**Published:** {ep.get('published', 'Unknown')}")
+                                    st.markdown(f"**Duration:** {ep.get('duration', 'Unknown')}")
+                                    st.markdown(f"**Description:** {ep.get('description', 'No description')}")
+                                    if ep.get('link'):
+                                        st.markdown(f"[Listen to Episode]({ep.link})")
+                                    st.divider()
                     
                     progress_bar.empty()
                     
-                    # Sort by podcast rank (maintains chart order)
-                    all_episodes.sort(key=lambda x: x.get('podcast_rank', 999))
-                    
                     if all_episodes:
-                        st.success(f"Found {len(all_episodes)} recent episodes")
-                        
-                        for i, ep in enumerate(all_episodes[:30], 1):
-                            with st.expander(f"{i:02d} | {ep['title'][:60]}... - {ep['podcast_name']}", expanded=(i <= 3)):
-                                st.markdown(f"**Show:** {ep['podcast_name']}")
-                                st.markdown(f"**Host:** {ep['podcast_artist']}")
-                                st.markdown(f"**Published:** {ep.get('published', 'Unknown')}")
-                                st.markdown(f"**Duration:** {ep.get('duration', 'Unknown')}")
-                                st.markdown(f"**Description:** {ep.get('description', 'No description')}")
-                                if ep.get('link'):
-                                    st.markdown(f"[Listen to Episode]({ep['link']})")
-                                st.divider()
+                        summary_slot.success(f"Found {len(all_episodes)} recent episodes")
                     else:
-                        st.info("No recent episodes found")
+                        summary_slot.info("No recent episodes found")
                 else:
                     st.warning("Could not fetch podcast data")
     
@@ -4587,86 +3960,23 @@ elif st.session_state.current_page == "YouTube Competitors":
                         published_after = (datetime.now() - timedelta(days=365)).isoformat() + 'Z'
                     
                     all_videos = []
-                    progress_bar = st.progress(0)
                     
-                    for idx, channel_name in enumerate(selected_competitors):
-                        progress_bar.progress((idx + 1) / len(selected_competitors))
-                        channel_id = COMPETITORS[channel_name]
-                        
+                    # Uploads playlists are synced incrementally, so repeat browses cost a few units instead of a search per channel
+                    channels = {name: COMPETITORS[name] for name in selected_competitors}
+                    for channel_name, video in youtube_api.get_competitor_videos(channels, youtube_api_key, published_after, videos_per_channel):
                         try:
-                            # Search for videos from this channel
-                            search_url = "https://www.googleapis.com/youtube/v3/search"
-                            params = {
-                                "key": youtube_api_key,
-                                "channelId": channel_id,
-                                "part": "snippet",
-                                "order": "viewCount",  # Order by views from the start
-                                "type": "video",
-                                "maxResults": videos_per_channel,
-                                "publishedAfter": published_after
-                            }
-                            
-                            response = requests.get(search_url, params=params, timeout=10)
-                            
-                            if response.status_code == 200:
-                                data = response.json()
-                                
-                                # Get video IDs for detailed stats
-                                video_ids = [item['id']['videoId'] for item in data.get('items', [])]
-                                
-                                if video_ids:
-                                    # Get detailed video information
-                                    details_url = "https://www.googleapis.com/youtube/v3/videos"
-                                    details_params = {
-                                        "key": youtube_api_key,
-                                        "id": ",".join(video_ids),
-                                        "part": "snippet,statistics,contentDetails"
-                                    }
-                                    
-                                    details_response = requests.get(details_url, params=details_params, timeout=10)
-                                    
-                                    if details_response.status_code == 200:
-                                        details_data = details_response.json()
-                                        
-                                        for video in details_data.get('items', []):
-                                            # Parse duration
-                                            duration_str = video['contentDetails']['duration']
-                                            import re
-                                            match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', duration_str)
-                                            if match:
-                                                hours = int(match.group(1) or 0)
-                                                minutes = int(match.group(2) or 0)
-                                                seconds = int(match.group(3) or 0)
-                                                total_seconds = hours * 3600 + minutes * 60 + seconds
-                                            else:
-                                                total_seconds = 0
-                                            
-                                            video_info = {
-                                                'channel_name': channel_name,
-                                                'title': video['snippet']['title'],
-                                                'video_id': video['id'],
-                                                'published': video['snippet']['publishedAt'],
-                                                'views': int(video['statistics'].get('viewCount', 0)),
-                                                'likes': int(video['statistics'].get('likeCount', 0)),
-                                                'comments': int(video['statistics'].get('commentCount', 0)),
-                                                'duration_seconds': total_seconds,
-                                                'thumbnail': video['snippet']['thumbnails']['medium']['url'],
-                                                'description': video['snippet'].get('description', '')
-                                            }
-                                            
-                                            all_videos.append(video_info)
+                            total_seconds = youtube_api.parse_duration(video['contentDetails']['duration'])
                             
-                            time.sleep(0.2)  # Rate limiting
+                            video_info = records.VideoInfo.from_youtube(video, channel_name, total_seconds)
                             
+                            all_videos.append(video_info)
                         except Exception as e:
-                            st.warning(f"Error fetching {channel_name}: {str(e)}")
+                            st.warning(f"Error reading a video from {channel_name}: {str(e)}")
                             continue
                     
-                    progress_bar.empty()
-                    
                     if all_videos:
                         # Always sort by views (already ordered by API, but sort combined results)
-                        all_videos.sort(key=lambda x: x['views'], reverse=True)
+                        all_videos.sort(key=lambda x: x.views, reverse=True)
                         
                         st.success(f"Found {len(all_videos)} videos from {len(selected_competitors)} channels (sorted by views)")
                         st.session_state.competitor_videos = all_videos
@@ -4674,36 +3984,36 @@ elif st.session_state.current_page == "YouTube Competitors":
                         # Display results
                         for i, video in enumerate(all_videos, 1):
                             # Determine if it's a short
-                            is_short = video['duration_seconds'] <= 180
+                            is_short = youtube_api.is_short(video.duration_seconds)
                             video_type = "SHORT" if is_short else "VIDEO"
                             
                             # Format views for display
-                            if video['views'] >= 1000000:
-                                views_display = f"{video['views']/1000000:.1f}M views"
-                            elif video['views'] >= 1000:
-                                views_display = f"{video['views']/1000:.0f}K views"
+                            if video.views >= 1000000:
+                                views_display = f"{video.views/1000000:.1f}M views"
+                            elif video.views >= 1000:
+                                views_display = f"{video.views/1000:.0f}K views"
                             else:
-                                views_display = f"{video['views']} views"
+                                views_display = f"{video.views} views"
                             
-                            with st.expander(f"{i:02d} | {views_display} - {video['title'][:50]}... ({video['channel_name']}) [{video_type}]", expanded=(i <= 3)):
+                            with st.expander(f"{i:02d} | {views_display} - {video.title[:50]}... ({video.channel_name}) [{video_type}]", expanded=(i <= 3)):
                                 col1, col2 = st.columns([1, 2])
                                 
                                 with col1:
-                                    st.image(video['thumbnail'], use_column_width=True)
+                                    st.image(video.thumbnail, use_column_width=True)
                                     
                                     # Format publish date
                                     try:
                                         from datetime import datetime
-                                        pub_date = datetime.strptime(video['published'][:10], '%Y-%m-%d')
+                                        pub_date = datetime.strptime(video.published[:10], '%Y-%m-%d')
                                         formatted_date = pub_date.strftime('%m/%d/%y')
                                     except:
-                                        formatted_date = video['published'][:10]
+                                        formatted_date = video.published[:10]
                                     
                                     st.caption(f"Published: {formatted_date}")
                                 
                                 with col2:
-                                    st.markdown(f"**Channel:** {video['channel_name']}")
-                                    st.markdown(f"**Title:** {video['title']}")
+                                    st.markdown(f"**Channel:** {video.channel_name}")
+                                    st.markdown(f"**Title:** {video.title}")
                                     
                                     # Metrics
                                     col_a, col_b, col_c = st.columns(3)
@@ -4711,31 +4021,31 @@ elif st.session_state.current_page == "YouTube Competitors":
                                         st.metric("Views", views_display)
                                     
                                     with col_b:
-                                        if video['likes'] >= 1000:
-                                            likes_str = f"{video['likes']/1000:.0f}K"
+                                        if video.likes >= 1000:
+                                            likes_str = f"{video.likes/1000:.0f}K"
                                         else:
-                                            likes_str = str(video['likes'])
+                                            likes_str = str(video.likes)
                                         st.metric("Likes", likes_str)
                                     
                                     with col_c:
-                                        engagement = (video['likes'] / video['views'] * 100) if video['views'] > 0 else 0
+                                        engagement = (video.likes / video.views * 100) if video.views > 0 else 0
                                         st.metric("Engagement", f"{engagement:.1f}%")
                                     
                                     # Duration
                                     if is_short:
-                                        st.caption(f"Duration: {video['duration_seconds']} seconds (Short)")
+                                        st.caption(f"Duration: {video.duration_seconds} seconds (Short)")
                                     else:
-                                        minutes = video['duration_seconds'] // 60
-                                        seconds = video['duration_seconds'] % 60
+                                        minutes = video.duration_seconds // 60
+                                        seconds = video.duration_seconds % 60
                                         st.caption(f"Duration: {minutes}:{seconds:02d}")
                                     
                                     # Description preview
-                                    if video['description']:
+                                    if video.description:
                                         st.markdown("**Description:**")
-                                        st.text(video['description'][:500] + "..." if len(video['description']) > 500 else video['description'])
+                                        st.text(video.description[:500] + "..." if len(video.description) > 500 else video.description)
 
                                     # Link to video
-                                    st.markdown(f"[Watch on YouTube](https://youtube.com/watch?v={video['video_id']})")
+                                    st.markdown(f"[Watch on YouTube](https://youtube.com/watch?v={video.video_id})")
                                 
                                 st.divider()
                     else:
@@ -4789,7 +4099,7 @@ elif st.session_state.current_page == "YouTube Competitors":
                                 "order": "viewCount"  # Order by views
                             }
                             
-                            response = requests.get(search_url, params=params, timeout=10)
+                            response = youtube_api.get(search_url, params=params, timeout=10)
                             
                             if response.status_code == 200:
                                 data = response.json()
@@ -4806,7 +4116,7 @@ elif st.session_state.current_page == "YouTube Competitors":
                                         "part": "snippet,statistics,contentDetails"
                                     }
                                     
-                                    details_response = requests.get(details_url, params=details_params, timeout=10)
+                                    details_response = youtube_api.get(details_url, params=details_params, timeout=10)
                                     
                                     if details_response.status_code == 200:
                                         details_data = details_response.json()
@@ -4818,35 +4128,12 @@ elif st.session_state.current_page == "YouTube Competitors":
                                             search_lower = search_query.lower()
                                             
                                             if search_lower in title or search_lower in description:
-                                                # Parse duration
-                                                duration_str = video['contentDetails']['duration']
-                                                import re
-                                                match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', duration_str)
-                                                if match:
-                                                    hours = int(match.group(1) or 0)
-                                                    minutes = int(match.group(2) or 0)
-                                                    seconds = int(match.group(3) or 0)
-                                                    total_seconds = hours * 3600 + minutes * 60 + seconds
-                                                else:
-                                                    total_seconds = 0
+                                                total_seconds = youtube_api.parse_duration(video['contentDetails']['duration'])
                                                 
-                                                video_info = {
-                                                    'channel_name': channel_name,
-                                                    'title': video['snippet']['title'],
-                                                    'video_id': video['id'],
-                                                    'published': video['snippet']['publishedAt'],
-                                                    'views': int(video['statistics'].get('viewCount', 0)),
-                                                    'likes': int(video['statistics'].get('likeCount', 0)),
-                                                    'comments': int(video['statistics'].get('commentCount', 0)),
-                                                    'duration_seconds': total_seconds,
-                                                    'thumbnail': video['snippet']['thumbnails']['medium']['url'],
-                                                    'description': video['snippet'].get('description', ''),
-                                                    'relevance': 'title' if search_lower in title else 'description'
-                                                }
+                                                video_info = records.VideoInfo.from_youtube(video, channel_name, total_seconds, relevance='title' if search_lower in title else 'description')
                                                 
                                                 search_results.append(video_info)
                             
-                            time.sleep(0.2)  # Rate limiting
                             
                         except Exception as e:
                             continue
@@ -4855,45 +4142,45 @@ elif st.session_state.current_page == "YouTube Competitors":
                     
                     if search_results:
                         # Sort by views
-                        search_results.sort(key=lambda x: x['views'], reverse=True)
+                        search_results.sort(key=lambda x: x.views, reverse=True)
                         
                         st.success(f"Found {len(search_results)} videos about '{search_query}'")
                         
                         # Display search results
                         for i, video in enumerate(search_results, 1):
                             # Format views for display
-                            if video['views'] >= 1000000:
-                                views_display = f"{video['views']/1000000:.1f}M views"
-                            elif video['views'] >= 1000:
-                                views_display = f"{video['views']/1000:.0f}K views"
+                            if video.views >= 1000000:
+                                views_display = f"{video.views/1000000:.1f}M views"
+                            elif video.views >= 1000:
+                                views_display = f"{video.views/1000:.0f}K views"
                             else:
-                                views_display = f"{video['views']} views"
+                                views_display = f"{video.views} views"
                             
                             # Indicate where match was found
-                            match_indicator = "TITLE MATCH" if video['relevance'] == 'title' else "DESCRIPTION MATCH"
+                            match_indicator = "TITLE MATCH" if video.relevance == 'title' else "DESCRIPTION MATCH"
                             
-                            with st.expander(f"{i:02d} | {views_display} - {video['title'][:50]}... ({video['channel_name']}) [{match_indicator}]", expanded=(i <= 3)):
+                            with st.expander(f"{i:02d} | {views_display} - {video.title[:50]}... ({video.channel_name}) [{match_indicator}]", expanded=(i <= 3)):
                                 col1, col2 = st.columns([1, 2])
                                 
                                 with col1:
-                                    st.image(video['thumbnail'], use_column_width=True)
+                                    st.image(video.thumbnail, use_column_width=True)
                                     
                                     # Format publish date
                                     try:
                                         from datetime import datetime
-                                        pub_date = datetime.strptime(video['published'][:10], '%Y-%m-%d')
+                                        pub_date = datetime.strptime(video.published[:10], '%Y-%m-%d')
                                         formatted_date = pub_date.strftime('%m/%d/%y')
                                     except:
-                                        formatted_date = video['published'][:10]
+                                        formatted_date = video.published[:10]
                                     
                                     st.caption(f"Published: {formatted_date}")
                                 
                                 with col2:
-                                    st.markdown(f"**Channel:** {video['channel_name']}")
-                                    st.markdown(f"**Title:** {video['title']}")
+                                    st.markdown(f"**Channel:** {video.channel_name}")
+                                    st.markdown(f"**Title:** {video.title}")
                                     
                                     # Highlight where search term was found
-                                    if video['relevance'] == 'title':
+                                    if video.relevance == 'title':
                                         st.success(f"Search term found in TITLE")
                                     else:
                                         st.info(f"Search term found in DESCRIPTION")
@@ -4904,33 +4191,33 @@ elif st.session_state.current_page == "YouTube Competitors":
                                         st.metric("Views", views_display)
                                     
                                     with col_b:
-                                        if video['likes'] >= 1000:
-                                            likes_str = f"{video['likes']/1000:.0f}K"
+                                        if video.likes >= 1000:
+                                            likes_str = f"{video.likes/1000:.0f}K"
                                         else:
-                                            likes_str = str(video['likes'])
+                                            likes_str = str(video.likes)
                                         st.metric("Likes", likes_str)
                                     
                                     with col_c:
-                                        engagement = (video['likes'] / video['views'] * 100) if video['views'] > 0 else 0
+                                        engagement = (video.likes / video.views * 100) if video.views > 0 else 0
                                         st.metric("Engagement", f"{engagement:.1f}%")
                                     
                                     # Show relevant part of description
-                                    if video['description']:
+                                    if video.description:
                                         st.markdown("**Description:**")
                                         # Highlight search term in description
-                                        desc_lower = video['description'].lower()
+                                        desc_lower = video.description.lower()
                                         search_lower = search_query.lower()
                                         if search_lower in desc_lower:
                                             # Find position of search term
                                             pos = desc_lower.find(search_lower)
                                             start = max(0, pos - 100)
-                                            end = min(len(video['description']), pos + 200)
-                                            excerpt = video['description'][start:end]
+                                            end = min(len(video.description), pos + 200)
+                                            excerpt = video.description[start:end]
                                             st.text(f"...{excerpt}...")
                                         else:
-                                            st.text(video['description'][:500] + "..." if len(video['description']) > 500 else video['description'])
+                                            st.text(video.description[:500] + "..." if len(video.description) > 500 else video.description)
                                     
-                                    st.markdown(f"[Watch on YouTube](https://youtube.com/watch?v={video['video_id']})")
+                                    st.markdown(f"[Watch on YouTube](https://youtube.com/watch?v={video.video_id})")
                                 
                                 st.divider()
                     else:
@@ -5026,21 +4313,21 @@ elif st.session_state.current_page == "Movies & TV Shows":
                                     year=year, sort_by=sort_by)
                 
                 if results and results.get('results'):
-                    st.session_state.crime_trending_results = results['results']
+                    st.session_state.crime_trending_results = [records.TmdbTitle.from_tmdb(item) for item in results['results']]
                     st.success(f"Found {len(results['results'])} trending {media_type}s")
         
         # Display results
         if 'crime_trending_results' in st.session_state:
             for i, item in enumerate(st.session_state.crime_trending_results[:20], 1):
-                title = item.get('title') or item.get('name', 'Unknown')
-                release_date = item.get('release_date') or item.get('first_air_date', 'Unknown')
+                title = item.title
+                release_date = item.release_date
                 
                 with st.expander(f"{i:02d} | {title} ({release_date[:4] if release_date != 'Unknown' else 'N/A'})", expanded=False):
                     col1, col2 = st.columns([1, 3])
                     
                     with col1:
                         if item.get('poster_path'):
-                            poster_url = f"https://image.tmdb.org/t/p/w200{item['poster_path']}"
+                            poster_url = f"https://image.tmdb.org/t/p/w200{item.poster_path}"
                             st.image(poster_url, width=150)
                     
                     with col2:
@@ -5113,10 +4400,20 @@ elif st.session_state.current_page == "Movies & TV Shows":
             progress_bar = st.progress(0)
             status_text = st.empty()
             
+            # Local index hits show instantly while the network sources run
+            local_hits = search_index.search(case_search)
+            local_slot = st.empty()
+            if local_hits:
+                with local_slot.container():
+                    st.markdown(f"**Instant matches from earlier research ({len(local_hits)})**")
+                    for hit in local_hits:
+                        st.caption(f"{search_index.KIND_LABELS[hit['kind']]} · **{hit['title']}** — {hit['snippet']}")
+            
             # Search all sources with progress updates
             status_text.text("Searching Wikipedia...")
             progress_bar.progress(10)
             wikidata_results = search_wikidata(case_search, 10)
+            search_index.add_wikidata(wikidata_results, case_search)
             
             status_text.text("Checking YouTube...")
             progress_bar.progress(25)
@@ -5131,6 +4428,8 @@ elif st.session_state.current_page == "Movies & TV Shows":
                 perplexity_data = get_perplexity_case_analysis(case_search, perplexity_api_key)
                 
                 if perplexity_data:
+                    search_index.add_overview(case_search, perplexity_data.get('overview', ''))
+                    
                     # Format the results for display
                     formatted_results = []
                     
@@ -5164,122 +4463,8 @@ elif st.session_state.current_page == "Movies & TV Shows":
             status_text.text("Searching Reddit discussions...")
             progress_bar.progress(75)
             # Search Reddit - ALL of Reddit for titles containing the search term
-            reddit_results = []
-            try:
-                # Use Pushshift API (Reddit archive) for better search
-                pushshift_url = "https://api.pushshift.io/reddit/search/submission/"
-                
-                # Try Pushshift first (better search)
-                params = {
-                    'q': case_search,
-                    'size': 100,
-                    'sort': 'score',
-                    'sort_type': 'desc'
-                }
-                
-                try:
-                    response = requests.get(pushshift_url, params=params, timeout=10)
-                    if response.status_code == 200:
-                        data = response.json()
-                        for item in data.get('data', []):
-                            # Convert Pushshift format to Reddit format
-                            reddit_results.append({
-                                'data': {
-                                    'title': item.get('title', ''),
-                                    'selftext': item.get('selftext', ''),
-                                    'subreddit': item.get('subreddit', ''),
-                                    'score': item.get('score', 0),
-                                    'num_comments': item.get('num_comments', 0),
-                                    'permalink': f"/r/{item.get('subreddit')}/comments/{item.get('id')}/",
-                                    'url': item.get('url', ''),
-                                    'created_utc': item.get('created_utc', 0)
-                                }
-                            })
-                except:
-                    pass  # Pushshift might be down, continue to Reddit search
-                
-                # Update progress
-                progress_bar.progress(85)
-                
-                # If Pushshift didn't work or found nothing, use Reddit search with better parameters
-                if not reddit_results:
-                    # Search variations to improve results
-                    search_variations = [
-                        case_search,  # Full name
-                        ' '.join(case_search.split()[:2]) if len(case_search.split()) > 2 else case_search,  # First two words
-                        case_search.split()[-1] if len(case_search.split()) > 1 else case_search,  # Last word only
-                    ]
-                    
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-                    }
-                    
-                    for search_term in search_variations:
-                        # Search across all Reddit
-                        search_url = "https://www.reddit.com/search.json"
-                        params = {
-                            'q': f'{search_term} (murder OR killer OR crime OR death)',  # Add context
-                            'sort': 'relevance',
-                            'limit': 100,
-                            't': 'all',
-                            'type': 'link',
-                            'raw_json': 1
-                        }
-                        
-                        time.sleep(1)
-                        response = requests.get(search_url, headers=headers, params=params, timeout=15)
-                        
-                        if response.status_code == 200:
-                            data = response.json()
-                            if 'data' in data and 'children' in data['data']:
-                                for post in data['data']['children']:
-                                    post_data = post['data']
-                                    title_lower = post_data['title'].lower()
-                                    
-                                    # Check if relevant to our search
-                                    if any(word.lower() in title_lower for word in case_search.split()):
-                                        reddit_results.append(post)
-                        
-                        if reddit_results:
-                            break  # Stop if we found results
-                    
-                    # Update progress
-                    progress_bar.progress(90)
-                    
-                    # Last resort: search specific true crime subreddits
-                    if not reddit_results:
-                        crime_subreddits = ["serialkillers", "TrueCrime", "UnresolvedMysteries"]
-                        
-                        for subreddit in crime_subreddits:
-                            url = f"https://www.reddit.com/r/{subreddit}/search.json"
-                            params = {
-                                'q': case_search.split()[-1],  # Just last name
-                                'restrict_sr': 'on',
-                                'sort': 'relevance',
-                                'limit': 50,
-                                't': 'all',
-                                'raw_json': 1
-                            }
-                            
-                            response = requests.get(url, headers=headers, params=params, timeout=10)
-                            if response.status_code == 200:
-                                data = response.json()
-                                for post in data.get('data', {}).get('children', []):
-                                    reddit_results.append(post)
-                
-                # Remove duplicates and sort by score
-                seen = set()
-                unique_results = []
-                for post in reddit_results:
-                    post_id = post['data'].get('id', post['data'].get('title', ''))
-                    if post_id not in seen:
-                        seen.add(post_id)
-                        unique_results.append(post)
-                
-                reddit_results = sorted(unique_results, key=lambda x: x['data'].get('score', 0), reverse=True)[:20]
-                
-            except Exception as e:
-                print(f"Reddit search error: {e}")
+            reddit_results = search_reddit_for_case(case_search)
+            search_index.add_reddit_posts(reddit_results, case_search)
             
             # Complete the progress
             progress_bar.progress(100)
@@ -5289,6 +4474,7 @@ elif st.session_state.current_page == "Movies & TV Shows":
             time.sleep(0.5)
             progress_bar.empty()
             status_text.empty()
+            local_slot.empty()
             
             # Store all results in session state
             st.session_state.search_performed = True
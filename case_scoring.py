@@ -0,0 +1,69 @@
+"""Batch case scoring: calculate_real_case_score vectorized over a DataFrame of candidates"""
+import numpy as np
+import pandas as pd
+
+BASE_SCORE = 50
+
+# Points for each truthy case characteristic
+FLAG_POINTS = {
+    'is_unsolved': 15,
+    'has_mystery': 10,
+    'good_era': 10,          # 1920s-1990s
+    'involves_minors': -40,  # Sensitivity penalties
+    'too_recent': -25,
+}
+
+
+def _signal(frame, column):
+    """Numeric values the scalar scorer would act on; missing, NaN and 0 become NaN.
+
+    calculate_real_case_score skips a signal when case_data.get(column) is
+    falsy, and every comparison against NaN is False, so NaN rows fall
+    through each np.select to its default of 0 points.
+    """
+    if column not in frame:
+        return pd.Series(np.nan, index=frame.index)
+    values = pd.to_numeric(frame[column], errors='coerce')
+    return values.where(values != 0)
+
+
+def _flag(frame, column):
+    """Truthiness of a flag column, with missing values counted as False"""
+    if column not in frame:
+        return pd.Series(False, index=frame.index)
+    return frame[column].astype(object).where(frame[column].notna(), False).astype(bool)
+
+
+def score_cases(frame):
+    """Score every candidate case at once; identical to calculate_real_case_score per row.
+
+    frame has one row per case with any of the columns wikipedia_trend,
+    days_since_coverage, youtube_count, news_mentions and the FLAG_POINTS
+    flags. A NaN stands for a key the case dict didn't have.
+    """
+    trend = _signal(frame, 'wikipedia_trend')
+    days = _signal(frame, 'days_since_coverage')
+    count = _signal(frame, 'youtube_count')
+    mentions = _signal(frame, 'news_mentions')
+
+    score = np.full(len(frame), BASE_SCORE, dtype='int64')
+    # Wikipedia trend (weighted heavily)
+    score += np.select([trend > 50, trend > 10, trend < -30], [20, 10, -10], 0)
+    # Media freshness (how recent is coverage)
+    score += np.select([days < 7, days < 30, days > 180], [15, 10, -5], 0)
+    # YouTube saturation
+    score += np.select([count < 10, count < 50, count > 200], [15, 5, -20], 0)
+    # News mentions
+    score += np.select([(mentions > 5) & (mentions < 30), mentions > 100], [10, -10], 0)
+
+    for column, points in FLAG_POINTS.items():
+        score += np.where(_flag(frame, column), points, 0)
+
+    return pd.Series(np.clip(score, 0, 100), index=frame.index, name='case_score')
+
+
+def rank_cases(frame, limit=None):
+    """Candidates with a case_score column, best first (ties keep their input order)"""
+    ranked = frame.assign(case_score=score_cases(frame))
+    ranked = ranked.sort_values('case_score', ascending=False, kind='mergesort')
+    return ranked if limit is None else ranked.head(limit)
@@ -0,0 +1,146 @@
+"""Process-wide pooled HTTP client shared by every provider helper"""
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import Future
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import provider_health
+import rate_limiter
+
+# (connect, read) seconds - applied whenever a caller doesn't pass its own timeout
+DEFAULT_TIMEOUT = (5, 20)
+
+# Idempotent requests get a couple of quick retries on transient upstream errors.
+# 429s are left to the caller so rate-limit handling stays in one place.
+RETRY_POLICY = Retry(
+    total=2,
+    connect=2,
+    read=1,
+    backoff_factor=0.5,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+
+def _build_session():
+    """Create the shared session with keep-alive pools per host"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,  # distinct hosts kept warm
+        pool_maxsize=16,      # concurrent keep-alive connections per host
+        max_retries=RETRY_POLICY,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Accept-Encoding": "gzip, deflate"})
+    # Every user shares this session, so never carry cookies between requests
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+# urllib3 connection pools are thread-safe, so one session serves all Streamlit sessions
+_session = _build_session()
+
+
+# Background health probes only need to know the host answers at all
+PROBE_TIMEOUT = (3, 5)
+
+
+def _send(method, url, kwargs, background=False):
+    """Skip endpoints with an open circuit, wait for the host's rate limiter, send,
+    then feed the outcome back to the rate limiter and health tracker"""
+    provider_health.check(url)
+    rate_limiter.acquire(url, background)
+    started = time.monotonic()
+    try:
+        response = _session.request(method, url, **kwargs)
+    except Exception:
+        provider_health.record(url, False)
+        raise
+    provider_health.record(url, response.status_code < 500, time.monotonic() - started)
+    rate_limiter.observe(url, response)
+    return response
+
+
+def _probe(url):
+    """Does the endpoint answer with anything but a server error?"""
+    rate_limiter.acquire(url, background=True)
+    response = _session.request("HEAD", url, timeout=PROBE_TIMEOUT, allow_redirects=True)
+    return response.status_code < 500
+
+
+provider_health.set_probe(_probe)
+
+
+# Single-flight: identical requests already on the wire, keyed by _flight_key
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def _flight_key(method, url, kwargs):
+    """Identify a request by everything that can change its response"""
+    parts = [method, url] + [kwargs.get(name) for name in ("params", "headers", "json", "data")]
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _coalesced(method, url, kwargs):
+    """Share one in-flight call between every concurrent identical request"""
+    key = _flight_key(method, url, kwargs)
+    with _inflight_lock:
+        flight = _inflight.get(key)
+        leader = flight is None
+        if leader:
+            flight = _inflight[key] = Future()
+
+    if not leader:
+        # The leader's own timeout bounds how long we wait here
+        return flight.result()
+
+    try:
+        response = _send(method, url, kwargs)
+        response.content  # read the body once so every waiter can use it
+        flight.set_result(response)
+        return response
+    except Exception as e:
+        flight.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def request(method, url, coalesce=None, background=False, **kwargs):
+    """Send a request through the shared pooled session.
+
+    GETs are coalesced by default: concurrent identical calls (same URL,
+    params, headers and body) share one upstream request and all receive its
+    response. Pass coalesce=True for POSTs that are safe to share, such as
+    identical LLM prompts, or coalesce=False to always go to the network.
+    background=True marks work nobody is waiting on; it only uses spare
+    rate-limit capacity and is never shared with interactive calls.
+    """
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    if coalesce is None:
+        coalesce = method == "GET"
+    if coalesce and not background and not kwargs.get("stream"):
+        return _coalesced(method, url, kwargs)
+    return _send(method, url, kwargs, background)
+
+
+def get(url, **kwargs):
+    """GET through the shared pooled session"""
+    return request("GET", url, **kwargs)
+
+
+def post(url, **kwargs):
+    """POST through the shared pooled session"""
+    return request("POST", url, **kwargs)
@@ -0,0 +1,125 @@
+"""Content-addressed cache for paid LLM calls (Perplexity, OpenAI, Gemini).
+
+Answers are keyed by provider plus the normalized request - model, prompt
+messages and generation parameters - so any two identical prompts share one
+paid call, whichever page sent them. How long an answer stays fresh depends
+on what it is for: a case overview is good for days, "latest news" is not.
+"""
+import json
+import threading
+
+import response_cache
+
+HOUR = response_cache.HOUR
+
+# How long each kind of generated answer stays useful
+USE_CASE_TTLS = {
+    "case_overview": 7 * 24 * HOUR,
+    "case_research": 3 * 24 * HOUR,
+    "episode_strategy": 7 * 24 * HOUR,
+    "post_analysis": 24 * HOUR,
+    "trend_analysis": 12 * HOUR,
+    "web_search": 6 * HOUR,
+    "news": 2 * HOUR,
+}
+DEFAULT_TTL = 24 * HOUR
+
+# Approximate list prices in USD per million (input, output) tokens - only used
+# to estimate what cache hits saved
+MODEL_PRICES = {
+    "gpt-4": (30.0, 60.0),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "sonar": (1.0, 1.0),
+    "gemini-1.5-flash": (0.075, 0.30),
+    "gemini-1.5-flash-latest": (0.075, 0.30),
+}
+DEFAULT_PRICE = (1.0, 2.0)
+REQUEST_FEES = {"perplexity": 0.005}  # per-request search fee on top of tokens
+CHARS_PER_TOKEN = 4  # rough estimate when the API doesn't report usage
+
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def make_key(provider, request):
+    """Cache key for a request dict (model, messages/prompt and generation parameters)"""
+    return response_cache.make_key("llm", provider, request)
+
+
+def estimate_cost(provider, request, text, usage=None):
+    """Dollar cost of one call, from reported token usage or a character-count estimate"""
+    if usage:
+        # Raw API JSON gives a dict, the OpenAI SDK a usage object
+        prompt_tokens, completion_tokens = (
+            (usage.get(name) if isinstance(usage, dict) else getattr(usage, name, 0)) or 0
+            for name in ("prompt_tokens", "completion_tokens")
+        )
+    else:
+        prompt = {name: value for name, value in request.items() if name in ("messages", "prompt")}
+        prompt_tokens = len(json.dumps(prompt)) / CHARS_PER_TOKEN
+        completion_tokens = len(text or "") / CHARS_PER_TOKEN
+    input_price, output_price = MODEL_PRICES.get(request.get("model"), DEFAULT_PRICE)
+    tokens_cost = (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+    return tokens_cost + REQUEST_FEES.get(provider, 0.0)
+
+
+def _count(use_case, outcome, saved=0.0):
+    with _stats_lock:
+        counters = _stats.setdefault(use_case, {"hits": 0, "misses": 0, "refreshes": 0, "saved": 0.0})
+        counters[outcome] += 1
+        counters["saved"] += saved
+
+
+def get(use_case, provider, request, refresh=False):
+    """Cached answer text for an identical request, or None.
+
+    refresh=True skips the lookup so the caller asks again and overwrites
+    the stored answer.
+    """
+    if refresh:
+        _count(use_case, "refreshes")
+        return None
+    entry = response_cache.get("llm", make_key(provider, request))
+    if entry is None:
+        _count(use_case, "misses")
+        return None
+    _count(use_case, "hits", entry["cost"])
+    return entry["text"]
+
+
+def put(use_case, provider, request, text, usage=None):
+    """Store an answer for the use case's TTL; empty answers are never stored"""
+    if not text:
+        return
+    entry = {"text": text, "cost": estimate_cost(provider, request, text, usage)}
+    ttl = USE_CASE_TTLS.get(use_case, DEFAULT_TTL)
+    response_cache.put("llm", make_key(provider, request), entry, ttl)
+
+
+def cached_call(use_case, provider, request, call, refresh=False):
+    """Answer text for request, calling call() only when no fresh identical answer is cached.
+
+    call returns the answer text, or None on failure (which is not cached).
+    """
+    text = get(use_case, provider, request, refresh)
+    if text is None:
+        text = call()
+        put(use_case, provider, request, text)
+    return text
+
+
+def stats():
+    """Hits, misses, hit rate and dollars saved, per use case and in total"""
+    with _stats_lock:
+        use_cases = {use_case: dict(counters) for use_case, counters in _stats.items()}
+    for counters in use_cases.values():
+        lookups = counters["hits"] + counters["misses"]
+        counters["hit_rate"] = counters["hits"] / lookups if lookups else 0.0
+    hits = sum(counters["hits"] for counters in use_cases.values())
+    lookups = hits + sum(counters["misses"] for counters in use_cases.values())
+    return {
+        "use_cases": use_cases,
+        "hits": hits,
+        "hit_rate": hits / lookups if lookups else 0.0,
+        "saved": sum(counters["saved"] for counters in use_cases.values()),
+    }
@@ -0,0 +1,68 @@
+"""Streaming OpenAI chat completions over the shared HTTP client"""
+import json
+
+import http_client
+
+OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+
+# (connect, read) seconds - while streaming, the read timeout applies between
+# chunks, so a long generation is never cut off just for taking a while
+STREAM_TIMEOUT = (5, 30)
+
+CONTINUE_PROMPT = ("Your previous answer was cut off. Continue exactly where it stopped - "
+                   "don't repeat anything and don't add a preamble.")
+
+
+class StreamInterrupted(Exception):
+    """The generation stopped before the model finished (dropped stream or max_tokens)"""
+
+
+def stream_chat(api_key, messages, model="gpt-4", max_tokens=1500, temperature=0.7):
+    """Yield the reply text piece by piece as OpenAI generates it.
+
+    Raises StreamInterrupted if the stream ends early or hits max_tokens;
+    everything yielded before that is valid output to keep or resume from.
+    """
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json"
+    }
+    data = {
+        "model": model,
+        "messages": messages,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "stream": True
+    }
+    response = http_client.post(OPENAI_CHAT_URL, headers=headers, json=data, stream=True, timeout=STREAM_TIMEOUT)
+    if response.status_code != 200:
+        raise RuntimeError(f"{response.status_code} - {response.text}")
+
+    response.encoding = "utf-8"  # event streams don't always declare a charset
+    finish_reason = None
+    with response:
+        for line in response.iter_lines(decode_unicode=True):
+            # Server-sent events: "data: {json}" lines, ending with "data: [DONE]"
+            if not line or not line.startswith("data: "):
+                continue
+            payload = line[len("data: "):]
+            if payload == "[DONE]":
+                break
+            choices = json.loads(payload).get("choices") or [{}]
+            text = choices[0].get("delta", {}).get("content")
+            if text:
+                yield text
+            finish_reason = choices[0].get("finish_reason") or finish_reason
+
+    if finish_reason == "length":
+        raise StreamInterrupted(f"reached the {max_tokens}-token limit")
+    if finish_reason is None:
+        raise StreamInterrupted("the connection closed before the reply finished")
+
+
+def resume_messages(messages, partial):
+    """Messages that ask the model to pick up a partial reply where it stopped"""
+    return messages + [
+        {"role": "assistant", "content": partial},
+        {"role": "user", "content": CONTINUE_PROMPT},
+    ]
@@ -0,0 +1,68 @@
+"""Near-duplicate grouping of short texts with character shingles and MinHash/LSH"""
+import random
+import re
+import zlib
+
+SHINGLE_SIZE = 5
+NUM_HASHES = 32
+BANDS = 8                 # 8 bands x 4 rows: pairs around 0.5 similarity start colliding
+ROWS = NUM_HASHES // BANDS
+THRESHOLD = 0.5           # estimated Jaccard similarity needed to join a cluster
+MAX_BUCKET_COMPARISONS = 8
+
+_NON_WORD = re.compile(r'[^a-z0-9]+')
+
+# XOR masks turn one 32-bit shingle hash into NUM_HASHES independent-enough permutations
+_MASKS = [random.Random(seed).getrandbits(32) for seed in range(NUM_HASHES)]
+
+
+def shingles(text, size=SHINGLE_SIZE):
+    """Hashed character shingles of the normalized text"""
+    text = _NON_WORD.sub(' ', (text or '').lower()).strip()
+    if len(text) <= size:
+        return {zlib.crc32(text.encode())}
+    return {zlib.crc32(text[i:i + size].encode()) for i in range(len(text) - size + 1)}
+
+
+def signature(text):
+    """MinHash signature: for each permutation, the smallest permuted shingle hash"""
+    hashes = shingles(text)
+    return tuple(min(h ^ mask for h in hashes) for mask in _MASKS)
+
+
+def similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(a == b for a, b in zip(sig_a, sig_b)) / NUM_HASHES
+
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster_ids(texts, threshold=THRESHOLD):
+    """Assign each text a cluster id; near-duplicates share one.
+
+    Candidates come from LSH band buckets and only a bounded number of
+    bucket members are compared per text, so the pass stays near-linear.
+    Cluster ids are the index of the cluster's first text.
+    """
+    signatures = [signature(text) for text in texts]
+    parent = list(range(len(signatures)))
+
+    for band in range(BANDS):
+        buckets = {}
+        start = band * ROWS
+        for i, sig in enumerate(signatures):
+            members = buckets.setdefault(sig[start:start + ROWS], [])
+            root = _find(parent, i)
+            for j in members[:MAX_BUCKET_COMPARISONS]:
+                other = _find(parent, j)
+                if other != root and similarity(sig, signatures[j]) >= threshold:
+                    parent[max(root, other)] = min(root, other)
+                    root = min(root, other)
+            members.append(i)
+
+    return [_find(parent, i) for i in range(len(signatures))]
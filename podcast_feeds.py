@@ -0,0 +1,174 @@
+"""Podcast feed fetching for the Apple Podcasts (iTunes) views"""
+import time
+import xml.etree.ElementTree as ET
+
+import feedparser
+
+import http_client
+import records
+import research
+import response_cache
+
+ITUNES_LOOKUP_URL = "https://itunes.apple.com/lookup"
+FEED_TIMEOUT = 15       # wall-clock seconds to fetch and stream-parse one RSS feed
+LATEST_DEADLINE = 45    # seconds for a whole "Get Latest Episodes" run
+
+# Parsed feeds are revalidated with ETag/Last-Modified on every use, so they can be kept long
+FEED_CACHE_TTL = 30 * 24 * response_cache.HOUR
+FEED_URL_TTL = 7 * 24 * response_cache.HOUR
+MAX_CACHED_EPISODES = 20
+
+STREAM_CHUNK_SIZE = 64 * 1024
+ITUNES_NS = "{http://www.itunes.com/dtds/podcast-1.0.dtd}"
+
+
+@response_cache.cached("itunes", ttl=FEED_URL_TTL)
+def get_feed_url(podcast_id):
+    """Look up a podcast's RSS feed URL through the iTunes lookup API"""
+    response = http_client.get(ITUNES_LOOKUP_URL, params={'id': podcast_id}, timeout=10)
+    if response.status_code == 200:
+        results = response.json().get('results')
+        if results:
+            return results[0].get('feedUrl')
+    return None
+
+
+def _parse_episodes(content, limit):
+    """Parse the newest episodes out of an RSS document"""
+    feed = feedparser.parse(content)
+    return [records.PodcastEpisode.from_feed_entry(entry) for entry in feed.entries[:limit]]
+
+
+def stream_episodes(response, limit, deadline=None):
+    """Parse the newest episodes from a streamed feed body, stopping after `limit` items.
+
+    Returns (episodes, complete). Plain RSS is pull-parsed chunk by chunk and
+    each finished <item> is discarded, so memory and CPU stay bounded however
+    long the back catalog is. Anything else (malformed XML, an Atom feed, or no
+    <item> at all) falls back to feedparser on the same body, read to the end,
+    so the feed is never downloaded twice. Past the time.monotonic() deadline
+    the episodes parsed so far are returned with complete=False, or
+    TimeoutError is raised if there are none yet.
+    """
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    body = []
+    root = None
+    episodes = []
+    chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+
+    def past_deadline():
+        return deadline is not None and time.monotonic() > deadline
+
+    try:
+        try:
+            for chunk in chunks:
+                body.append(chunk)
+                parser.feed(chunk)
+                for event, elem in parser.read_events():
+                    if event == 'start':
+                        if root is None:
+                            root = elem.tag
+                            if root != 'rss':
+                                raise ET.ParseError("not an RSS feed")  # Atom or RDF - leave it to feedparser
+                        continue
+                    if elem.tag != 'item':
+                        continue
+                    episodes.append(records.PodcastEpisode.from_rss_item(elem, ITUNES_NS))
+                    elem.clear()
+                    if len(episodes) >= limit:
+                        return episodes, True
+                if past_deadline():
+                    if episodes:
+                        return episodes, False
+                    raise TimeoutError(f"feed took longer than {FEED_TIMEOUT}s")
+            parser.close()
+            if episodes:
+                return episodes, True
+        except ET.ParseError:
+            pass
+
+        # Malformed XML, Atom or an empty channel - feedparser's forgiving full parse
+        complete = True
+        for chunk in chunks:
+            body.append(chunk)
+            if past_deadline():
+                complete = False
+                break
+        episodes = _parse_episodes(b"".join(body), limit)
+        if not complete and not episodes:
+            raise TimeoutError(f"feed took longer than {FEED_TIMEOUT}s")
+        return episodes, complete
+    finally:
+        response.close()
+
+
+def get_feed_episodes(feed_url, limit=5):
+    """Fetch a feed with a conditional GET, reusing the cached parse on 304 Not Modified"""
+    cache_key = response_cache.make_key("podcast_feed", feed_url)
+    cached = response_cache.get("podcast_feed", cache_key)
+    use_cache = cached is not None and limit <= MAX_CACHED_EPISODES
+
+    headers = {}
+    if use_cache:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    started = time.monotonic()
+    response = http_client.get(feed_url, headers=headers, timeout=FEED_TIMEOUT, stream=True)
+
+    if response.status_code != 200:
+        response.close()
+        if use_cache:
+            return cached['episodes'][:limit]  # 304 Not Modified, or serve the last good copy
+        return []
+
+    parse_limit = max(limit, MAX_CACHED_EPISODES)
+    episodes, complete = stream_episodes(response, parse_limit, deadline=started + FEED_TIMEOUT)
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    # A parse cut short by the deadline is shown but never cached - a 304 would keep serving it
+    if complete and (etag or last_modified):
+        response_cache.put("podcast_feed", cache_key, {
+            'etag': etag,
+            'last_modified': last_modified,
+            'episodes': episodes[:MAX_CACHED_EPISODES]
+        }, ttl=FEED_CACHE_TTL)
+
+    return episodes[:limit]
+
+
+def get_podcast_episodes(podcast_id, limit=5):
+    """Get recent episodes for a specific podcast from its RSS feed"""
+    try:
+        feed_url = get_feed_url(podcast_id)
+        if not feed_url:
+            return []
+        return get_feed_episodes(feed_url, limit=limit)
+    except Exception as e:
+        print(f"Podcast feed error for {podcast_id}: {e}")
+        return []
+
+
+def podcast_id_from_url(url):
+    """Extract the numeric Apple Podcasts ID from a show URL"""
+    return url.split('/id')[-1].split('?')[0]
+
+
+def fetch_latest_episodes(podcasts, limit=2, deadline=LATEST_DEADLINE):
+    """Fetch every podcast's feed in parallel and yield (podcast, episodes) as each completes.
+
+    Feeds run on their own "feeds" worker pool so a large refresh never
+    queues Case Search lookups behind it. Each feed is bounded by
+    FEED_TIMEOUT and the whole run by the deadline, after which feeds still
+    queued or running are yielded with no episodes.
+    """
+    by_rank = {podcast['rank']: podcast for podcast in podcasts if podcast.get('url')}
+    tasks = {
+        rank: (lambda podcast=podcast: get_podcast_episodes(podcast_id_from_url(podcast['url']), limit=limit))
+        for rank, podcast in by_rank.items()
+    }
+
+    for rank, episodes, error in research.fan_out(tasks, deadline=deadline, pool="feeds"):
+        yield by_rank[rank], (episodes or [])
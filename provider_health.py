@@ -0,0 +1,168 @@
+"""Per-endpoint health tracking and circuit breaking for upstream providers.
+
+Every request through http_client is recorded against its host. After
+FAILURE_THRESHOLD consecutive failures (connection errors, timeouts, 5xx)
+the host's circuit opens and requests to it fail fast with CircuitOpenError
+instead of waiting out the timeout. A background probe retries the host each
+cool-down window and closes the circuit as soon as it answers.
+"""
+import threading
+import time
+from urllib.parse import urlparse
+
+FAILURE_THRESHOLD = 3
+COOLDOWN = 60        # seconds an open circuit is skipped before the next probe
+MAX_COOLDOWN = 600   # cool-down doubles after each failed probe, up to this
+LATENCY_WEIGHT = 0.3  # EWMA weight of the newest sample
+FAILURE_WEIGHT = 0.3
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to an endpoint whose circuit is open"""
+
+
+_hosts = {}
+_lock = threading.Lock()
+
+# Callable(url) -> bool used by the background probes; set by http_client
+_probe = None
+
+
+def set_probe(probe):
+    """Register how background probes test an endpoint"""
+    global _probe
+    _probe = probe
+
+
+def _host(url):
+    return (urlparse(url).hostname or "").lower()
+
+
+def _state(host):
+    state = _hosts.get(host)
+    if state is None:
+        state = _hosts[host] = {
+            "failures": 0,          # consecutive
+            "failure_rate": 0.0,    # EWMA of failures
+            "latency": None,        # EWMA seconds of successful calls
+            "open_until": None,     # set while the circuit is open
+            "cooldown": COOLDOWN,
+            "probe_url": None,
+            "probing": False,
+        }
+    return state
+
+
+def check(url):
+    """Raise CircuitOpenError if the URL's endpoint is currently being skipped.
+
+    Once the cool-down has passed without a probe closing the circuit, one
+    real request is let through as the trial.
+    """
+    host = _host(url)
+    with _lock:
+        state = _hosts.get(host)
+        if state is None or state["open_until"] is None:
+            return
+        if time.monotonic() < state["open_until"]:
+            raise CircuitOpenError(f"{host} is unavailable (circuit open)")
+        state["open_until"] = time.monotonic() + state["cooldown"]
+
+
+def record(url, ok, latency=None):
+    """Record one call's outcome and open or close the endpoint's circuit"""
+    host = _host(url)
+    with _lock:
+        state = _state(host)
+        state["failure_rate"] += FAILURE_WEIGHT * ((0.0 if ok else 1.0) - state["failure_rate"])
+        if ok:
+            if latency is not None:
+                previous = state["latency"]
+                state["latency"] = latency if previous is None else previous + LATENCY_WEIGHT * (latency - previous)
+            state["failures"] = 0
+            state["open_until"] = None
+            state["cooldown"] = COOLDOWN
+            return
+
+        state["failures"] += 1
+        state["probe_url"] = url.split("?", 1)[0]
+        if state["failures"] < FAILURE_THRESHOLD:
+            return
+        if state["open_until"] is not None:
+            # A trial request failed - back off further
+            state["cooldown"] = min(state["cooldown"] * 2, MAX_COOLDOWN)
+        state["open_until"] = time.monotonic() + state["cooldown"]
+        start_probe = _probe is not None and not state["probing"]
+        state["probing"] = state["probing"] or start_probe
+
+    if start_probe:
+        print(f"Circuit opened for {host} after {FAILURE_THRESHOLD} failures")
+        threading.Thread(target=_probe_until_healthy, args=(host,), daemon=True,
+                         name=f"probe-{host}").start()
+
+
+def _probe_until_healthy(host):
+    """Background loop: wait out each cool-down, then probe until the endpoint answers"""
+    while True:
+        with _lock:
+            state = _hosts[host]
+            if state["open_until"] is None:
+                state["probing"] = False
+                return
+            wait_for = max(state["open_until"] - time.monotonic(), 0)
+            probe_url = state["probe_url"]
+        time.sleep(wait_for)
+
+        started = time.monotonic()
+        try:
+            healthy = _probe(probe_url)
+        except Exception:
+            healthy = False
+
+        with _lock:
+            if state["open_until"] is None:
+                continue  # a trial request already closed it
+            if healthy:
+                print(f"Circuit closed for {host}")
+                state["failures"] = 0
+                state["open_until"] = None
+                state["cooldown"] = COOLDOWN
+                state["latency"] = time.monotonic() - started
+            else:
+                state["cooldown"] = min(state["cooldown"] * 2, MAX_COOLDOWN)
+                state["open_until"] = time.monotonic() + state["cooldown"]
+
+
+def is_available(url):
+    """True unless the URL's endpoint is inside an open circuit's cool-down"""
+    with _lock:
+        state = _hosts.get(_host(url))
+        return state is None or state["open_until"] is None or time.monotonic() >= state["open_until"]
+
+
+def rank(urls):
+    """Order interchangeable endpoints healthiest first.
+
+    Open circuits go last, then by recent failure rate, then by latency.
+    Endpoints with no history keep their given order behind proven ones.
+    """
+    def health(item):
+        position, url = item
+        with _lock:
+            state = _hosts.get(_host(url))
+            if state is None:
+                return (False, 0.0, float("inf"), position)
+            latency = state["latency"] if state["latency"] is not None else float("inf")
+            return (state["open_until"] is not None, round(state["failure_rate"], 1), latency, position)
+
+    return [url for _, url in sorted(enumerate(urls), key=health)]
+
+
+def snapshot():
+    """Current health of every endpoint seen so far"""
+    with _lock:
+        return {host: {"circuit": "open" if state["open_until"] is not None else "closed",
+                       "consecutive_failures": state["failures"],
+                       "failure_rate": round(state["failure_rate"], 2),
+                       "latency": state["latency"]}
+                for host, state in _hosts.items()}
@@ -0,0 +1,58 @@
+"""Bounded top-k ranking for collected posts and trending cases"""
+import heapq
+import time
+
+
+def trend_score(upvotes, comments):
+    """Trending Cases score: upvotes plus comments weighted x10"""
+    return upvotes + (comments * 10)
+
+
+def decayed_trend_score(upvotes, comments, created_utc, now=None):
+    """Engagement decayed by age in hours, so newer posts outrank older ones with the same engagement"""
+    hours_ago = ((now or time.time()) - created_utc) / 3600
+    time_factor = 1 / (hours_ago + 2)  # +2 to prevent extreme values for very new posts
+    engagement = upvotes + (comments * 2)  # Comments weighted more heavily
+    return int(engagement * time_factor)
+
+
+def top_k(items, k, key):
+    """The k highest-scoring items, best first, in O(n log k).
+
+    items can be any iterable (including a generator still being fed by
+    fetches); ties keep their original order, matching
+    sorted(items, key=key, reverse=True)[:k].
+    """
+    if k is None:
+        return sorted(items, key=key, reverse=True)
+    return heapq.nlargest(k, items, key=key)
+
+
+class TopK:
+    """Running top-k for results that arrive in batches (e.g. one per subreddit).
+
+    Keeps at most k items in a min-heap, so each push is O(log k) and a
+    partial ranking can be read at any point. Ties keep arrival order.
+    """
+
+    def __init__(self, k, key):
+        self.k = k
+        self.key = key
+        self._heap = []
+        self._count = 0
+
+    def push(self, item):
+        entry = (self.key(item), -self._count, item)
+        self._count += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def extend(self, items):
+        for item in items:
+            self.push(item)
+
+    def items(self):
+        """Current best items, best first"""
+        return [item for _, _, item in sorted(self._heap, key=lambda entry: entry[:2], reverse=True)]
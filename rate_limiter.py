@@ -0,0 +1,117 @@
+"""Shared per-host token-bucket rate limiting for upstream APIs"""
+import threading
+import time
+from urllib.parse import urlparse
+
+# (tokens per second, burst) keyed by host suffix - the most specific match wins.
+# All reddit.com mirrors share one bucket since Reddit counts them together.
+HOST_LIMITS = {
+    "reddit.com": (0.5, 5),
+    "api.pushshift.io": (1.0, 3),
+    "api.spotify.com": (5.0, 10),
+    "itunes.apple.com": (5.0, 10),
+    "googleapis.com": (10.0, 20),
+}
+DEFAULT_LIMIT = (10.0, 20)
+
+# Never honor a server-requested pause longer than this
+MAX_PAUSE = 60
+
+# Share of each host's burst that background work (trending crawls, health
+# probes) may not touch, so interactive requests always find tokens waiting
+# and win every race for a refilled one
+BACKGROUND_RESERVE = 0.6
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def _bucket_name(host):
+    """Map a host onto the bucket that governs it"""
+    matches = [suffix for suffix in HOST_LIMITS if host == suffix or host.endswith("." + suffix)]
+    return max(matches, key=len) if matches else host
+
+
+def _bucket(url):
+    host = (urlparse(url).hostname or "").lower()
+    name = _bucket_name(host)
+    with _buckets_lock:
+        bucket = _buckets.get(name)
+        if bucket is None:
+            rate, burst = HOST_LIMITS.get(name, DEFAULT_LIMIT)
+            bucket = _buckets[name] = {
+                "rate": rate,
+                "burst": burst,
+                "tokens": float(burst),
+                "updated": time.monotonic(),
+                "paused_until": 0.0,
+                "lock": threading.Lock(),
+            }
+        return bucket
+
+
+def configure(host, rate, burst):
+    """Override the rate/burst for a host (takes effect for new buckets)"""
+    HOST_LIMITS[host] = (rate, burst)
+    with _buckets_lock:
+        _buckets.pop(host, None)
+
+
+def acquire(url, background=False):
+    """Block only as long as needed to take one token for the URL's host.
+
+    Background requests only take a token while the bucket holds more than
+    its reserve, so they use idle capacity and yield to interactive ones.
+    """
+    bucket = _bucket(url)
+    reserve = min(bucket["burst"] * BACKGROUND_RESERVE, bucket["burst"] - 1) if background else 0
+    while True:
+        with bucket["lock"]:
+            now = time.monotonic()
+            bucket["tokens"] = min(bucket["burst"], bucket["tokens"] + (now - bucket["updated"]) * bucket["rate"])
+            bucket["updated"] = now
+
+            if now < bucket["paused_until"]:
+                wait = bucket["paused_until"] - now
+            elif bucket["tokens"] >= 1 + reserve:
+                bucket["tokens"] -= 1
+                return
+            else:
+                wait = (1 + reserve - bucket["tokens"]) / bucket["rate"]
+        time.sleep(wait)
+
+
+def _pause(bucket, seconds):
+    seconds = min(max(seconds, 0), MAX_PAUSE)
+    with bucket["lock"]:
+        bucket["paused_until"] = max(bucket["paused_until"], time.monotonic() + seconds)
+
+
+def observe(url, response):
+    """Adjust the host's bucket from Retry-After and X-Ratelimit-* response headers"""
+    bucket = _bucket(url)
+    headers = response.headers
+
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            _pause(bucket, float(retry_after))
+        except ValueError:
+            _pause(bucket, 5)  # HTTP-date form - back off briefly rather than parse it
+    elif response.status_code == 429:
+        _pause(bucket, 5)
+
+    # Reddit reports its remaining quota for the current window
+    remaining = headers.get("X-Ratelimit-Remaining")
+    reset = headers.get("X-Ratelimit-Reset")
+    if remaining is not None and reset is not None:
+        try:
+            remaining, reset = float(remaining), float(reset)
+        except ValueError:
+            return
+        if remaining < 1:
+            _pause(bucket, reset)
+        else:
+            # Never hold more burst than the server says is left
+            with bucket["lock"]:
+                bucket["tokens"] = min(bucket["tokens"], remaining)
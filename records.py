@@ -0,0 +1,138 @@
+"""Compact record types for API results kept in caches and session state.
+
+Each record keeps only the fields the pages read and uses __slots__, so a
+result list held in st.session_state costs a few attributes per item
+instead of the full upstream payload.
+"""
+
+
+class Record:
+    """Base for slotted records - subclasses list their fields in __slots__"""
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    def get(self, name, default=None):
+        """dict-style access so sort keys and optional fields read the same as before"""
+        value = getattr(self, name, None)
+        return default if value is None else value
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class RedditPost(Record):
+    __slots__ = ('id', 'title', 'subreddit', 'source_subreddit', 'score', 'num_comments',
+                 'permalink', 'url', 'created_utc', 'author')
+
+    @classmethod
+    def from_reddit(cls, post_data, source_subreddit=None):
+        """Build from a Reddit listing child's 'data' object"""
+        subreddit = post_data.get('subreddit', '')
+        return cls(
+            id=post_data.get('id', ''),
+            title=post_data.get('title', ''),
+            subreddit=subreddit,
+            source_subreddit=source_subreddit or subreddit,
+            score=post_data.get('score', 0),
+            num_comments=post_data.get('num_comments', 0),
+            permalink=post_data.get('permalink', ''),
+            url=post_data.get('url', ''),
+            created_utc=post_data.get('created_utc', 0),
+            author=post_data.get('author', ''),
+        )
+
+    @classmethod
+    def from_pushshift(cls, item):
+        """Build from a Pushshift submission"""
+        subreddit = item.get('subreddit', '')
+        return cls(
+            id=item.get('id', ''),
+            title=item.get('title', ''),
+            subreddit=subreddit,
+            source_subreddit=subreddit,
+            score=item.get('score', 0),
+            num_comments=item.get('num_comments', 0),
+            permalink=f"/r/{subreddit}/comments/{item.get('id')}/",
+            url=item.get('url', ''),
+            created_utc=item.get('created_utc', 0),
+            author=item.get('author', ''),
+        )
+
+
+class VideoInfo(Record):
+    __slots__ = ('video_id', 'channel_name', 'title', 'published', 'views', 'likes', 'comments',
+                 'duration_seconds', 'thumbnail', 'description', 'relevance')
+
+    @classmethod
+    def from_youtube(cls, video, channel_name=None, duration_seconds=0, relevance=None):
+        """Build from a videos.list resource (snippet, statistics, contentDetails)"""
+        snippet = video.get('snippet', {})
+        statistics = video.get('statistics', {})
+        return cls(
+            video_id=video['id'],
+            channel_name=channel_name or snippet.get('channelTitle', ''),
+            title=snippet.get('title', ''),
+            published=snippet.get('publishedAt', ''),
+            views=int(statistics.get('viewCount', 0)),
+            likes=int(statistics.get('likeCount', 0)),
+            comments=int(statistics.get('commentCount', 0)),
+            duration_seconds=duration_seconds,
+            thumbnail=snippet.get('thumbnails', {}).get('medium', {}).get('url', ''),
+            description=snippet.get('description', ''),
+            relevance=relevance,
+        )
+
+
+class PodcastEpisode(Record):
+    __slots__ = ('title', 'published', 'duration', 'description', 'link',
+                 'podcast_name', 'podcast_artist', 'podcast_rank')
+
+    @classmethod
+    def from_feed_entry(cls, entry):
+        """Build from a feedparser entry"""
+        return cls(
+            title=entry.get('title', 'Unknown'),
+            published=entry.get('published', 'Unknown'),
+            duration=entry.get('itunes_duration', 'Unknown'),
+            description=entry.get('summary', '')[:300] + '...',
+            link=entry.get('link', ''),
+        )
+
+    @classmethod
+    def from_rss_item(cls, item, itunes_ns):
+        """Build from an RSS <item> element"""
+        description = item.findtext('description') or item.findtext(f'{itunes_ns}summary') or ''
+        return cls(
+            title=item.findtext('title') or 'Unknown',
+            published=item.findtext('pubDate') or 'Unknown',
+            duration=item.findtext(f'{itunes_ns}duration') or 'Unknown',
+            description=description.strip()[:300] + '...',
+            link=item.findtext('link') or '',
+        )
+
+
+class TmdbTitle(Record):
+    __slots__ = ('id', 'title', 'release_date', 'overview', 'poster_path', 'vote_average',
+                 'vote_count', 'popularity', 'genre_ids')
+
+    @classmethod
+    def from_tmdb(cls, item):
+        """Build from a TMDb search/discover result (movies use title, TV uses name)"""
+        return cls(
+            id=item.get('id'),
+            title=item.get('title') or item.get('name', 'Unknown'),
+            release_date=item.get('release_date') or item.get('first_air_date', 'Unknown'),
+            overview=item.get('overview', 'No overview available.'),
+            poster_path=item.get('poster_path'),
+            vote_average=item.get('vote_average', 0),
+            vote_count=item.get('vote_count', 0),
+            popularity=item.get('popularity', 0),
+            genre_ids=list(item.get('genre_ids', [])),
+        )
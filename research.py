@@ -0,0 +1,122 @@
+"""Concurrent research orchestrator for the Case Search pipeline"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+DEFAULT_DEADLINE = 45  # seconds for a whole fan-out, queued lookups included
+
+# One bounded pool per kind of fan-out, shared by every session of that kind, so
+# a burst of searches can't spawn unbounded threads and a feed refresh or keyword
+# search never queues Case Search lookups behind it.
+POOL_SIZES = {
+    "research": 8,  # Case Search: 3 sources per search, room for a few searches at once
+    "feeds": 10,    # Latest Episodes: up to 25 RSS feeds, mostly waiting on slow hosts
+    "reddit": 4,    # per-subreddit searches - the shared Reddit token bucket paces them anyway
+}
+
+HEDGE_WORKERS = 16
+HEDGE_DEADLINE = 20  # seconds shared by every alternative in one hedged lookup
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+# Hedged lookups run inside fan_out tasks, so they get their own pool - waiting on
+# the same pool from one of its workers could starve it
+_hedge_executor = ThreadPoolExecutor(max_workers=HEDGE_WORKERS, thread_name_prefix="hedge")
+
+
+def _pool(name):
+    """The shared executor for one kind of fan-out, created on first use"""
+    with _pools_lock:
+        executor = _pools.get(name)
+        if executor is None:
+            executor = _pools[name] = ThreadPoolExecutor(max_workers=POOL_SIZES[name], thread_name_prefix=name)
+        return executor
+
+
+def fan_out(tasks, deadline=DEFAULT_DEADLINE, pool="research", task_deadline=None):
+    """Launch every source lookup at once and yield (name, result, error) as each finishes.
+
+    tasks maps a source name to a zero-argument callable, run on the named
+    pool from POOL_SIZES. The deadline is wall-clock time for the whole call,
+    counted from submission: lookups still queued or running when it passes
+    are yielded with a TimeoutError so the page can render whatever already
+    arrived instead of waiting on one slow provider or a busy pool. Queued
+    ones are cancelled; running ones finish in the background. task_deadline
+    optionally also limits each lookup from when a worker picks it up.
+    Worker threads must not call st.* - return data and let the caller render it.
+    """
+    give_up_at = time.monotonic() + deadline
+    started = {}
+
+    def run(name, fn):
+        started[name] = time.monotonic()
+        return fn()
+
+    def expires_at(name):
+        if task_deadline is None or name not in started:
+            return give_up_at
+        return min(give_up_at, started[name] + task_deadline)
+
+    executor = _pool(pool)
+    futures = {executor.submit(run, name, fn): name for name, fn in tasks.items()}
+    pending = set(futures)
+
+    while pending:
+        now = time.monotonic()
+        expired = {future for future in pending if now >= expires_at(futures[future])}
+        # Drop lookups that ran out of time (running calls finish in the background)
+        for future in expired:
+            pending.discard(future)
+            future.cancel()
+            yield futures[future], None, TimeoutError(f"{futures[future]} exceeded the deadline")
+        if not pending:
+            break
+
+        timeout = max(min(expires_at(futures[future]) for future in pending) - now, 0)
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                yield futures[future], future.result(), None
+            except Exception as e:
+                print(f"Research task {futures[future]} failed: {e}")
+                yield futures[future], None, e
+
+
+def hedge(tasks, enough, deadline=HEDGE_DEADLINE):
+    """Race alternative lookups for the same data instead of trying them one by one.
+
+    tasks is a list of (name, fn) in priority order, each fn returning a list.
+    Every lookup starts at once. Waiting stops once the leading lookups that
+    have all finished - every one ahead of them included - hold at least
+    `enough` items, so a fast low-priority lookup can't end the race before
+    the better ones answer; otherwise it stops when all have finished or at
+    the deadline. Whatever is still running is cancelled. Returns
+    (name, results) for each finished lookup, in priority order.
+    """
+    started = time.monotonic()
+    futures = [_hedge_executor.submit(fn) for _, fn in tasks]
+    positions = {future: i for i, future in enumerate(futures)}
+    results = [None] * len(futures)
+    pending = set(futures)
+
+    while pending:
+        remaining = deadline - (time.monotonic() - started)
+        if remaining <= 0:
+            break
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            i = positions[future]
+            try:
+                results[i] = future.result() or []
+            except Exception as e:
+                print(f"Hedged lookup {tasks[i][0]} failed: {e}")
+                results[i] = []
+
+        settled = next((i for i, result in enumerate(results) if result is None), len(results))
+        if sum(len(result) for result in results[:settled]) >= enough:
+            break
+
+    for future in pending:
+        future.cancel()
+    return [(tasks[i][0], result) for i, result in enumerate(results) if result is not None]
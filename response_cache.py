@@ -0,0 +1,175 @@
+"""Process-shared, disk-backed response cache for upstream providers"""
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+CACHE_DIR = os.getenv("TCO_CACHE_DIR", ".cache")
+CACHE_PATH = os.path.join(CACHE_DIR, "responses.sqlite3")
+
+HOUR = 3600
+
+# How long each provider's answers stay fresh
+PROVIDER_TTLS = {
+    "serper": 6 * HOUR,
+    "youtube": 24 * HOUR,  # matches the refresh policy on the Privacy Policy page
+    "reddit": 1 * HOUR,
+    "wikidata": 7 * 24 * HOUR,
+    "wikipedia": 7 * 24 * HOUR,
+    "courtlistener": 24 * HOUR,
+    "itunes": 6 * HOUR,
+    "tmdb": 24 * HOUR,
+    "spotify": 7 * 24 * HOUR,
+}
+DEFAULT_TTL = 1 * HOUR
+
+# Bump when the shape of cached values or keys changes so old pickles are never served
+KEY_VERSION = 3
+
+# Size limits - least recently used entries are evicted first
+MAX_ENTRIES = 5000
+MAX_BYTES = 200 * 1024 * 1024
+
+_lock = threading.Lock()
+_conn = None
+_stats = {}
+
+
+def _connect():
+    """Open (once) the shared SQLite store"""
+    global _conn
+    if _conn is None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _conn = sqlite3.connect(CACHE_PATH, timeout=10, check_same_thread=False, isolation_level=None)
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        _conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_access ON responses (last_access)")
+    return _conn
+
+
+def normalize_text(value):
+    """Normalize a free-text query so trivially different spellings share an entry.
+
+    Only for search text - IDs, URLs and API keys are case-sensitive and must
+    go into make_key as they are.
+    """
+    if isinstance(value, str):
+        return " ".join(value.lower().split())
+    return value
+
+
+def make_key(provider, *args, **kwargs):
+    """Build a cache key from the provider name and the request parts, used verbatim"""
+    payload = json.dumps([KEY_VERSION, provider, list(args), kwargs], sort_keys=True, default=str)
+    return f"{provider}:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+
+def _count(provider, outcome):
+    counters = _stats.setdefault(provider, {"hits": 0, "misses": 0})
+    counters[outcome] += 1
+
+
+def get(provider, key):
+    """Return a fresh cached value, or None on a miss"""
+    now = time.time()
+    try:
+        with _lock:
+            conn = _connect()
+            row = conn.execute("SELECT value, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row and row[1] > now:
+                conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+                _count(provider, "hits")
+                return pickle.loads(row[0])
+            if row:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            _count(provider, "misses")
+    except Exception as e:
+        print(f"Response cache read error: {e}")
+    return None
+
+
+def put(provider, key, value, ttl=None):
+    """Store a value for the provider's TTL and evict old entries if over budget"""
+    ttl = ttl if ttl is not None else PROVIDER_TTLS.get(provider, DEFAULT_TTL)
+    now = time.time()
+    try:
+        blob = pickle.dumps(value)
+        with _lock:
+            conn = _connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, provider, value, size, expires_at, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, provider, blob, len(blob), now + ttl, now),
+            )
+            _evict(conn, now)
+    except Exception as e:
+        print(f"Response cache write error: {e}")
+
+
+def _evict(conn, now):
+    """Drop expired rows, then least recently used rows until under the size limits"""
+    conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+    entries, total_bytes = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+    if entries <= MAX_ENTRIES and total_bytes <= MAX_BYTES:
+        return
+    for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_access").fetchall():
+        if entries <= MAX_ENTRIES and total_bytes <= MAX_BYTES:
+            break
+        conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+        entries -= 1
+        total_bytes -= size
+
+
+def cached(provider, ttl=None, text_args=()):
+    """Decorator: serve a provider helper from the shared cache.
+
+    text_args names the free-text parameters (search queries, case names)
+    that go through normalize_text; every other argument is keyed verbatim.
+    Empty or None results are treated as failures and never stored, so a
+    provider outage doesn't get pinned in the cache for the whole TTL.
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            call = signature.bind(*args, **kwargs)
+            call.apply_defaults()
+            request = {name: normalize_text(value) if name in text_args else value
+                       for name, value in call.arguments.items()}
+            key = make_key(provider, fn.__name__, **request)
+            value = get(provider, key)
+            if value is not None:
+                return value
+            value = fn(*args, **kwargs)
+            if value:
+                put(provider, key, value, ttl)
+            return value
+        return wrapper
+    return decorator
+
+
+def stats():
+    """Hit/miss counters per provider plus current store size"""
+    summary = {provider: dict(counters) for provider, counters in _stats.items()}
+    try:
+        with _lock:
+            entries, total_bytes = _connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+    except Exception:
+        entries, total_bytes = 0, 0
+    return {"providers": summary, "entries": entries, "bytes": total_bytes}
@@ -0,0 +1,160 @@
+"""On-disk BM25 full-text index of the Reddit posts, Wikidata entities and case overviews the app fetches"""
+import os
+import re
+import sqlite3
+import threading
+import time
+
+import response_cache
+
+INDEX_PATH = os.path.join(response_cache.CACHE_DIR, "search_index.sqlite3")
+
+# bm25() column weights - a match in the title counts for more than one in the body
+TITLE_WEIGHT = 5.0
+BODY_WEIGHT = 1.0
+
+KIND_LABELS = {'reddit': "Reddit", 'wikidata': "Wikidata", 'overview': "Case overview"}
+
+# Document kinds whose titles are case names, offered as Case Search suggestions
+SUGGESTION_KINDS = ('overview', 'wikidata')
+
+_TOKEN = re.compile(r'\w+')
+
+_lock = threading.Lock()
+_conn = None
+
+
+def _connect():
+    """Open (once) the index, creating the document table and its FTS5 mirror"""
+    global _conn
+    if _conn is None:
+        os.makedirs(os.path.dirname(INDEX_PATH) or ".", exist_ok=True)
+        _conn = sqlite3.connect(INDEX_PATH, timeout=10, check_same_thread=False, isolation_level=None)
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                doc_id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                title TEXT NOT NULL,
+                body TEXT NOT NULL,
+                url TEXT,
+                query TEXT,
+                added_at REAL NOT NULL
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+                title, body,
+                content='documents', content_rowid='rowid',
+                tokenize='unicode61 remove_diacritics 2',
+                prefix='2 3'
+            );
+            CREATE TRIGGER IF NOT EXISTS documents_ai AFTER INSERT ON documents BEGIN
+                INSERT INTO documents_fts(rowid, title, body) VALUES (new.rowid, new.title, new.body);
+            END;
+            CREATE TRIGGER IF NOT EXISTS documents_ad AFTER DELETE ON documents BEGIN
+                INSERT INTO documents_fts(documents_fts, rowid, title, body) VALUES ('delete', old.rowid, old.title, old.body);
+            END;
+            CREATE TRIGGER IF NOT EXISTS documents_au AFTER UPDATE ON documents BEGIN
+                INSERT INTO documents_fts(documents_fts, rowid, title, body) VALUES ('delete', old.rowid, old.title, old.body);
+                INSERT INTO documents_fts(rowid, title, body) VALUES (new.rowid, new.title, new.body);
+            END;
+        """)
+    return _conn
+
+
+def _add(documents):
+    """Insert or refresh (doc_id, kind, title, body, url, query) rows"""
+    now = time.time()
+    rows = [(doc_id, kind, title or '', body or '', url, query, now)
+            for doc_id, kind, title, body, url, query in documents if title or body]
+    if not rows:
+        return
+    try:
+        with _lock:
+            conn = _connect()
+            conn.execute("BEGIN")
+            conn.executemany("""
+                INSERT INTO documents (doc_id, kind, title, body, url, query, added_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(doc_id) DO UPDATE SET
+                    title = excluded.title, body = excluded.body, url = excluded.url,
+                    query = excluded.query, added_at = excluded.added_at
+            """, rows)
+            conn.execute("COMMIT")
+    except Exception as e:
+        print(f"Search index write error: {e}")
+
+
+def add_reddit_posts(posts, query=None):
+    """Index RedditPost records"""
+    _add((f"reddit:{post.id or post.permalink}", 'reddit', post.title, post.subreddit,
+          f"https://reddit.com{post.permalink}", query) for post in posts)
+
+
+def add_wikidata(results, query=None):
+    """Index search_wikidata results"""
+    _add((f"wikidata:{item.get('id')}", 'wikidata', item.get('label', ''), item.get('description', ''),
+          item.get('url'), query) for item in results)
+
+
+def add_overview(case_name, overview):
+    """Index a case overview under the case name it was generated for"""
+    _add([(f"overview:{' '.join(case_name.lower().split())}", 'overview', case_name, overview, None, case_name)])
+
+
+def _match_expression(text, operator):
+    """FTS5 query for free text: every token quoted, the last one matched as a prefix"""
+    tokens = _TOKEN.findall((text or '').lower())
+    if not tokens:
+        return None
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += '*'
+    return f" {operator} ".join(terms)
+
+
+def search(query, limit=10):
+    """BM25-ranked local matches for a query, best first.
+
+    All terms must match; if nothing does, any term may. Returns dicts with
+    kind, title, snippet and url.
+    """
+    sql = f"""
+        SELECT d.kind, d.title, snippet(documents_fts, 1, '**', '**', '...', 16), d.url
+        FROM documents_fts JOIN documents d ON d.rowid = documents_fts.rowid
+        WHERE documents_fts MATCH ?
+        ORDER BY bm25(documents_fts, {TITLE_WEIGHT}, {BODY_WEIGHT})
+        LIMIT ?
+    """
+    for operator in ('AND', 'OR'):
+        expression = _match_expression(query, operator)
+        if not expression:
+            return []
+        try:
+            with _lock:
+                rows = _connect().execute(sql, (expression, limit)).fetchall()
+        except Exception as e:
+            print(f"Search index query error: {e}")
+            return []
+        if rows:
+            return [{'kind': kind, 'title': title, 'snippet': snippet, 'url': url}
+                    for kind, title, snippet, url in rows]
+    return []
+
+
+def suggest(prefix, limit=8):
+    """Case names starting with (or containing words starting with) the typed text"""
+    expression = _match_expression(prefix, 'AND')
+    if not expression:
+        return []
+    placeholders = ", ".join("?" for _ in SUGGESTION_KINDS)
+    try:
+        with _lock:
+            rows = _connect().execute(f"""
+                SELECT d.title FROM documents_fts JOIN documents d ON d.rowid = documents_fts.rowid
+                WHERE documents_fts MATCH ? AND d.kind IN ({placeholders})
+                ORDER BY bm25(documents_fts, {TITLE_WEIGHT}, {BODY_WEIGHT})
+                LIMIT ?
+            """, (f"title : ({expression})", *SUGGESTION_KINDS, limit * 3)).fetchall()
+    except Exception as e:
+        print(f"Search index query error: {e}")
+        return []
+    return list(dict.fromkeys(title for (title,) in rows))[:limit]
@@ -0,0 +1,99 @@
+"""Shared Spotify Web API helpers"""
+import base64
+import threading
+import time
+
+import http_client
+import response_cache
+
+TOKEN_URL = "https://accounts.spotify.com/api/token"
+EPISODES_URL = "https://api.spotify.com/v1/episodes"
+MAX_IDS_PER_CALL = 50  # Spotify's limit for the multi-ID episodes endpoint
+
+# Refresh this many seconds before Spotify says the token expires
+TOKEN_REFRESH_MARGIN = 120
+
+# client_id -> {'access_token': ..., 'expires_at': monotonic seconds}
+_tokens = {}
+_tokens_lock = threading.Lock()
+
+
+def get_access_token(client_id, client_secret):
+    """Return a valid client-credentials token, shared by every session in the process.
+
+    The token is reused until shortly before its expires_in runs out and then
+    refreshed, so long sessions never hit 401s from an expired token. Raises
+    on auth failure.
+    """
+    with _tokens_lock:
+        cached = _tokens.get(client_id)
+        if cached and time.monotonic() < cached['expires_at'] - TOKEN_REFRESH_MARGIN:
+            return cached['access_token']
+
+        # Holding the lock while exchanging means concurrent sessions share one refresh
+        credentials = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
+        response = http_client.post(
+            TOKEN_URL,
+            headers={
+                "Authorization": f"Basic {credentials}",
+                "Content-Type": "application/x-www-form-urlencoded"
+            },
+            data={"grant_type": "client_credentials"},
+            timeout=10
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"Spotify auth failed with status {response.status_code}")
+
+        payload = response.json()
+        _tokens[client_id] = {
+            'access_token': payload['access_token'],
+            'expires_at': time.monotonic() + payload.get('expires_in', 3600)
+        }
+        return payload['access_token']
+
+
+def get_episode_shows(token, episode_ids, market="US"):
+    """Resolve episode IDs to their show in batches of 50.
+
+    Returns {episode_id: {'show_id': ..., 'show_name': ...}}. An episode never
+    changes show, so resolved entries are kept in the shared response cache
+    and repeat searches only look up episodes they haven't seen before.
+    """
+    shows = {}
+    missing = []
+    for episode_id in dict.fromkeys(episode_ids):
+        if not episode_id:
+            continue
+        cached = response_cache.get("spotify", response_cache.make_key("spotify", "episode_show", episode_id))
+        if cached:
+            shows[episode_id] = cached
+        else:
+            missing.append(episode_id)
+
+    headers = {"Authorization": f"Bearer {token}"}
+    for start in range(0, len(missing), MAX_IDS_PER_CALL):
+        batch = missing[start:start + MAX_IDS_PER_CALL]
+        try:
+            response = http_client.get(
+                EPISODES_URL,
+                headers=headers,
+                params={"ids": ",".join(batch), "market": market}
+            )
+            if response.status_code != 200:
+                print(f"Spotify episodes lookup error: {response.status_code}")
+                continue
+
+            for episode in response.json().get('episodes', []):
+                # Unavailable episodes come back as null entries
+                if not episode or 'show' not in episode:
+                    continue
+                show = {
+                    'show_id': episode['show'].get('id'),
+                    'show_name': episode['show'].get('name', 'Unknown Show')
+                }
+                shows[episode['id']] = show
+                response_cache.put("spotify", response_cache.make_key("spotify", "episode_show", episode['id']), show)
+        except Exception as e:
+            print(f"Spotify episodes lookup error: {e}")
+
+    return shows
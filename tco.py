@@ -1,12 +1,22 @@
 import streamlit as st
-import requests
 import pandas as pd
 from datetime import datetime, timedelta
 import time
 import openai
 import os
-import feedparser
 import random
+import http_client
+import llm_cache
+import llm_stream
+import podcast_feeds
+import ranking
+import records
+import response_cache
+import spotify_api
+import youtube_api
+import research
+import search_index
+import trending
 
 def ensure_persistent_auth():
     """Ensure authentication persists across all page interactions"""
@@ -16,26 +26,6 @@ def ensure_persistent_auth():
             st.session_state.authenticated = True
             st.session_state.auth_timestamp = datetime.now()
 
-# ============ DATA CACHING HELPERS ============
-def cache_with_expiry(key, data, hours=24):
-    """Cache data with expiration timestamp"""
-    st.session_state[key] = {
-        'data': data,
-        'cached_at': datetime.now(),
-        'expires_at': datetime.now() + timedelta(hours=hours)
-    }
-
-def get_cached_data(key):
-    """Get cached data if not expired"""
-    if key in st.session_state:
-        cache = st.session_state[key]
-        if isinstance(cache, dict) and 'expires_at' in cache:
-            if datetime.now() < cache['expires_at']:
-                return cache['data']
-            else:
-                del st.session_state[key]
-    return None
-
 # Initialize current page for navigation
 if 'current_page' not in st.session_state:
     st.session_state.current_page = "Case Search"
@@ -588,6 +578,19 @@ st.session_state.current_page = selected_page
 
 st.sidebar.markdown("---")
 
+# YouTube quota ledger (resets at midnight Pacific Time)
+youtube_usage = youtube_api.usage()
+st.sidebar.caption(f"YouTube quota: {youtube_usage['used']:,} / {youtube_api.DAILY_QUOTA:,} units used today")
+st.sidebar.progress(min(youtube_usage['used'] / youtube_api.DAILY_QUOTA, 1.0))
+if youtube_api.budget_low():
+    st.sidebar.caption("Quota is low - YouTube results are served from cache where possible")
+
+# LLM answer cache - identical prompts are answered without another paid call
+llm_usage = llm_cache.stats()
+st.sidebar.caption(f"AI answer cache: {llm_usage['hit_rate']:.0%} hit rate · ${llm_usage['saved']:,.2f} saved")
+refresh_llm = st.sidebar.checkbox("Refresh AI answers", value=False, key="refresh_llm",
+                                  help="Skip cached AI answers and ask the providers again")
+
 # ============ MAIN CONTENT ============
 
 # Simple header for the True Crime Research Hub
@@ -621,8 +624,7 @@ def get_top_comments(subreddit, post_id, limit=3):
   url = f"https://www.reddit.com/r/{subreddit}/comments/{post_id}.json"
   
   try:
-    time.sleep(2)
-    response = requests.get(url, headers=HEADERS, timeout=15)
+    response = http_client.get(url, headers=HEADERS, timeout=15)
     
     if response.status_code == 200:
       data = response.json()
@@ -641,6 +643,7 @@ def get_top_comments(subreddit, post_id, limit=3):
   
   return []
 
+@response_cache.cached("serper", text_args=("query",))
 def search_with_serper(query, api_key, search_type="search", num_results=10):
     """Search the web using Serper API for real-time information"""
     if not api_key:
@@ -668,7 +671,7 @@ def search_with_serper(query, api_key, search_type="search", num_results=10):
             'hl': 'en'
         }
         
-        response = requests.post(url, headers=headers, json=payload, timeout=10)
+        response = http_client.post(url, headers=headers, json=payload, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -691,7 +694,7 @@ def search_with_serper(query, api_key, search_type="search", num_results=10):
                 })
             
             # Also get news results
-            news_response = requests.post(
+            news_response = http_client.post(
                 "https://google.serper.dev/news",
                 headers=headers,
                 json={'q': enhanced_query, 'num': 5},
@@ -717,7 +720,7 @@ def search_with_serper(query, api_key, search_type="search", num_results=10):
         print(f"Serper search error: {e}")
         return None
 
-def search_with_perplexity(query, api_key, search_type="comprehensive"):
+def search_with_perplexity(query, api_key, search_type="comprehensive", refresh=False):
     """
     Use Perplexity AI to search and analyze information about a case
     search_type: "comprehensive", "quick", "news", "academic"
@@ -791,10 +794,9 @@ def search_with_perplexity(query, api_key, search_type="comprehensive"):
             Use academic and professional sources.
             """
         
-        # Make the API call to Perplexity
-        response = client.chat.completions.create(
-            model="sonar",  # Correct model name from Perplexity docs
-            messages=[
+        request = {
+            "model": "sonar",  # Correct model name from Perplexity docs
+            "messages": [
                 {
                     "role": "system",
                     "content": "You are a true crime researcher helping Bailey Sarian research cases for Murder, Mystery & Makeup. Provide accurate, detailed information with sources."
@@ -804,9 +806,23 @@ def search_with_perplexity(query, api_key, search_type="comprehensive"):
                     "content": prompt
                 }
             ],
-            temperature=0.2,  # Lower temperature for more factual responses
-            max_tokens=2000
-        )
+            "temperature": 0.2,  # Lower temperature for more factual responses
+            "max_tokens": 2000
+        }
+        
+        # "Latest news" answers go stale within hours, background research lasts days
+        use_case = "news" if search_type == "news" else "case_research"
+        summary = llm_cache.get(use_case, "perplexity", request, refresh=refresh)
+        if summary is not None:
+            return {
+                'summary': summary,
+                'model': request['model'],
+                'usage': None  # nothing was spent
+            }
+        
+        # Make the API call to Perplexity
+        response = client.chat.completions.create(**request)
+        llm_cache.put(use_case, "perplexity", request, response.choices[0].message.content, usage=response.usage)
         
         return {
             'summary': response.choices[0].message.content,
@@ -818,15 +834,43 @@ def search_with_perplexity(query, api_key, search_type="comprehensive"):
         st.error(f"Perplexity API Error: {str(e)}")
         return None
 
+def stream_episode_strategy(api_key, prompt, resume=False, refresh=False):
+    """Stream the episode strategy, saving each chunk to session state as it arrives.
+
+    If the stream breaks, the partial strategy stays in session state with
+    strategy_complete False; resume=True asks the model to continue it.
+    A strategy already generated for the identical prompt comes from the
+    LLM cache unless refresh=True.
+    """
+    request = {"model": "gpt-4", "messages": [{"role": "user", "content": prompt}], "max_tokens": 1500, "temperature": 0.7}
+    messages = request["messages"]
+    if resume:
+        messages = llm_stream.resume_messages(messages, st.session_state.generated_strategy)
+    else:
+        st.session_state.generated_strategy = ""
+        cached = llm_cache.get("episode_strategy", "openai", request, refresh=refresh)
+        if cached:
+            st.session_state.generated_strategy = cached
+            st.session_state.strategy_complete = True
+            yield cached
+            return
+    st.session_state.strategy_complete = False
+    
+    for text in llm_stream.stream_chat(api_key, messages, model=request["model"],
+                                       max_tokens=request["max_tokens"], temperature=request["temperature"]):
+        st.session_state.generated_strategy += text
+        yield text
+    st.session_state.strategy_complete = True
+    llm_cache.put("episode_strategy", "openai", request, st.session_state.generated_strategy)
+
 # Enhanced Case Overview with consistent template for creators
 
-def get_perplexity_case_analysis(case_name, perplexity_api_key):
+def get_perplexity_case_analysis(case_name, perplexity_api_key, refresh=False):
     """Get comprehensive case analysis using Perplexity's online model with creator-focused template"""
     if not perplexity_api_key:
         return None
     
     try:
-        import requests
         import json
         import re
         
@@ -885,27 +929,31 @@ IMPORTANT RULES:
             "max_tokens": 2000
         }
         
-        response = requests.post(url, headers=headers, json=data)
-        
-        if response.status_code == 200:
-            result = response.json()
-            content = result['choices'][0]['message']['content']
+        # Identical prompts are answered from the LLM cache unless a refresh is asked for
+        content = llm_cache.get("case_overview", "perplexity", data, refresh=refresh)
+        if content is None:
+            response = http_client.post(url, headers=headers, json=data, timeout=60, coalesce=True)
             
-            # Clean up any numbered citations
-            content = re.sub(r'\[\d+\](\[\d+\])*', '', content)
-            
-            # Check if no crime case was found
-            if "not a true crime case" in content.lower():
-                return {
-                    'overview': f"⚠️ **Not a True Crime Case**\n\n{content}\n\n**Suggestions:**\n- Try a different spelling\n- Add context (e.g., 'murder victim' or 'disappeared')\n- Include location or timeframe\n- Search for the actual crime rather than related people"
-                }
+            if response.status_code != 200:
+                print(f"Perplexity API error: {response.status_code} - {response.text}")
+                return None
             
+            result = response.json()
+            content = result['choices'][0]['message']['content']
+            llm_cache.put("case_overview", "perplexity", data, content, usage=result.get('usage'))
+        
+        # Clean up any numbered citations
+        content = re.sub(r'\[\d+\](\[\d+\])*', '', content)
+        
+        # Check if no crime case was found
+        if "not a true crime case" in content.lower():
             return {
-                'overview': content
+                'overview': f"⚠️ **Not a True Crime Case**\n\n{content}\n\n**Suggestions:**\n- Try a different spelling\n- Add context (e.g., 'murder victim' or 'disappeared')\n- Include location or timeframe\n- Search for the actual crime rather than related people"
             }
-        else:
-            print(f"Perplexity API error: {response.status_code} - {response.text}")
-            return None
+        
+        return {
+            'overview': content
+        }
             
     except Exception as e:
         print(f"Perplexity API error: {str(e)}")
@@ -933,6 +981,36 @@ def format_case_overview(raw_overview):
     
     return raw_overview
             
+def stream_reddit_by_keywords(query, subreddits, limit=5):
+  """Search several subreddits at once, yielding (subreddit, top posts so far) as each lands.
+
+  Requests share the Reddit rate limiter in http_client, so the fan-out
+  only removes the waiting between them. The searches run on research's
+  "reddit" pool. The last yield holds the final top limit*3 posts by score.
+  """
+  def search_subreddit(subreddit):
+    search_url = f"https://www.reddit.com/r/{subreddit}/search.json"
+    params = {
+      'q': query,
+      'restrict_sr': 'true',
+      'sort': 'top',
+      't': 'day',
+      'limit': limit
+    }
+    response = http_client.get(search_url, headers=HEADERS, params=params, timeout=15)
+    if response.status_code != 200:
+      return []
+    posts = response.json().get('data', {}).get('children', [])
+    return [records.RedditPost.from_reddit(post['data'], subreddit) for post in posts]
+  
+  best = ranking.TopK(limit * 3, key=lambda x: x.score)
+  tasks = {subreddit: (lambda subreddit=subreddit: search_subreddit(subreddit)) for subreddit in subreddits}
+  for subreddit, posts, error in research.fan_out(tasks, pool="reddit"):
+    if error is None:
+      best.extend(posts)
+    yield subreddit, best.items()
+
+@response_cache.cached("reddit", text_args=("query",))
 def search_reddit_by_keywords(query, subreddits, limit=5):
   """Search Reddit for posts containing specific keywords"""
   all_results = []
@@ -948,51 +1026,137 @@ def search_reddit_by_keywords(query, subreddits, limit=5):
         'limit': limit * 2,
         'type': 'link'
       }
-      time.sleep(2)
-      response = requests.get(search_url, headers=HEADERS, params=params, timeout=15)
+      response = http_client.get(search_url, headers=HEADERS, params=params, timeout=15)
       
       if response.status_code == 200:
         data = response.json()
         if 'data' in data and 'children' in data['data']:
           posts = data['data']['children']
-          for post in posts:
-            post['data']['source_subreddit'] = post['data']['subreddit']
-          all_results.extend(posts)
+          all_results.extend(records.RedditPost.from_reddit(post['data']) for post in posts)
     except:
       # Fallback to popular subreddits if all Reddit search fails
       subreddits = ["Conservative", "Politics", "News", "WorldNews", "AskReddit", "PublicFreakout"]
   
-  # Search specific subreddits
+  # Search specific subreddits concurrently
   if subreddits != ["all"]:
-    for subreddit in subreddits:
-      try:
-        search_url = f"https://www.reddit.com/r/{subreddit}/search.json"
+    top_results = []
+    for _, top_results in stream_reddit_by_keywords(query, subreddits, limit):
+      pass
+    return top_results
+  
+  # Return the top results by score
+  return ranking.top_k(all_results, limit * 3, key=lambda x: x.score)
+
+@response_cache.cached("reddit", text_args=("case_name",))
+def search_reddit_for_case(case_name):
+    """Search all of Reddit for posts about a case.
+
+    Pushshift, the Reddit search variations and the true crime subreddit
+    searches are raced together. Results are taken in that priority order
+    until there are enough, so the last-name-only subreddit searches only
+    fill gaps, then sorted by score.
+    """
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+    }
+    
+    def pushshift():
+        # Pushshift (Reddit archive) has the best search but is often down
+        params = {
+            'q': case_name,
+            'size': 100,
+            'sort': 'score',
+            'sort_type': 'desc'
+        }
+        response = http_client.get("https://api.pushshift.io/reddit/search/submission/", params=params, timeout=10)
+        if response.status_code != 200:
+            return []
+        return [records.RedditPost.from_pushshift(item) for item in response.json().get('data', [])]
+    
+    def reddit_search(search_term):
+        # Search across all Reddit
         params = {
-          'q': query,
-          'restrict_sr': 'true',
-          'sort': 'top',
-          't': 'day',
-          'limit': limit
+            'q': f'{search_term} (murder OR killer OR crime OR death)',  # Add context
+            'sort': 'relevance',
+            'limit': 100,
+            't': 'all',
+            'type': 'link',
+            'raw_json': 1
         }
-        time.sleep(2)
-        response = requests.get(search_url, headers=HEADERS, params=params, timeout=15)
+        response = http_client.get("https://www.reddit.com/search.json", headers=headers, params=params, timeout=15)
+        if response.status_code != 200:
+            return []
+        results = []
+        for post in response.json().get('data', {}).get('children', []):
+            title_lower = post['data']['title'].lower()
+            
+            # Check if relevant to our search
+            if any(word.lower() in title_lower for word in case_name.split()):
+                results.append(records.RedditPost.from_reddit(post['data']))
+        return results
+    
+    def subreddit_search(subreddit):
+        params = {
+            'q': case_name.split()[-1],  # Just last name
+            'restrict_sr': 'on',
+            'sort': 'relevance',
+            'limit': 50,
+            't': 'all',
+            'raw_json': 1
+        }
+        response = http_client.get(f"https://www.reddit.com/r/{subreddit}/search.json", headers=headers, params=params, timeout=10)
+        if response.status_code != 200:
+            return []
+        return [records.RedditPost.from_reddit(post['data'])
+                for post in response.json().get('data', {}).get('children', [])]
+    
+    reddit_results = []
+    try:
+        # Search variations to improve results
+        search_variations = [
+            case_name,  # Full name
+            ' '.join(case_name.split()[:2]) if len(case_name.split()) > 2 else case_name,  # First two words
+            case_name.split()[-1] if len(case_name.split()) > 1 else case_name,  # Last word only
+        ]
+        crime_subreddits = ["serialkillers", "TrueCrime", "UnresolvedMysteries"]
         
-        if response.status_code == 200:
-          data = response.json()
-          if 'data' in data and 'children' in data['data']:
-            posts = data['data']['children']
+        tasks = [('pushshift', pushshift)]
+        tasks += [(f"search:{term}", lambda term=term: reddit_search(term)) for term in dict.fromkeys(search_variations)]
+        tasks += [(f"r/{subreddit}", lambda subreddit=subreddit: subreddit_search(subreddit)) for subreddit in crime_subreddits]
+        
+        # Fill from the highest-priority sources first, skipping duplicates
+        seen = set()
+        for _, posts in research.hedge(tasks, enough=20):
             for post in posts:
-              post['data']['source_subreddit'] = subreddit
-            all_results.extend(posts)
-      except:
-        continue
-  
-  # Sort by score and return top results
-  all_results.sort(key=lambda x: x['data']['score'], reverse=True)
-  return all_results[:limit * 3]
+                post_id = post.id or post.title
+                if post_id not in seen:
+                    seen.add(post_id)
+                    reddit_results.append(post)
+            if len(reddit_results) >= 20:
+                break
+
+        # Keep the top 20 by score
+        reddit_results = ranking.top_k(reddit_results, 20, key=lambda x: x.score)
+
+    except Exception as e:
+        print(f"Reddit search error: {e}")
+    
+    return reddit_results
+
+def display_reddit_posts(reddit_results):
+    """Render Case Search Reddit results (top 10)"""
+    if reddit_results:
+        for post in reddit_results[:10]:
+            st.write(f"**{post.title}**")
+            st.caption(f"r/{post.get('source_subreddit', 'unknown')} - {post.score} upvotes")
+            st.write(f"[View](https://reddit.com{post.permalink})")
+            st.write("---")
+    else:
+        st.info("No Reddit discussions found")
 
 # ============ TRUE CRIME RESEARCH API FUNCTIONS ============
 
+@response_cache.cached("wikidata", text_args=("query",))
 def search_wikidata(query, limit=25):
     """Search Wikidata for people, cases, or events"""
     url = "https://www.wikidata.org/w/api.php"
@@ -1006,7 +1170,7 @@ def search_wikidata(query, limit=25):
     }
     
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = http_client.get(url, params=params, timeout=10)
         if response.status_code == 200:
             data = response.json()
             all_results = []
@@ -1028,6 +1192,7 @@ def search_wikidata(query, limit=25):
     
     return []
 
+@response_cache.cached("wikipedia")
 def get_wikipedia_content(article_title, max_chars=3000):
     """Fetch actual Wikipedia article content"""
     import urllib.parse
@@ -1046,7 +1211,7 @@ def get_wikipedia_content(article_title, max_chars=3000):
     }
     
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = http_client.get(url, params=params, timeout=10)
         if response.status_code == 200:
             data = response.json()
             pages = data.get("query", {}).get("pages", {})
@@ -1058,7 +1223,7 @@ def get_wikipedia_content(article_title, max_chars=3000):
     
     return ""
 
-def search_with_gemini(query, gemini_api_key):
+def search_with_gemini(query, gemini_api_key, refresh=False):
     """Use Gemini with grounding to search the real-time web"""
     if not gemini_api_key:
         return None
@@ -1089,10 +1254,10 @@ Please search for and provide:
 Focus on true crime, murder cases, or criminal activities if applicable.
 Include specific dates, locations, and verified facts from your web search."""
 
-        # Generate with grounding enabled
-        response = model.generate_content(search_prompt)
-        
-        return response.text
+        # Generate with grounding enabled - identical searches are served from the LLM cache
+        request = {"model": "gemini-1.5-flash-latest", "tools": ["google_search_retrieval"], "prompt": search_prompt}
+        return llm_cache.cached_call("web_search", "gemini", request,
+                                     lambda: model.generate_content(search_prompt).text, refresh=refresh)
         
     except Exception as e:
         print(f"Gemini search error: {e}")
@@ -1110,6 +1275,7 @@ Focus on any criminal cases, murders, or true crime connections."""
             
         except Exception as e2:
             return f"Error: {str(e2)}"    
+@response_cache.cached("courtlistener", text_args=("query",))
 def search_courtlistener(query, limit=20):
     """Search CourtListener for court documents and opinions"""
     url = "https://www.courtlistener.com/api/rest/v3/search/"
@@ -1120,7 +1286,7 @@ def search_courtlistener(query, limit=20):
     }
     
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = http_client.get(url, params=params, timeout=10)
         if response.status_code == 200:
             data = response.json()
             results = []
@@ -1142,21 +1308,12 @@ def count_youtube_videos(query, youtube_key):
     if not youtube_key:
         return 0
     
-    url = "https://www.googleapis.com/youtube/v3/search"
-    params = {
-        "key": youtube_key,
-        "part": "id",
-        "q": query,
-        "type": "video",
-        "maxResults": 50  # Just to get a count
-    }
-    
     try:
-        response = requests.get(url, params=params, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
+        # Shares one cached search with the YouTube tab; skipped when the quota is low
+        result = youtube_api.search_videos(query, youtube_key)
+        if result:
             # Total results gives us an estimate
-            return data.get("pageInfo", {}).get("totalResults", 0)
+            return result['total_results']
     except:
         pass
     return 0
@@ -1219,7 +1376,7 @@ def calculate_real_case_score(case_data):
     
     return max(0, min(100, score))
 
-def analyze_with_ai(post_title, post_content, comments, api_key, creator_name, image_url=None):
+def analyze_with_ai(post_title, post_content, comments, api_key, creator_name, image_url=None, refresh=False):
   """Analyze post and comments with OpenAI"""
   if not api_key:
     return None
@@ -1259,14 +1416,18 @@ CONTROVERSY LEVEL: How polarizing this content would be for {creator_name} (1-10
 
 Important: Base your analysis on {creator_name}'s actual known personality, political positions, and communication style."""
 
+  request = {
+    "model": "gpt-4.1-nano",
+    "messages": [{"role": "user", "content": creator_prompt}],
+    "max_tokens": 600
+  }
+  
   try:
-    response = openai.ChatCompletion.create(
-      model="gpt-4.1-nano",
-      messages=[{"role": "user", "content": creator_prompt}],
-      max_tokens=600,
-      timeout=20
+    return llm_cache.cached_call(
+      "post_analysis", "openai", request,
+      lambda: openai.ChatCompletion.create(timeout=20, **request).choices[0].message.content,
+      refresh=refresh
     )
-    return response.choices[0].message.content
   except Exception as e:
     return f"AI Analysis Error: {str(e)}"
 
@@ -1341,7 +1502,7 @@ def search_youtube_videos(query, api_key=None, max_results=10, timeframe="week",
         'key': api_key
       }
       
-      channel_response = requests.get(search_url, params=channel_params, timeout=15)
+      channel_response = youtube_api.get(search_url, params=channel_params, timeout=15)
       
       if channel_response.status_code == 200:
         channel_data = channel_response.json()
@@ -1370,11 +1531,13 @@ def search_youtube_videos(query, api_key=None, max_results=10, timeframe="week",
           
           video_params['publishedAfter'] = published_after
           
-          video_response = requests.get(search_url, params=video_params, timeout=15)
+          video_response = youtube_api.get(search_url, params=video_params, timeout=15)
           
           if video_response.status_code == 200:
             video_data = video_response.json()
             search_results = []
+            video_ids = [item.get('id', {}).get('videoId', '') for item in video_data.get('items', [])]
+            video_stats = youtube_api.get_video_stats(video_ids, api_key)
             
             for item in video_data.get('items', []):
               snippet = item.get('snippet', {})
@@ -1382,11 +1545,11 @@ def search_youtube_videos(query, api_key=None, max_results=10, timeframe="week",
               video_data_item = {
                 'title': snippet.get('title', 'No title'),
                 'channel': snippet.get('channelTitle', 'Unknown Channel'),
-                'published': format_youtube_date(snippet.get('publishedAt', 'Unknown')),
+                'published': youtube_api.format_date(snippet.get('publishedAt', 'Unknown')),
                 'video_id': item.get('id', {}).get('videoId', ''),
                 'description': snippet.get('description', '')[:200] + '...' if snippet.get('description') else '',
                 'thumbnail': snippet.get('thumbnails', {}).get('medium', {}).get('url', ''),
-                'views': get_video_views(item.get('id', {}).get('videoId', ''), api_key)
+                'views': youtube_api.format_views(video_stats.get(item.get('id', {}).get('videoId', '')))
               }
               search_results.append(video_data_item)
             
@@ -1415,11 +1578,13 @@ def search_youtube_videos(query, api_key=None, max_results=10, timeframe="week",
         'publishedAfter': published_after
       }
       
-      response = requests.get(url, params=params, timeout=15)
+      response = youtube_api.get(url, params=params, timeout=15)
       
       if response.status_code == 200:
         data = response.json()
         search_results = []
+        video_ids = [item.get('id', {}).get('videoId', '') for item in data.get('items', [])]
+        video_stats = youtube_api.get_video_stats(video_ids, api_key)
         
         for item in data.get('items', []):
           snippet = item.get('snippet', {})
@@ -1427,11 +1592,11 @@ def search_youtube_videos(query, api_key=None, max_results=10, timeframe="week",
           video_data = {
             'title': snippet.get('title', 'No title'),
             'channel': snippet.get('channelTitle', 'Unknown Channel'),
-            'published': format_youtube_date(snippet.get('publishedAt', 'Unknown')),
+            'published': youtube_api.format_date(snippet.get('publishedAt', 'Unknown')),
             'video_id': item.get('id', {}).get('videoId', ''),
             'description': snippet.get('description', '')[:200] + '...' if snippet.get('description') else '',
             'thumbnail': snippet.get('thumbnails', {}).get('medium', {}).get('url', ''),
-            'views': get_video_views(item.get('id', {}).get('videoId', ''), api_key)
+            'views': youtube_api.format_views(video_stats.get(item.get('id', {}).get('videoId', '')))
           }
           search_results.append(video_data)
         
@@ -1465,54 +1630,6 @@ def search_youtube_videos(query, api_key=None, max_results=10, timeframe="week",
     st.error(f"YouTube search error: {str(e)}")
     return []  # Return empty list, no sample data
     
-def get_video_views(video_id, api_key):
-    """Get view count for a specific video"""
-    if not api_key or not video_id or video_id.startswith('sample'):
-        return "N/A"
-    
-    try:
-        url = "https://www.googleapis.com/youtube/v3/videos"
-        params = {
-            'part': 'statistics',
-            'id': video_id,
-            'key': api_key
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('items') and len(data['items']) > 0:
-                stats = data['items'][0].get('statistics', {})
-                view_count = stats.get('viewCount')
-                if view_count:
-                    views = int(view_count)
-                    if views >= 1000000:
-                        return f"{views/1000000:.1f}M views"
-                    elif views >= 1000:
-                        return f"{views/1000:.0f}K views"
-                    else:
-                        return f"{views:,} views"
-        return "N/A"
-    except:
-        return "N/A"
-
-def format_youtube_date(date_string):
-    """Convert YouTube API date to MM/DD/YY format"""
-    if not date_string or date_string in ['Unknown', 'N/A']:
-        return date_string
-    
-    try:
-        from datetime import datetime
-        if 'T' in date_string:
-            clean_date = date_string.replace('Z', '').split('T')[0]
-            dt = datetime.strptime(clean_date, '%Y-%m-%d')
-        else:
-            dt = datetime.fromisoformat(date_string.replace('Z', '+00:00'))
-        return dt.strftime('%m/%d/%y')
-    except:
-        return date_string
-
 def get_video_by_id(video_id, api_key=None):
   """Get a specific YouTube video by ID"""
   if not api_key:
@@ -1526,7 +1643,7 @@ def get_video_by_id(video_id, api_key=None):
       'key': api_key
     }
     
-    response = requests.get(url, params=params, timeout=15)
+    response = youtube_api.get(url, params=params, timeout=15)
     
     if response.status_code == 200:
       data = response.json()
@@ -1538,8 +1655,8 @@ def get_video_by_id(video_id, api_key=None):
         return {
           'title': snippet.get('title', 'No title'),
           'channel': snippet.get('channelTitle', 'Unknown Channel'),
-          'published': format_youtube_date(snippet.get('publishedAt', 'Unknown')),
-          'views': get_video_views(item.get('id', ''), youtube_api_key),
+          'published': youtube_api.format_date(snippet.get('publishedAt', 'Unknown')),
+          'views': youtube_api.format_views(stats),
           'video_id': video_id,
           'description': snippet.get('description', '')[:200] + '...' if snippet.get('description') else '',
           'thumbnail': snippet.get('thumbnails', {}).get('medium', {}).get('url', '')
@@ -1552,35 +1669,12 @@ def get_video_by_id(video_id, api_key=None):
 # ============ SPOTIFY API FUNCTIONS ============
 
 def get_spotify_token(client_id, client_secret):
-    """Get Spotify access token using Client Credentials Flow"""
+    """Get a Spotify access token from the shared, expiry-aware token manager"""
     if not client_id or not client_secret:
         return None
     
     try:
-        import base64
-        
-        # Encode credentials
-        credentials = f"{client_id}:{client_secret}"
-        encoded_credentials = base64.b64encode(credentials.encode()).decode()
-        
-        # Get token
-        url = "https://accounts.spotify.com/api/token"
-        headers = {
-            "Authorization": f"Basic {encoded_credentials}",
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
-        data = {
-            "grant_type": "client_credentials"
-        }
-        
-        response = requests.post(url, headers=headers, data=data)
-        
-        if response.status_code == 200:
-            return response.json()['access_token']
-        else:
-            st.error(f"❌ Spotify Auth Error: {response.status_code}")
-            return None
-            
+        return spotify_api.get_access_token(client_id, client_secret)
     except Exception as e:
         st.error(f"❌ Spotify Token Error: {str(e)}")
         return None
@@ -1617,7 +1711,7 @@ def search_podcasts_by_genre(token, genre="all", limit=10):
         
         url = "https://api.spotify.com/v1/search"
         
-        response = requests.get(url, headers=headers, params=params)
+        response = http_client.get(url, headers=headers, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -1649,7 +1743,7 @@ def search_podcasts_by_genre(token, genre="all", limit=10):
                 search_query = f"{genre} podcast"
                 params['q'] = search_query
                 
-                response = requests.get(url, headers=headers, params=params)
+                response = http_client.get(url, headers=headers, params=params)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -1696,7 +1790,7 @@ def get_show_episodes(token, show_id, limit=10):
             "market": "US"
         }
         
-        response = requests.get(url, headers=headers, params=params)
+        response = http_client.get(url, headers=headers, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -1736,7 +1830,7 @@ def search_podcasts_by_topic(token, topic, limit=20):
             "market": "US"
         }
         
-        response = requests.get(url, headers=headers, params=params)
+        response = http_client.get(url, headers=headers, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -1744,14 +1838,10 @@ def search_podcasts_by_topic(token, topic, limit=20):
             
             items = data.get('episodes', {}).get('items', [])
             
-            # First, collect all episodes with their show IDs
+            # First, collect the episodes - search results omit the show, so it is resolved in a batch below
             episode_list = []
-            show_ids = set()
             
             for ep in items:
-                # Extract show ID from the episode href
-                # The href looks like: "https://api.spotify.com/v1/episodes/6FjEzvYK4hXVhV1X5hh2XP"
-                # We need to get the show ID by fetching the full episode details
                 episode_id = ep.get('id', '')
                 
                 episode_data = {
@@ -1767,22 +1857,11 @@ def search_podcasts_by_topic(token, topic, limit=20):
                 }
                 episode_list.append(episode_data)
             
-            # Now fetch full episode details to get show IDs
-            for i, ep_data in enumerate(episode_list):
-                if ep_data['id']:
-                    ep_url = f"https://api.spotify.com/v1/episodes/{ep_data['id']}"
-                    ep_response = requests.get(ep_url, headers=headers, params={"market": "US"})
-                    
-                    if ep_response.status_code == 200:
-                        full_episode = ep_response.json()
-                        if 'show' in full_episode:
-                            show_id = full_episode['show'].get('id')
-                            show_name = full_episode['show'].get('name', 'Unknown Show')
-                            episode_list[i]['show_id'] = show_id
-                            episode_list[i]['show_name'] = show_name
-                        
-                        # Small delay to respect rate limits
-                        time.sleep(0.1)
+            # Resolve every episode's show with batched multi-ID lookups
+            episode_shows = spotify_api.get_episode_shows(token, [ep_data['id'] for ep_data in episode_list])
+            for ep_data in episode_list:
+                if ep_data['id'] in episode_shows:
+                    ep_data.update(episode_shows[ep_data['id']])
             
             return episode_list
             
@@ -1812,7 +1891,7 @@ def get_new_episodes_today(token, limit=20):
             "market": "US"
         }
         
-        response = requests.get(url, headers=headers, params=params)
+        response = http_client.get(url, headers=headers, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -1840,6 +1919,7 @@ def get_new_episodes_today(token, limit=20):
     except Exception as e:
         return None
     
+@response_cache.cached("itunes")
 def get_itunes_top_podcasts(genre_id=None, limit=20):
     """Get top podcasts from iTunes/Apple Podcasts"""
     try:
@@ -1872,7 +1952,7 @@ def get_itunes_top_podcasts(genre_id=None, limit=20):
         else:
             url = f"https://itunes.apple.com/us/rss/toppodcasts/limit={limit}/json"
         
-        response = requests.get(url, timeout=10)
+        response = http_client.get(url, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -1904,46 +1984,18 @@ def get_itunes_top_podcasts(genre_id=None, limit=20):
 
 def get_itunes_podcast_episodes(podcast_id, limit=5):
     """Get recent episodes for a specific podcast from iTunes"""
-    try:
-        # iTunes lookup API to get podcast details and feed URL
-        lookup_url = f"https://itunes.apple.com/lookup?id={podcast_id}"
-        response = requests.get(lookup_url, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('results'):
-                podcast_info = data['results'][0]
-                feed_url = podcast_info.get('feedUrl')
-                
-                if feed_url:
-                    # Parse the podcast RSS feed
-                    feed = feedparser.parse(feed_url)
-                    episodes = []
-                    
-                    for entry in feed.entries[:limit]:
-                        episode_data = {
-                            'title': entry.get('title', 'Unknown'),
-                            'published': entry.get('published', 'Unknown'),
-                            'duration': entry.get('itunes_duration', 'Unknown'),
-                            'description': entry.get('summary', '')[:300] + '...',
-                            'link': entry.get('link', '')
-                        }
-                        episodes.append(episode_data)
-                    
-                    return episodes
-        return []
-    except:
-        return []
+    return podcast_feeds.get_podcast_episodes(podcast_id, limit=limit)
   
     
 # ============ TMDB API FUNCTIONS ============
 
+@response_cache.cached("tmdb")
 def get_tmdb_genres(api_key, media_type='movie'):
     """Get list of genres from TMDb"""
     try:
         url = f"https://api.themoviedb.org/3/genre/{media_type}/list"
         params = {'api_key': api_key}
-        response = requests.get(url, params=params)
+        response = http_client.get(url, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -1952,6 +2004,7 @@ def get_tmdb_genres(api_key, media_type='movie'):
     except:
         return {}
 
+@response_cache.cached("tmdb", text_args=("query",))
 def search_tmdb(api_key, query=None, media_type='movie', genre_id=None, year=None, 
                 company_id=None, sort_by='popularity.desc', page=1):
     """Search TMDb for movies or TV shows"""
@@ -1985,7 +2038,7 @@ def search_tmdb(api_key, query=None, media_type='movie', genre_id=None, year=Non
             if company_id:
                 params['with_companies'] = company_id
         
-        response = requests.get(url, params=params)
+        response = http_client.get(url, params=params)
         
         if response.status_code == 200:
             return response.json()
@@ -1994,6 +2047,7 @@ def search_tmdb(api_key, query=None, media_type='movie', genre_id=None, year=Non
         st.error(f"TMDb API Error: {str(e)}")
         return None
 
+@response_cache.cached("tmdb")
 def get_tmdb_item_details(api_key, item_id, media_type='movie'):
     """Get detailed information about a movie or TV show"""
     try:
@@ -2003,7 +2057,7 @@ def get_tmdb_item_details(api_key, item_id, media_type='movie'):
             'append_to_response': 'credits,videos,keywords'
         }
         
-        response = requests.get(url, params=params)
+        response = http_client.get(url, params=params)
         
         if response.status_code == 200:
             return response.json()
@@ -2011,130 +2065,6 @@ def get_tmdb_item_details(api_key, item_id, media_type='movie'):
     except:
         return None
 
-# First, add this function with your other YouTube functions (before the platform section):
-
-def get_video_views(video_id, api_key):
-    """Get view count for a specific video"""
-    if not api_key or not video_id or video_id.startswith('sample'):
-        return "N/A"
-    
-    try:
-        url = "https://www.googleapis.com/youtube/v3/videos"
-        params = {
-            'part': 'statistics',
-            'id': video_id,
-            'key': api_key
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('items') and len(data['items']) > 0:
-                stats = data['items'][0].get('statistics', {})
-                view_count = stats.get('viewCount')
-                if view_count:
-                    # Format view count nicely (e.g., 1,234,567 -> 1.2M)
-                    try:
-                        views = int(view_count)
-                        if views >= 1000000:
-                            return f"{views/1000000:.1f}M views"
-                        elif views >= 1000:
-                            return f"{views/1000:.0f}K views"
-                        else:
-                            return f"{views:,} views"
-                    except:
-                        return f"{view_count} views"
-        return "N/A"
-    except Exception as e:
-        print(f"Error fetching views for {video_id}: {e}")
-        return "N/A"
-
-def format_youtube_date(date_string):
-    """Convert YouTube API date to MM/DD/YY format"""
-    if not date_string or date_string in ['Unknown', 'N/A'] or date_string.startswith('sample'):
-        return date_string
-    
-    try:
-        from datetime import datetime
-        # Handle both formats: 2025-08-08T14:00:36Z and other ISO formats
-        if 'T' in date_string:
-            # Remove timezone info and parse
-            clean_date = date_string.replace('Z', '').split('T')[0]
-            dt = datetime.strptime(clean_date, '%Y-%m-%d')
-        else:
-            dt = datetime.fromisoformat(date_string.replace('Z', '+00:00'))
-        
-        return dt.strftime('%m/%d/%y')
-    except Exception as e:
-        print(f"Error formatting date {date_string}: {e}")
-        return date_string
-    """Search YouTube for recent videos from a specific channel"""
-    if not api_key:
-        # Return sample channel results
-        sample_results = [
-            {"title": f"Latest Video from {channel_name}", "views": "156K views", "published": "2 days ago", "description": f"Recent content from {channel_name}...", "video_id": f"sample_{channel_name}_1"},
-            {"title": f"{channel_name}'s Hot Take on Current Events", "views": "89K views", "published": "1 day ago", "description": f"Commentary and analysis from {channel_name}...", "video_id": f"sample_{channel_name}_2"},
-            {"title": f"Breaking: {channel_name} Responds", "views": "234K views", "published": "3 hours ago", "description": f"Response video from {channel_name}...", "video_id": f"sample_{channel_name}_3"},
-        ]
-        return sample_results
-    
-    try:
-        # First, get the channel ID
-        search_url = "https://www.googleapis.com/youtube/v3/search"
-        search_params = {
-            'part': 'snippet',
-            'q': channel_name,
-            'type': 'channel',
-            'maxResults': 1,
-            'key': api_key
-        }
-        
-        search_response = requests.get(search_url, params=search_params, timeout=15)
-        
-        if search_response.status_code == 200:
-            search_data = search_response.json()
-            if search_data.get('items'):
-                channel_id = search_data['items'][0]['id']['channelId']
-                
-                # Now get recent videos from this channel
-                videos_url = "https://www.googleapis.com/youtube/v3/search"
-                videos_params = {
-                    'part': 'snippet',
-                    'channelId': channel_id,
-                    'type': 'video',
-                    'order': 'date',
-                    'maxResults': max_results,
-                    'key': api_key,
-                    'publishedAfter': (datetime.now() - timedelta(days=30)).isoformat() + 'Z'
-                }
-                
-                videos_response = requests.get(videos_url, params=videos_params, timeout=15)
-                
-                if videos_response.status_code == 200:
-                    videos_data = videos_response.json()
-                    channel_videos = []
-                    
-                    for item in videos_data.get('items', []):
-                        snippet = item.get('snippet', {})
-                        video_data = {
-                            'title': snippet.get('title', 'No title'),
-                            'published': snippet.get('publishedAt', 'Unknown'),
-                            'video_id': item.get('id', {}).get('videoId', ''),
-                            'description': snippet.get('description', '')[:200] + '...' if snippet.get('description') else '',
-                            'channel': snippet.get('channelTitle', channel_name),
-                            'views': 'N/A'  # Would need additional API call to get view count
-                        }
-                        channel_videos.append(video_data)
-                    
-                    return channel_videos
-        
-        # Fallback to sample data if API fails
-        return search_youtube_by_channel(channel_name)
-        
-    except Exception as e:
-        return search_youtube_by_channel(channel_name)  # Return sample data on error
-
 
 # Get the API keys
 api_key, youtube_api_key, spotify_client_id, spotify_client_secret, tmdb_key, gemini_api_key, serper_api_key, perplexity_api_key, courtlistener_token = get_api_keys()
@@ -2162,170 +2092,100 @@ if st.session_state.current_page == "Case Search":
             key="time_period_filter"
         )
     
+    # Prefix suggestions from cases researched before
+    suggestions = [name for name in search_index.suggest(case_search, 5)
+                   if name.lower() != case_search.strip().lower()] if case_search else []
+    if suggestions:
+        def use_suggestion(name):
+            st.session_state.case_search_input = name
+        
+        st.caption("Previously researched:")
+        suggestion_cols = st.columns(len(suggestions))
+        for i, name in enumerate(suggestions):
+            suggestion_cols[i].button(name, key=f"case_suggestion_{i}", on_click=use_suggestion, args=(name,))
+    
     if st.button("SEARCH", key="search_cases_btn", type="primary", use_container_width=True):
         if not case_search:
             st.warning("Please enter a search term")
         else:
-            # Create a progress bar and status text (no spinner)
+            # Launch every source at once and fill in progress as each one lands
             progress_bar = st.progress(0)
             status_text = st.empty()
+            status_text.text("Searching YouTube, case overview and Reddit...")
+            
+            # Local index hits show instantly while the network sources run
+            local_hits = search_index.search(case_search)
+            local_slot = st.empty()
+            if local_hits:
+                with local_slot.container():
+                    st.markdown(f"**Instant matches from earlier research ({len(local_hits)})**")
+                    for hit in local_hits:
+                        st.caption(f"{search_index.KIND_LABELS[hit['kind']]} · **{hit['title']}** — {hit['snippet']}")
+            
+            research_tasks = {
+                'youtube': lambda: count_youtube_videos(case_search, youtube_api_key) if youtube_api_key else 0,
+                'overview': lambda: get_perplexity_case_analysis(case_search, perplexity_api_key, refresh=refresh_llm) if perplexity_api_key else None,
+                'reddit': lambda: search_reddit_for_case(case_search),
+            }
+            source_labels = {'youtube': "YouTube", 'overview': "Case overview", 'reddit': "Reddit discussions"}
+            source_slots = {name: st.empty() for name in research_tasks}
+            for name, slot in source_slots.items():
+                slot.caption(f"⏳ {source_labels[name]}...")
+            
+            # Live result tabs - each source renders into its tab the moment it lands,
+            # then the full results view below replaces them once the search is done
+            live_results = st.empty()
+            with live_results.container():
+                live_tabs = st.tabs(["Overview", "YouTube", "Reddit"])
+            result_slots = {name: tab.empty() for name, tab in zip(['overview', 'youtube', 'reddit'], live_tabs)}
+            for name, slot in result_slots.items():
+                slot.caption(f"⏳ Waiting for {source_labels[name]}...")
             
-            # Search all sources with progress updates
-            status_text.text("Checking YouTube...")
-            progress_bar.progress(20)
-            youtube_count = count_youtube_videos(case_search, youtube_api_key) if youtube_api_key else 0
-            
-            # Safety check to ensure youtube_count is always an integer
-            if isinstance(youtube_count, dict):
-                youtube_count = 0
-            elif youtube_count is None:
-                youtube_count = 0
-            elif not isinstance(youtube_count, (int, float)):
-                youtube_count = 0
-            else:
-                youtube_count = int(youtube_count)
-
-            status_text.text("Analyzing case...")
-            progress_bar.progress(40)
-            # Use Perplexity for comprehensive case research
+            youtube_count = 0
             web_search_results = None
-            if perplexity_api_key:
-                # Get comprehensive case information from Perplexity
-                perplexity_data = get_perplexity_case_analysis(case_search, perplexity_api_key)
-                
-                if perplexity_data:
-                    # Format the results for display
-                    formatted_results = []
-                    
-                    formatted_results.append("## Case Overview\n")
-                    formatted_results.append(perplexity_data.get('overview', 'No overview available'))
-                    formatted_results.append("\n")
-                    
-                    web_search_results = "\n".join(formatted_results)
-
-            progress_bar.progress(60)
-            # Skip Wikipedia pageviews
-            wikipedia_data = {'trend_percentage': 0, 'last_7_days': 0}
-            
-            status_text.text("Searching Reddit discussions...")
-            progress_bar.progress(75)
-            # Search Reddit - ALL of Reddit for titles containing the search term
             reddit_results = []
-            try:
-                # Use Pushshift API (Reddit archive) for better search
-                pushshift_url = "https://api.pushshift.io/reddit/search/submission/"
-                
-                # Try Pushshift first (better search)
-                params = {
-                    'q': case_search,
-                    'size': 100,
-                    'sort': 'score',
-                    'sort_type': 'desc'
-                }
-                
-                try:
-                    response = requests.get(pushshift_url, params=params, timeout=10)
-                    if response.status_code == 200:
-                        data = response.json()
-                        for item in data.get('data', []):
-                            # Convert Pushshift format to Reddit format
-                            reddit_results.append({
-                                'data': {
-                                    'title': item.get('title', ''),
-                                    'selftext': item.get('selftext', ''),
-                                    'subreddit': item.get('subreddit', ''),
-                                    'score': item.get('score', 0),
-                                    'num_comments': item.get('num_comments', 0),
-                                    'permalink': f"/r/{item.get('subreddit')}/comments/{item.get('id')}/",
-                                    'url': item.get('url', ''),
-                                    'created_utc': item.get('created_utc', 0)
-                                }
-                            })
-                except:
-                    pass  # Pushshift might be down, continue to Reddit search
+            
+            for completed, (name, result, error) in enumerate(research.fan_out(research_tasks), 1):
+                progress_bar.progress(int(completed / len(research_tasks) * 100))
                 
-                # Update progress
-                progress_bar.progress(85)
+                if error is not None:
+                    if isinstance(error, TimeoutError):
+                        source_slots[name].caption(f"⌛ {source_labels[name]} timed out - showing results without it")
+                    else:
+                        source_slots[name].caption(f"⚠️ {source_labels[name]} unavailable")
+                    result_slots[name].caption(f"{source_labels[name]} unavailable for this search")
+                    continue
                 
-                # If Pushshift didn't work or found nothing, use Reddit search with better parameters
-                if not reddit_results:
-                    # Search variations to improve results
-                    search_variations = [
-                        case_search,  # Full name
-                        ' '.join(case_search.split()[:2]) if len(case_search.split()) > 2 else case_search,  # First two words
-                        case_search.split()[-1] if len(case_search.split()) > 1 else case_search,  # Last word only
-                    ]
-                    
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-                    }
-                    
-                    for search_term in search_variations:
-                        # Search across all Reddit
-                        search_url = "https://www.reddit.com/search.json"
-                        params = {
-                            'q': f'{search_term} (murder OR killer OR crime OR death)',  # Add context
-                            'sort': 'relevance',
-                            'limit': 100,
-                            't': 'all',
-                            'type': 'link',
-                            'raw_json': 1
-                        }
-                        
-                        time.sleep(1)
-                        response = requests.get(search_url, headers=headers, params=params, timeout=15)
-                        
-                        if response.status_code == 200:
-                            data = response.json()
-                            if 'data' in data and 'children' in data['data']:
-                                for post in data['data']['children']:
-                                    post_data = post['data']
-                                    title_lower = post_data['title'].lower()
-                                    
-                                    # Check if relevant to our search
-                                    if any(word.lower() in title_lower for word in case_search.split()):
-                                        reddit_results.append(post)
+                if name == 'youtube':
+                    # Safety check to ensure youtube_count is always an integer
+                    youtube_count = int(result) if isinstance(result, (int, float)) else 0
+                    source_slots[name].caption(f"✅ YouTube: {youtube_count:,} videos")
+                    result_slots[name].write(f"Found {youtube_count:,} videos about this case")
+                elif name == 'overview':
+                    if result:
+                        # Format the results for display
+                        formatted_results = []
                         
-                        if reddit_results:
-                            break  # Stop if we found results
-                    
-                    # Update progress
-                    progress_bar.progress(90)
-                    
-                    # Last resort: search specific true crime subreddits
-                    if not reddit_results:
-                        crime_subreddits = ["serialkillers", "TrueCrime", "UnresolvedMysteries"]
+                        formatted_results.append("## Case Overview\n")
+                        formatted_results.append(result.get('overview', 'No overview available'))
+                        formatted_results.append("\n")
                         
-                        for subreddit in crime_subreddits:
-                            url = f"https://www.reddit.com/r/{subreddit}/search.json"
-                            params = {
-                                'q': case_search.split()[-1],  # Just last name
-                                'restrict_sr': 'on',
-                                'sort': 'relevance',
-                                'limit': 50,
-                                't': 'all',
-                                'raw_json': 1
-                            }
-                            
-                            response = requests.get(url, headers=headers, params=params, timeout=10)
-                            if response.status_code == 200:
-                                data = response.json()
-                                for post in data.get('data', {}).get('children', []):
-                                    reddit_results.append(post)
-                
-                # Remove duplicates and sort by score
-                seen = set()
-                unique_results = []
-                for post in reddit_results:
-                    post_id = post['data'].get('id', post['data'].get('title', ''))
-                    if post_id not in seen:
-                        seen.add(post_id)
-                        unique_results.append(post)
-                
-                reddit_results = sorted(unique_results, key=lambda x: x['data'].get('score', 0), reverse=True)[:20]
-                
-            except Exception as e:
-                print(f"Reddit search error: {e}")
+                        web_search_results = "\n".join(formatted_results)
+                        search_index.add_overview(case_search, result.get('overview', ''))
+                        source_slots[name].caption("✅ Case overview ready")
+                        result_slots[name].markdown(web_search_results)
+                    else:
+                        source_slots[name].caption("➖ No case overview")
+                        result_slots[name].info("No case overview for this search")
+                elif name == 'reddit':
+                    reddit_results = result or []
+                    search_index.add_reddit_posts(reddit_results, case_search)
+                    source_slots[name].caption(f"✅ Reddit: {len(reddit_results)} discussions")
+                    with result_slots[name].container():
+                        display_reddit_posts(reddit_results)
+            
+            # Skip Wikipedia pageviews
+            wikipedia_data = {'trend_percentage': 0, 'last_7_days': 0}
             
             # Complete the progress
             progress_bar.progress(100)
@@ -2335,20 +2195,25 @@ if st.session_state.current_page == "Case Search":
             time.sleep(0.5)
             progress_bar.empty()
             status_text.empty()
+            local_slot.empty()
+            live_results.empty()
+            for slot in source_slots.values():
+                slot.empty()
             
             # Store all results in session state
             st.session_state.search_performed = True
             st.session_state.search_query = case_search
-            cache_with_expiry('youtube_count', youtube_count, hours=24)
+            st.session_state.youtube_count = youtube_count
             st.session_state.reddit_results = reddit_results
             st.session_state.web_search_results = web_search_results
+            st.session_state.local_hits = local_hits
     
     # Display results from session state
     if st.session_state.get('search_performed', False):
         case_search = st.session_state.search_query
-        gdelt_results = get_cached_data('gdelt_results') or []
-        nyt_results = get_cached_data('nyt_results') or []
-        youtube_count = get_cached_data('youtube_count') or 0
+        gdelt_results = st.session_state.get('gdelt_results', [])
+        nyt_results = st.session_state.get('nyt_results', [])
+        youtube_count = st.session_state.get('youtube_count', 0)
         
         # Safety check to ensure youtube_count is always an integer
         if isinstance(youtube_count, dict):
@@ -2414,6 +2279,13 @@ if st.session_state.current_page == "Case Search":
             
             # Then continue with your existing results display...
         
+        local_hits = st.session_state.get('local_hits', [])
+        if local_hits:
+            with st.expander(f"Matches from earlier research ({len(local_hits)})"):
+                for hit in local_hits:
+                    title = f"[{hit['title']}]({hit['url']})" if hit['url'] else hit['title']
+                    st.markdown(f"**{search_index.KIND_LABELS[hit['kind']]}** · {title}  \n{hit['snippet']}")
+        
         source_tabs = st.tabs(["Overview", "Web Search", "YouTube", "Reddit"])
         
         with source_tabs[0]:  # Overview (Perplexity) - previously "Web Search"
@@ -2496,76 +2368,20 @@ if st.session_state.current_page == "Case Search":
                     st.markdown("---")
                     st.markdown("### Top Performing Content")
                     
-                    # Search for videos
-                    yt_url = "https://www.googleapis.com/youtube/v3/search"
-                    yt_params = {
-                        "key": youtube_api_key,
-                        "part": "snippet",
-                        "q": case_search,  # This should use the search query from session state
-                        "type": "video",
-                        "order": "viewCount",  # Order by view count
-                        "maxResults": 50,  # Get more to separate shorts/videos
-                    }
+                    # Search for videos - the same cached search.list the video count used
+                    yt_search = youtube_api.search_videos(case_search, youtube_api_key)
                     
                     try:
-                        yt_response = requests.get(yt_url, params=yt_params, timeout=10)
-                        if yt_response.status_code == 200:
-                            yt_data = yt_response.json()
-                            
+                        if yt_search:
                             # Get video IDs
-                            video_ids = [item['id']['videoId'] for item in yt_data.get('items', [])]
+                            video_ids = yt_search['video_ids']
                             
                             if video_ids:
-                                # Get video details including duration and view count
-                                details_url = "https://www.googleapis.com/youtube/v3/videos"
-                                details_params = {
-                                    "key": youtube_api_key,
-                                    "part": "contentDetails,statistics,snippet",
-                                    "id": ",".join(video_ids)
-                                }
-                                
-                                details_response = requests.get(details_url, params=details_params, timeout=10)
-                                if details_response.status_code == 200:
-                                    details_data = details_response.json()
-                                    
-                                    regular_videos = []
-                                    shorts = []
-                                    
-                                    for video in details_data.get('items', []):
-                                        # Parse duration (PT1M30S format)
-                                        duration_str = video['contentDetails']['duration']
-                                        
-                                        # Convert ISO 8601 duration to seconds
-                                        import re
-                                        match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', duration_str)
-                                        if match:
-                                            hours = int(match.group(1) or 0)
-                                            minutes = int(match.group(2) or 0) 
-                                            seconds = int(match.group(3) or 0)
-                                            total_seconds = hours * 3600 + minutes * 60 + seconds
-                                        else:
-                                            total_seconds = 0
-                                        
-                                        video_info = {
-                                            'id': video['id'],
-                                            'title': video['snippet']['title'],
-                                            'channel': video['snippet']['channelTitle'],
-                                            'thumbnail': video['snippet']['thumbnails']['medium']['url'],
-                                            'views': int(video['statistics'].get('viewCount', 0)),
-                                            'duration': total_seconds,
-                                            'url': f"https://www.youtube.com/watch?v={video['id']}",
-                                            'publishedAt': video['snippet'].get('publishedAt', '')  # Add this line
-                                        }
-                                        
-                                        # Separate shorts from regular videos based on duration
-                                        if total_seconds > 0 and total_seconds <= 180:
-                                            shorts.append(video_info)
-                                        else:
-                                            regular_videos.append(video_info)
-                                    
-                                    # Sort by views
-                                    regular_videos.sort(key=lambda x: x['views'], reverse=True)
-                                    shorts.sort(key=lambda x: x['views'], reverse=True)
+                                # Normalize the batch once - durations are parsed and shorts classified in one pass
+                                videos = youtube_api.normalize_videos(youtube_api.get_videos(video_ids, youtube_api_key).values())
+                                if len(videos):
+                                    regular_videos = youtube_api.top_videos(videos, shorts=False)
+                                    shorts = youtube_api.top_videos(videos, shorts=True)
                                     
                                     # Display top 5 of each
                                     col1, col2 = st.columns(2)
@@ -2664,14 +2480,13 @@ if st.session_state.current_page == "Case Search":
                                         else:
                                             st.info("No shorts found")
                                 else:
-                                    st.error(f"Could not fetch video details. Status: {details_response.status_code}")
+                                    st.error("Could not fetch video details.")
                             else:
                                 st.info("No videos found for this search")
+                        elif youtube_api.budget_low():
+                            st.warning("YouTube quota is running low - only previously cached searches are shown until it resets at midnight Pacific Time.")
                         else:
-                            if yt_response.status_code == 403:
-                                st.error("YouTube API quota exceeded. Please try again later or add more API keys.")
-                            else:
-                                st.error(f"YouTube search failed. Status: {yt_response.status_code}")
+                            st.error("YouTube search failed. The API quota may be exceeded - please try again later.")
                                 
                     except Exception as e:
                         st.error(f"Error fetching YouTube videos: {str(e)}")
@@ -2719,19 +2534,13 @@ if st.session_state.current_page == "Case Search":
                     with col2:
                         st.markdown("#### Sample Shorts")
                         st.info("Add YouTube API key to see real shorts")
+            elif youtube_api.budget_low():
+                st.warning("YouTube quota is running low, so the video count was skipped for this search.")
             else:
                 st.info("No YouTube videos found for this search term")
 
         with source_tabs[3]:  # Reddit (index 2)
-            if reddit_results:
-                for post in reddit_results[:10]:
-                    post_data = post['data']
-                    st.write(f"**{post_data['title']}**")
-                    st.caption(f"r/{post_data.get('source_subreddit', 'unknown')} - {post_data['score']} upvotes")
-                    st.write(f"[View](https://reddit.com{post_data['permalink']})")
-                    st.write("---")
-            else:
-                st.info("No Reddit discussions found")
+            display_reddit_posts(reddit_results)
 
         
         # Bailey's Strategy Generator
@@ -2742,128 +2551,127 @@ if st.session_state.current_page == "Case Search":
             if 'generated_strategy' not in st.session_state:
                 st.session_state.generated_strategy = None
             
+            strategy_action = None
+            
             # Button to generate strategy
             if st.button("Generate Episode Strategy", key="generate_strategy", type="primary", use_container_width=True):
-                with st.spinner("Creating episode strategy..."):
-                    
-                    # Get actual Wikipedia article content
-                    wiki_article_content = ""
-                    if 'wikipedia_data' in st.session_state and st.session_state.wikipedia_data and st.session_state.wikipedia_data.get('article_title'):
-                        # ... (your Wikipedia fetching code) ...
-                        pass
-                    
-                    # Get web search results context
-                    web_search_context = ""
-                    web_search_results = st.session_state.get('web_search_results', None)
-                    if web_search_results:
-                        web_content = web_search_results[:3000] if len(web_search_results) > 3000 else web_search_results
-                        web_search_context = f"Web Search Information:\n{web_content}\n\n"
-                    
-                    # Build wiki context from wikidata results
-                    wiki_context = ""
-                    wikidata_results = get_cached_data('wikidata_results') or []
-                    if wikidata_results:
-                        wiki_entries = [f"- {r['label']}: {r['description']}" for r in wikidata_results[:3]]
+                
+                # Get actual Wikipedia article content
+                wiki_article_content = ""
+                if 'wikipedia_data' in st.session_state and st.session_state.wikipedia_data and st.session_state.wikipedia_data.get('article_title'):
+                    # ... (your Wikipedia fetching code) ...
+                    pass
+                
+                # Get web search results context
+                web_search_context = ""
+                web_search_results = st.session_state.get('web_search_results', None)
+                if web_search_results:
+                    web_content = web_search_results[:3000] if len(web_search_results) > 3000 else web_search_results
+                    web_search_context = f"Web Search Information:\n{web_content}\n\n"
+                
+                # Build wiki context from wikidata results
+                wiki_context = ""
+                wikidata_results = st.session_state.get('wikidata_results', [])
+                if wikidata_results:
+                    wiki_entries = [f"- {r['label']}: {r['description']}" for r in wikidata_results[:3]]
 
-                    
-                    # Build Reddit context
-                    reddit_context = ""
-                    if 'reddit_results' in st.session_state and st.session_state.reddit_results:
-                        top_posts = [f"- {post['data']['title']} (r/{post['data'].get('subreddit', 'unknown')}, {post['data']['score']} upvotes)" 
-                                    for post in st.session_state.reddit_results[:5]]
-                        reddit_context = "Top Reddit discussions:\n" + "\n".join(top_posts) + "\n"
-                    
-                    # Get YouTube count
-                    youtube_count = st.session_state.get('youtube_count', 0)
-                    
-                    # Safety check to ensure youtube_count is always an integer
-                    if isinstance(youtube_count, dict):
-                        youtube_count = 0
-                    elif youtube_count is None:
-                        youtube_count = 0
-                    elif not isinstance(youtube_count, (int, float)):
-                        youtube_count = 0
-                    else:
-                        youtube_count = int(youtube_count)
+                
+                # Build Reddit context
+                reddit_context = ""
+                if 'reddit_results' in st.session_state and st.session_state.reddit_results:
+                    top_posts = [f"- {post.title} (r/{post.get('subreddit', 'unknown')}, {post.score} upvotes)" 
+                                for post in st.session_state.reddit_results[:5]]
+                    reddit_context = "Top Reddit discussions:\n" + "\n".join(top_posts) + "\n"
+                
+                # Get YouTube count
+                youtube_count = st.session_state.get('youtube_count', 0)
+                
+                # Safety check to ensure youtube_count is always an integer
+                if isinstance(youtube_count, dict):
+                    youtube_count = 0
+                elif youtube_count is None:
+                    youtube_count = 0
+                elif not isinstance(youtube_count, (int, float)):
+                    youtube_count = 0
+                else:
+                    youtube_count = int(youtube_count)
 
-                    # Get case search term
-                    case_search = st.session_state.get('search_query', 'Unknown Case')
-                    
-                    prompt = f"""Create a comprehensive true crime episode strategy for True Crime Obsessed based on this research:
-
-                    CASE: {case_search}
-
-                    DATA SUMMARY:
-                    - YouTube Videos: {youtube_count} ({"oversaturated" if youtube_count > 200 else "good opportunity" if youtube_count < 50 else "moderate coverage"})
-                    - Reddit Discussions: {len(st.session_state.get('reddit_results', []))}
-
-                    {web_search_context}
-                    {wiki_article_content}
-                    {wiki_context}
-                    {reddit_context}
-
-                    Based on ALL this research (especially the web search information), provide:
-
-                    1. EPISODE TITLE: Compelling true crime title that stands out from existing coverage
-                    2. UNIQUE ANGLE: What fresh perspective can True Crime Obsessed bring given the existing coverage?
-                    3. COLD OPEN: First 30 seconds hook based on the most shocking detail from the sources
-                    4. STORY STRUCTURE: 
-                    - Opening: Set the scene (use specific details from web search)
-                    - Act 1: Background and buildup (use specific details from all sources)
-                    - Act 2: The crime itself (incorporate facts from web search and Wikipedia)
-                    - Act 3: Investigation and aftermath
-                    - Conclusion: Analysis and takeaways
-                    5. KEY TALKING POINTS: Based on what Reddit/news are discussing
-                    6. CONTROVERSY/DISCUSSION POINTS: What aspects are people most divided on?
-                    7. PSYCHOLOGICAL ANGLE: What makes this case psychologically compelling?
-                    8. LESSER-KNOWN FACTS: Pull interesting details from web search that aren't widely covered
-                    9. RESEARCH GAPS: What information is missing that should be researched further?
-                    10. VISUAL ELEMENTS: Specific photos, documents, and graphics needed
-                    11. ESTIMATED RUNTIME: Episode length recommendation
-                    12. COMPETITION ANALYSIS: How to differentiate from the {youtube_count} existing videos
-                    13. FACT CHECK LIST: Key facts from web search and Wikipedia to verify
-                    14. AUDIENCE ENGAGEMENT: Questions to pose to the audience
-                    15. SERIES POTENTIAL: Could this become a multi-part series?
-
-                    Make it specific to a general true crime format focused on thorough research, compelling storytelling, and audience engagement. Use actual details from ALL sources, especially unique information from the web search."""
-                    
-                    try:
-                        # Use requests instead of OpenAI client
-                        import requests
-                        import json
-                        
-                        url = "https://api.openai.com/v1/chat/completions"
-                        
-                        headers = {
-                            "Authorization": f"Bearer {api_key}",
-                            "Content-Type": "application/json"
-                        }
-                        
-                        data = {
-                            "model": "gpt-4",
-                            "messages": [{"role": "user", "content": prompt}],
-                            "max_tokens": 1500,
-                            "temperature": 0.7
-                        }
-                        
-                        response = requests.post(url, headers=headers, json=data, timeout=30)
-                        
-                        if response.status_code == 200:
-                            result = response.json()
-                            strategy = result['choices'][0]['message']['content']
-                            st.session_state.generated_strategy = strategy
-                            st.session_state.show_strategy = True
-                        else:
-                            st.error(f"Error: {response.status_code} - {response.text}")
-                            
-                    except Exception as e:
-                        st.error(f"Error: {str(e)}")
+                # Get case search term
+                case_search = st.session_state.get('search_query', 'Unknown Case')
+                
+                prompt = f"""Create a comprehensive true crime episode strategy for True Crime Obsessed based on this research:
+
+                CASE: {case_search}
+
+                DATA SUMMARY:
+                - YouTube Videos: {youtube_count} ({"oversaturated" if youtube_count > 200 else "good opportunity" if youtube_count < 50 else "moderate coverage"})
+                - Reddit Discussions: {len(st.session_state.get('reddit_results', []))}
+
+                {web_search_context}
+                {wiki_article_content}
+                {wiki_context}
+                {reddit_context}
+
+                Based on ALL this research (especially the web search information), provide:
+
+                1. EPISODE TITLE: Compelling true crime title that stands out from existing coverage
+                2. UNIQUE ANGLE: What fresh perspective can True Crime Obsessed bring given the existing coverage?
+                3. COLD OPEN: First 30 seconds hook based on the most shocking detail from the sources
+                4. STORY STRUCTURE: 
+                - Opening: Set the scene (use specific details from web search)
+                - Act 1: Background and buildup (use specific details from all sources)
+                - Act 2: The crime itself (incorporate facts from web search and Wikipedia)
+                - Act 3: Investigation and aftermath
+                - Conclusion: Analysis and takeaways
+                5. KEY TALKING POINTS: Based on what Reddit/news are discussing
+                6. CONTROVERSY/DISCUSSION POINTS: What aspects are people most divided on?
+                7. PSYCHOLOGICAL ANGLE: What makes this case psychologically compelling?
+                8. LESSER-KNOWN FACTS: Pull interesting details from web search that aren't widely covered
+                9. RESEARCH GAPS: What information is missing that should be researched further?
+                10. VISUAL ELEMENTS: Specific photos, documents, and graphics needed
+                11. ESTIMATED RUNTIME: Episode length recommendation
+                12. COMPETITION ANALYSIS: How to differentiate from the {youtube_count} existing videos
+                13. FACT CHECK LIST: Key facts from web search and Wikipedia to verify
+                14. AUDIENCE ENGAGEMENT: Questions to pose to the audience
+                15. SERIES POTENTIAL: Could this become a multi-part series?
+
+                Make it specific to a general true crime format focused on thorough research, compelling storytelling, and audience engagement. Use actual details from ALL sources, especially unique information from the web search."""
+                
+                st.session_state.strategy_prompt = prompt
+                strategy_action = "generate"
+            
+            # A generation that broke off keeps its partial text until resumed or regenerated
+            if not strategy_action and st.session_state.generated_strategy and not st.session_state.get('strategy_complete', True):
+                st.warning(f"Episode strategy generation stopped early ({st.session_state.get('strategy_error') or 'interrupted'}). The partial strategy is kept below.")
+                resume_col, regenerate_col = st.columns(2)
+                with resume_col:
+                    if st.button("Resume Generation", key="resume_strategy", use_container_width=True):
+                        strategy_action = "resume"
+                with regenerate_col:
+                    if st.button("Regenerate", key="regenerate_strategy", use_container_width=True):
+                        strategy_action = "regenerate"
 
             # Display strategy outside the button
-            if st.session_state.show_strategy and st.session_state.generated_strategy:
+            if strategy_action or (st.session_state.show_strategy and st.session_state.generated_strategy):
                 st.markdown("---")
                 st.markdown("### Episode Strategy")
-                st.write(st.session_state.generated_strategy)
+                if strategy_action:
+                    # Render tokens as they arrive; a resumed strategy continues under its partial text
+                    st.session_state.show_strategy = True
+                    st.session_state.strategy_error = None
+                    if strategy_action == "resume":
+                        st.write(st.session_state.generated_strategy)
+                    try:
+                        st.write_stream(stream_episode_strategy(api_key, st.session_state.strategy_prompt,
+                                                                resume=strategy_action == "resume",
+                                                                refresh=refresh_llm or strategy_action == "regenerate"))
+                    except Exception as e:
+                        st.session_state.strategy_error = str(e)
+                        if st.session_state.generated_strategy:
+                            st.rerun()  # redraw with the partial strategy and resume/regenerate
+                        st.error(f"Error: {str(e)}")
+                else:
+                    st.write(st.session_state.generated_strategy)
                 
                 # Download packet
                 packet = f"""# True Crime Obsessed Episode Packet
@@ -2931,207 +2739,111 @@ elif st.session_state.current_page == "Trending Cases":
         # Changed from st.button to st.form_submit_button and removed key parameter
         submitted = st.form_submit_button("GET TRENDING", type="primary", use_container_width=True)
     
-    # Form ends here, now process if submitted
+    # Snapshots are precomputed in the background; the form only filters them locally
+    trending.start_refresher()
     if submitted:
-        with st.spinner("Analyzing trending cases across multiple sources..."):
-            all_trending = []
-            
-            # Expanded subreddit list
-            subreddits = [
-                "TrueCrime", "UnresolvedMysteries", "UnsolvedMysteries",
-                "TrueCrimeDiscussion", "TrueCrimePodcasts", "serialkillers",
-                "MorbidReality", "CreepyWikipedia", "ColdCase", "MissingPersons"
-            ]
-            
-            progress_bar = st.progress(0)
-            total_subs = len(subreddits)
-            
-            for idx, sub in enumerate(subreddits):
-                progress_bar.progress((idx + 1) / total_subs)
-                
-                try:
-                    # Get top posts from each subreddit
-                    url = f"https://www.reddit.com/r/{sub}/top.json"
-                    params = {
-                        't': time_range,
-                        'limit': 25,
-                        'raw_json': 1
-                    }
+        st.session_state.trending_requested = True
+    
+    snapshot = trending.get_snapshot(time_range)
+    
+    refresh_col1, refresh_col2 = st.columns([3, 1])
+    with refresh_col1:
+        if snapshot:
+            st.caption(f"Last refreshed: {snapshot['refreshed_at'].strftime('%Y-%m-%d %H:%M')}")
+        else:
+            st.caption("Trending data has not been collected for this time period yet")
+    with refresh_col2:
+        refresh_clicked = st.button("Refresh now", key="refresh_trending", use_container_width=True)
+    if refresh_clicked:
+        st.session_state.trending_requested = True
+    
+    # Never crawl on the page - wake the background refresher and show what we have
+    if st.session_state.get('trending_requested', False) and (refresh_clicked or not snapshot):
+        trending.request_refresh(time_range)
+        if snapshot:
+            st.info("Refresh started in the background - showing the current snapshot until it finishes.")
+        else:
+            st.info("Trending cases for this time period are being collected in the background - check back in a minute.")
+    
+    if st.session_state.get('trending_requested', False) and snapshot:
+        unique_trending = trending.filter_snapshot(snapshot, min_score)
+        top_trending = ranking.top_k(unique_trending, num_results, key=lambda x: x['trending_score'])
+        
+        if unique_trending:
+            st.success(f"Found {len(unique_trending)} trending cases across {snapshot['subreddit_count']} subreddits")
+            
+            # Display trending cases
+            for i, case in enumerate(top_trending, 1):
+                with st.container():
+                    # Just show the title without any research button
+                    st.markdown(f"**#{i}. {case['title']}**")
+                    subreddits_line = " • ".join(f"r/{sub}" for sub in case['subreddits'])
+                    if case['post_count'] > 1:
+                        subreddits_line += f" • {case['post_count']} posts"
+                    st.caption(f"{subreddits_line} • by u/{case['author']}")
                     
-                    headers = {'User-Agent': 'Mozilla/5.0'}
-                    response = requests.get(url, headers=headers, params=params, timeout=10)
+                    # Metrics
+                    col1, col2, col3, col4, col5 = st.columns(5)
                     
-                    if response.status_code == 200:
-                        data = response.json()
-                        posts = data.get('data', {}).get('children', [])
-                        
-                        for post in posts:
-                            post_data = post['data']
-                            
-                            # Add this line to exclude subreddits (BEFORE checking score):
-                            if post_data.get('subreddit', sub).lower() in ['murderedbywords', 'murdermittens']:
-                                continue
-                            
-                            if post_data['score'] >= min_score:
-                                # Extract potential case name
-                                title = post_data['title']
-                                
-                                # Calculate trending score (combination of upvotes and comments)
-                                trending_score = post_data['score'] + (post_data['num_comments'] * 10)
-                                
-                                all_trending.append({
-                                    'title': title,
-                                    'upvotes': post_data['score'],
-                                    'comments': post_data['num_comments'],
-                                    'subreddit': sub,  # Note: using 'sub' from the outer loop
-                                    'url': f"https://reddit.com{post_data['permalink']}",
-                                    'trending_score': trending_score,
-                                    'created': post_data.get('created_utc', 0),
-                                    'author': post_data.get('author', 'unknown'),
-                                    'awards': post_data.get('total_awards_received', 0)
-                                })
-
+                    with col1:
+                        st.metric("Upvotes", f"{case['upvotes']:,}")
                     
-                    time.sleep(0.3)  # Rate limiting
-                except:
-                    continue
+                    with col2:
+                        st.metric("Comments", f"{case['comments']:,}")
+                    
+                    with col3:
+                        st.metric("Awards", case['awards'])
+                    
+                    with col4:
+                        st.metric("Trend Score", f"{case['trending_score']:,}")
+                    
+                    with col5:
+                        st.markdown(f"[View on Reddit]({case['url']})")
+                    
+                    # Time posted
+                    if case['created'] > 0:
+                        from datetime import datetime
+                        posted_time = datetime.fromtimestamp(case['created'])
+                        st.caption(f"Posted: {posted_time.strftime('%Y-%m-%d %H:%M')}")
+                    
+                    st.divider()
             
-            progress_bar.empty()
+            # Summary statistics
+            st.markdown("### Trending Summary")
+            col1, col2, col3 = st.columns(3)
             
-            # Also search for trending keywords
-            trending_keywords = ["murder", "missing", "unsolved", "serial killer", "cold case", "disappeared"]
+            with col1:
+                avg_upvotes = sum(c['upvotes'] for c in top_trending) / len(top_trending)
+                st.metric("Avg. Upvotes", f"{avg_upvotes:,.0f}")
             
-            st.info("Searching for trending topics...")
+            with col2:
+                total_comments = sum(c['comments'] for c in top_trending)
+                st.metric("Total Comments", f"{total_comments:,}")
             
-            for keyword in trending_keywords[:3]:  # Limit to avoid too many API calls
-                try:
-                    search_url = "https://www.reddit.com/search.json"
-                    params = {
-                        'q': keyword,
-                        'sort': 'top',
-                        't': time_range,
-                        'limit': 10,
-                        'raw_json': 1
-                    }
-                    
-                    response = requests.get(search_url, headers=headers, params=params, timeout=10)
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        posts = data.get('data', {}).get('children', [])
-                        
-                        for post in posts:
-                            post_data = post['data']
-                            # Add exclusion check here too:
-                            if post_data.get('subreddit', '').lower() in ['murderedbywords', 'murdermittens']:
-                                continue
-                            # Only include if from true crime related subreddit
-                            if any(crime_word in post_data['subreddit'].lower() 
-                                    for crime_word in ['crime', 'mystery', 'murder', 'missing']):
-                                
-                                if post_data['score'] >= min_score:
-                                    trending_score = post_data['score'] + (post_data['num_comments'] * 10)
-                                    
-                                    all_trending.append({
-                                        'title': post_data['title'],
-                                        'upvotes': post_data['score'],
-                                        'comments': post_data['num_comments'],
-                                        'subreddit': post_data['subreddit'],
-                                        'url': f"https://reddit.com{post_data['permalink']}",
-                                        'trending_score': trending_score,
-                                        'created': post_data.get('created_utc', 0),
-                                        'author': post_data.get('author', 'unknown'),
-                                        'awards': post_data.get('total_awards_received', 0)
-                                    })
-                    
-                    time.sleep(0.5)
-                except:
-                    continue
+            with col3:
+                # Most active subreddit
+                sub_counts = {}
+                for c in top_trending:
+                    sub_counts[c['subreddit']] = sub_counts.get(c['subreddit'], 0) + 1
+                most_active = max(sub_counts.items(), key=lambda x: x[1])
+                st.metric("Most Active Sub", f"r/{most_active[0]}")
             
-            # Remove duplicates based on title similarity
-            seen_titles = set()
-            unique_trending = []
-            for item in all_trending:
-                # Simple deduplication - you could make this more sophisticated
-                title_key = item['title'][:50].lower()
-                if title_key not in seen_titles:
-                    seen_titles.add(title_key)
-                    unique_trending.append(item)
-            
-            # Sort by trending score
-            unique_trending.sort(key=lambda x: x['trending_score'], reverse=True)
-            
-            if unique_trending:
-                st.success(f"Found {len(unique_trending)} trending cases across {len(subreddits)} subreddits")
-                
-                # Display trending cases
-                for i, case in enumerate(unique_trending[:num_results], 1):
-                    with st.container():
-                        # Just show the title without any research button
-                        st.markdown(f"**#{i}. {case['title']}**")
-                        st.caption(f"r/{case['subreddit']} • by u/{case['author']}")
-                        
-                        # Metrics
-                        col1, col2, col3, col4, col5 = st.columns(5)
-                        
-                        with col1:
-                            st.metric("Upvotes", f"{case['upvotes']:,}")
-                        
-                        with col2:
-                            st.metric("Comments", f"{case['comments']:,}")
-                        
-                        with col3:
-                            st.metric("Awards", case['awards'])
-                        
-                        with col4:
-                            st.metric("Trend Score", f"{case['trending_score']:,}")
-                        
-                        with col5:
-                            st.markdown(f"[View on Reddit]({case['url']})")
-                        
-                        # Time posted
-                        if case['created'] > 0:
-                            from datetime import datetime
-                            posted_time = datetime.fromtimestamp(case['created'])
-                            st.caption(f"Posted: {posted_time.strftime('%Y-%m-%d %H:%M')}")
-                        
-                        st.divider()
-                
-                # Summary statistics
-                st.markdown("### Trending Summary")
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    avg_upvotes = sum(c['upvotes'] for c in unique_trending[:num_results]) / len(unique_trending[:num_results])
-                    st.metric("Avg. Upvotes", f"{avg_upvotes:,.0f}")
-                
-                with col2:
-                    total_comments = sum(c['comments'] for c in unique_trending[:num_results])
-                    st.metric("Total Comments", f"{total_comments:,}")
-                
-                with col3:
-                    # Most active subreddit
-                    sub_counts = {}
-                    for c in unique_trending[:num_results]:
-                        sub_counts[c['subreddit']] = sub_counts.get(c['subreddit'], 0) + 1
-                    most_active = max(sub_counts.items(), key=lambda x: x[1])
-                    st.metric("Most Active Sub", f"r/{most_active[0]}")
-                
-            else:
-                st.warning(f"No trending cases found with minimum {min_score} upvotes in the {time_range} time period")    
+        else:
+            st.warning(f"No trending cases found with minimum {min_score} upvotes in the {time_range} time period")    
 
 elif st.session_state.current_page == "True Crime Podcasts":
     st.markdown("### Trending True Crime Podcasts")
     
     # Authenticate with Spotify only when on this page
     if spotify_client_id and spotify_client_secret and spotify_client_id != "YOUR_SPOTIFY_CLIENT_ID_HERE":
-        if 'spotify_token' not in st.session_state:
-            with st.spinner("Authenticating with Spotify..."):
-                token = get_spotify_token(spotify_client_id, spotify_client_secret)
-                if token:
-                    st.session_state.spotify_token = token
-                else:
-                    st.warning("Could not authenticate with Spotify. Topic search will be unavailable.")
+        # The token manager reuses one token across sessions and refreshes it before expiry
+        with st.spinner("Authenticating with Spotify..."):
+            token = get_spotify_token(spotify_client_id, spotify_client_secret)
+        if token:
+            st.session_state.spotify_token = token
+        else:
+            st.session_state.pop('spotify_token', None)
+            st.warning("Could not authenticate with Spotify. Topic search will be unavailable.")
     
     # Radio buttons for view selection
     podcast_view = st.radio(
@@ -3187,42 +2899,40 @@ elif st.session_state.current_page == "True Crime Podcasts":
                     all_episodes = []
                     
                     progress_bar = st.progress(0)
+                    summary_slot = st.empty()
+                    results_slot = st.empty()
                     
-                    for idx, podcast in enumerate(podcasts):
-                        progress_bar.progress((idx + 1) / len(podcasts))
+                    # Feeds are fetched in parallel; re-render the ranked list as each one lands
+                    for done, (podcast, episodes) in enumerate(podcast_feeds.fetch_latest_episodes(podcasts, limit=2), 1):  # Get 2 latest episodes
+                        progress_bar.progress(done / len(podcasts))
                         
-                        if podcast.get('url'):
-                            podcast_id = podcast['url'].split('/id')[-1].split('?')[0]
-                            episodes = get_itunes_podcast_episodes(podcast_id, limit=2)  # Get 2 latest episodes
-                            
-                            for ep in episodes:
-                                ep['podcast_name'] = podcast['name']
-                                ep['podcast_artist'] = podcast['artist']
-                                ep['podcast_rank'] = podcast['rank']
-                                all_episodes.append(ep)
+                        for ep in episodes:
+                            ep.podcast_name = podcast['name']
+                            ep.podcast_artist = podcast['artist']
+                            ep.podcast_rank = podcast['rank']
+                            all_episodes.append(ep)
+                        
+                        # Sort by podcast rank (maintains chart order)
+                        all_episodes.sort(key=lambda x: x.get('podcast_rank', 999))
                         
-                        time.sleep(0.1)  # Rate limiting
+                        with results_slot.container():
+                            for i, ep in enumerate(all_episodes[:30], 1):
+                                with st.expander(f"{i:02d} | {ep.title[:60]}... - {ep.podcast_name}", expanded=(i <= 3)):
+                                    st.markdown(f"**Show:** {ep.podcast_name}")
+                                    st.markdown(f"**Host:** {ep.podcast_artist}")
+                                    st.markdown(f"**Published:** {ep.get('published', 'Unknown')}")
+                                    st.markdown(f"**Duration:** {ep.get('duration', 'Unknown')}")
+                                    st.markdown(f"**Description:** {ep.get('description', 'No description')}")
+                                    if ep.get('link'):
+                                        st.markdown(f"[Listen to Episode]({ep.link})")
+                                    st.divider()
                     
                     progress_bar.empty()
                     
-                    # Sort by podcast rank (maintains chart order)
-                    all_episodes.sort(key=lambda x: x.get('podcast_rank', 999))
-                    
                     if all_episodes:
-                        st.success(f"Found {len(all_episodes)} recent episodes")
-                        
-                        for i, ep in enumerate(all_episodes[:30], 1):
-                            with st.expander(f"{i:02d} | {ep['title'][:60]}... - {ep['podcast_name']}", expanded=(i <= 3)):
-                                st.markdown(f"**Show:** {ep['podcast_name']}")
-                                st.markdown(f"**Host:** {ep['podcast_artist']}")
-                                st.markdown(f"**Published:** {ep.get('published', 'Unknown')}")
-                                st.markdown(f"**Duration:** {ep.get('duration', 'Unknown')}")
-                                st.markdown(f"**Description:** {ep.get('description', 'No description')}")
-                                if ep.get('link'):
-                                    st.markdown(f"[Listen to Episode]({ep['link']})")
-                                st.divider()
+                        summary_slot.success(f"Found {len(all_episodes)} recent episodes")
                     else:
-                        st.info("No recent episodes found")
+                        summary_slot.info("No recent episodes found")
                 else:
                     st.warning("Could not fetch podcast data")
     
@@ -3356,21 +3066,21 @@ elif st.session_state.current_page == "Movies & TV Shows":
                                     year=year, sort_by=sort_by)
                 
                 if results and results.get('results'):
-                    st.session_state.crime_trending_results = results['results']
+                    st.session_state.crime_trending_results = [records.TmdbTitle.from_tmdb(item) for item in results['results']]
                     st.success(f"Found {len(results['results'])} trending {media_type}s")
         
         # Display results
         if 'crime_trending_results' in st.session_state:
             for i, item in enumerate(st.session_state.crime_trending_results[:20], 1):
-                title = item.get('title') or item.get('name', 'Unknown')
-                release_date = item.get('release_date') or item.get('first_air_date', 'Unknown')
+                title = item.title
+                release_date = item.release_date
                 
                 with st.expander(f"{i:02d} | {title} ({release_date[:4] if release_date != 'Unknown' else 'N/A'})", expanded=False):
                     col1, col2 = st.columns([1, 3])
                     
                     with col1:
                         if item.get('poster_path'):
-                            poster_url = f"https://image.tmdb.org/t/p/w200{item['poster_path']}"
+                            poster_url = f"https://image.tmdb.org/t/p/w200{item.poster_path}"
                             st.image(poster_url, width=150)
                     
                     with col2:
@@ -3442,7 +3152,7 @@ elif st.session_state.current_page == "Movies & TV Shows":
                 
                 if results and results.get('results'):
                     # Store raw results for sorting
-                    st.session_state.crime_search_results_raw = results['results']
+                    st.session_state.crime_search_results_raw = [records.TmdbTitle.from_tmdb(item) for item in results['results']]
                     st.session_state.crime_search_query_used = search_query
                     st.session_state.crime_search_media_type_used = search_media_type
                     st.success(f"Found {len(results['results'])} results for '{search_query}'")
@@ -3473,7 +3183,7 @@ elif st.session_state.current_page == "Movies & TV Shows":
         # Sort the results
         sorted_results = sorted(
             st.session_state.crime_search_results_raw,
-            key=lambda x: x.get(sort_by, 0) if sort_by != 'title' else (x.get('title') or x.get('name', '')),
+            key=lambda x: x.get(sort_by, 0) if sort_by != 'title' else x.title,
             reverse=(sort_by != 'title')
         )
         
@@ -3482,15 +3192,15 @@ elif st.session_state.current_page == "Movies & TV Shows":
         
         # Display sorted results
         for i, item in enumerate(sorted_results[:20], 1):
-            title = item.get('title') or item.get('name', 'Unknown')
-            release_date = item.get('release_date') or item.get('first_air_date', 'Unknown')
+            title = item.title
+            release_date = item.release_date
             
             with st.expander(f"{i:02d} | {title} ({release_date[:4] if release_date != 'Unknown' and len(release_date) >= 4 else 'N/A'})", expanded=False):
                 col1, col2 = st.columns([1, 3])
                 
                 with col1:
                     if item.get('poster_path'):
-                        poster_url = f"https://image.tmdb.org/t/p/w200{item['poster_path']}"
+                        poster_url = f"https://image.tmdb.org/t/p/w200{item.poster_path}"
                         st.image(poster_url, width=150)
                 
                 with col2:
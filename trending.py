@@ -0,0 +1,191 @@
+"""Background precomputation of Trending Cases snapshots"""
+import threading
+from datetime import datetime
+
+import http_client
+import near_duplicates
+import ranking
+
+TIME_RANGES = ["hour", "day", "week", "month", "year", "all"]
+
+TRENDING_SUBREDDITS = [
+    "TrueCrime", "UnresolvedMysteries", "UnsolvedMysteries",
+    "TrueCrimeDiscussion", "TrueCrimePodcasts", "serialkillers",
+    "MorbidReality", "CreepyWikipedia", "ColdCase", "MissingPersons"
+]
+TRENDING_KEYWORDS = ["murder", "missing", "unsolved"]
+EXCLUDED_SUBREDDITS = ['murderedbywords', 'murdermittens']
+CRIME_WORDS = ['crime', 'mystery', 'murder', 'missing']
+
+REFRESH_INTERVAL = 15 * 60  # seconds between full refresh passes
+
+HEADERS = {'User-Agent': 'Mozilla/5.0'}
+
+_snapshots = {}
+_snapshots_lock = threading.Lock()
+_requested = set()  # time ranges a visitor asked to rebuild first, guarded by _snapshots_lock
+_wake = threading.Event()
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def _trending_item(post_data, subreddit):
+    """Keep only the fields the Trending Cases page shows"""
+    return {
+        'title': post_data['title'],
+        'upvotes': post_data['score'],
+        'comments': post_data['num_comments'],
+        'subreddit': subreddit,
+        'url': f"https://reddit.com{post_data['permalink']}",
+        'trending_score': ranking.trend_score(post_data['score'], post_data['num_comments']),
+        'created': post_data.get('created_utc', 0),
+        'author': post_data.get('author', 'unknown'),
+        'awards': post_data.get('total_awards_received', 0)
+    }
+
+
+def build_snapshot(time_range):
+    """Crawl the trending subreddits and keyword searches for one time range.
+
+    Requests go out as background work, so the crawl only uses Reddit rate
+    limit that Case Search and keyword searches leave idle. No min-score filter is applied here - the page filters locally so every
+    visitor's settings can be served from the same snapshot.
+    """
+    items = []
+
+    for sub in TRENDING_SUBREDDITS:
+        try:
+            url = f"https://www.reddit.com/r/{sub}/top.json"
+            params = {'t': time_range, 'limit': 25, 'raw_json': 1}
+            response = http_client.get(url, headers=HEADERS, params=params, timeout=10, background=True)
+
+            if response.status_code == 200:
+                for post in response.json().get('data', {}).get('children', []):
+                    post_data = post['data']
+                    if post_data.get('subreddit', sub).lower() in EXCLUDED_SUBREDDITS:
+                        continue
+                    items.append(_trending_item(post_data, sub))
+        except Exception as e:
+            print(f"Trending crawl error for r/{sub}: {e}")
+
+    for keyword in TRENDING_KEYWORDS:
+        try:
+            params = {'q': keyword, 'sort': 'top', 't': time_range, 'limit': 10, 'raw_json': 1}
+            response = http_client.get("https://www.reddit.com/search.json", headers=HEADERS, params=params,
+                                       timeout=10, background=True)
+
+            if response.status_code == 200:
+                for post in response.json().get('data', {}).get('children', []):
+                    post_data = post['data']
+                    subreddit = post_data.get('subreddit', '')
+                    if subreddit.lower() in EXCLUDED_SUBREDDITS:
+                        continue
+                    # Only include if from true crime related subreddit
+                    if any(crime_word in subreddit.lower() for crime_word in CRIME_WORDS):
+                        items.append(_trending_item(post_data, subreddit))
+        except Exception as e:
+            print(f"Trending keyword search error for '{keyword}': {e}")
+
+    # Group cross-posts and retellings of the same story once per crawl, off the render path
+    for item, cluster in zip(items, near_duplicates.cluster_ids([item['title'] for item in items])):
+        item['cluster'] = cluster
+
+    return {'items': items, 'refreshed_at': datetime.now(), 'subreddit_count': len(TRENDING_SUBREDDITS)}
+
+
+def refresh(time_range):
+    """Rebuild one time range now and store it"""
+    snapshot = build_snapshot(time_range)
+    with _snapshots_lock:
+        _snapshots[time_range] = snapshot
+    return snapshot
+
+
+def get_snapshot(time_range):
+    """Latest stored snapshot for a time range, or None if it hasn't been built yet"""
+    with _snapshots_lock:
+        return _snapshots.get(time_range)
+
+
+def request_refresh(time_range=None):
+    """Wake the background worker; a requested time range is rebuilt before the others"""
+    if time_range:
+        with _snapshots_lock:
+            _requested.add(time_range)
+    _wake.set()
+
+
+def _next_range(pending):
+    """The next time range to rebuild - requested ones jump the queue"""
+    with _snapshots_lock:
+        for time_range in pending:
+            if time_range in _requested:
+                _requested.discard(time_range)
+                return time_range
+    return pending[0]
+
+
+def _run():
+    while True:
+        _wake.clear()
+        pending = list(TIME_RANGES)
+        while pending:
+            time_range = _next_range(pending)
+            pending.remove(time_range)
+            try:
+                refresh(time_range)
+            except Exception as e:
+                print(f"Trending refresh error ({time_range}): {e}")
+        # A request for a range already rebuilt this pass left _wake set, so it runs again now
+        _wake.wait(REFRESH_INTERVAL)
+
+
+def start_refresher():
+    """Start the process-wide refresher thread once"""
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_run, name="trending-refresher", daemon=True)
+            _worker.start()
+
+
+def _merge_cluster(posts):
+    """One case per story: the best-scoring post, with engagement summed across the cluster"""
+    posts = sorted(posts, key=lambda x: x['trending_score'], reverse=True)
+    case = dict(posts[0])
+    for field in ('upvotes', 'comments', 'trending_score', 'awards'):
+        case[field] = sum(post[field] for post in posts)
+    case['subreddits'] = list(dict.fromkeys(post['subreddit'] for post in posts))
+    case['post_count'] = len(posts)
+    return case
+
+
+def merge_near_duplicates(items):
+    """Collapse repeated posts and near-duplicate stories into cases (unsorted - rank with ranking.top_k).
+
+    Items clustered by build_snapshot keep their cluster; anything else is
+    clustered here.
+    """
+    unique = []
+    seen_urls = set()
+    for item in items:
+        # The same post can come back from both a subreddit listing and a keyword search
+        if item['url'] not in seen_urls:
+            seen_urls.add(item['url'])
+            unique.append(item)
+
+    if any('cluster' not in item for item in unique):
+        cluster_ids = near_duplicates.cluster_ids([item['title'] for item in unique])
+    else:
+        cluster_ids = [item['cluster'] for item in unique]
+
+    clusters = {}
+    for item, cluster in zip(unique, cluster_ids):
+        clusters.setdefault(cluster, []).append(item)
+
+    return [_merge_cluster(posts) for posts in clusters.values()]
+
+
+def filter_snapshot(snapshot, min_score):
+    """Apply the page's min-upvotes filter and merge near-duplicate stories"""
+    return merge_near_duplicates([item for item in snapshot['items'] if item['upvotes'] >= min_score])
@@ -0,0 +1,462 @@
+"""YouTube Data API access with daily quota accounting"""
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+import http_client
+import response_cache
+
+API_BASE = "https://www.googleapis.com/youtube/v3/"
+
+# Default project quota; override if the Google Cloud project has more
+DAILY_QUOTA = int(os.getenv("YOUTUBE_DAILY_QUOTA", "10000"))
+# Below this many remaining units the helpers switch to cheaper strategies
+LOW_BUDGET_UNITS = int(os.getenv("YOUTUBE_LOW_BUDGET_UNITS", "1500"))
+
+# Quota cost per call, from the YouTube Data API v3 quota calculator
+UNIT_COSTS = {
+    'search': 100,
+    'videos': 1,
+    'channels': 1,
+    'playlistItems': 1,
+    'playlists': 1,
+    'commentThreads': 1,
+}
+DEFAULT_UNIT_COST = 1
+
+try:
+    from zoneinfo import ZoneInfo
+    QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+except Exception:
+    QUOTA_TIMEZONE = timezone(timedelta(hours=-8))
+
+_ledger_lock = threading.Lock()
+_ledger = None
+
+
+def _quota_day():
+    """The quota resets at midnight Pacific Time"""
+    return datetime.now(QUOTA_TIMEZONE).strftime('%Y-%m-%d')
+
+
+def _ledger_key(day):
+    return response_cache.make_key("youtube_quota", day)
+
+
+def _current_ledger():
+    """Today's ledger, loaded from the shared store so restarts keep the count"""
+    global _ledger
+    day = _quota_day()
+    if _ledger is None or _ledger['day'] != day:
+        _ledger = response_cache.get("youtube_quota", _ledger_key(day)) or {
+            'day': day, 'used': 0, 'calls': {}
+        }
+    return _ledger
+
+
+def record(endpoint, units=None):
+    """Charge one call against today's quota"""
+    units = units if units is not None else UNIT_COSTS.get(endpoint, DEFAULT_UNIT_COST)
+    with _ledger_lock:
+        ledger = _current_ledger()
+        ledger['used'] += units
+        calls = ledger['calls'].setdefault(endpoint, {'count': 0, 'units': 0})
+        calls['count'] += 1
+        calls['units'] += units
+        response_cache.put("youtube_quota", _ledger_key(ledger['day']), ledger, ttl=48 * response_cache.HOUR)
+
+
+def usage():
+    """Snapshot of today's spend: used, remaining and per-endpoint counts"""
+    with _ledger_lock:
+        ledger = _current_ledger()
+        return {
+            'day': ledger['day'],
+            'used': ledger['used'],
+            'remaining': max(DAILY_QUOTA - ledger['used'], 0),
+            'calls': {endpoint: dict(calls) for endpoint, calls in ledger['calls'].items()},
+        }
+
+
+def remaining():
+    """Units left in today's quota"""
+    return usage()['remaining']
+
+
+def budget_low(units_needed=0):
+    """True when spending units_needed would leave less than the low-budget reserve"""
+    return remaining() - units_needed < LOW_BUDGET_UNITS
+
+
+def get(url, **kwargs):
+    """GET a YouTube Data API endpoint through the shared client and record its cost"""
+    endpoint = url.rstrip('/').rsplit('/', 1)[-1]
+    response = http_client.get(url, **kwargs)
+    # YouTube charges for every request it receives, including errors
+    record(endpoint)
+    return response
+
+
+@response_cache.cached("youtube", text_args=("query",))
+def search_videos(query, api_key, max_results=50, order="viewCount"):
+    """Run one search.list for a query and return its total count and video IDs.
+
+    Case Search's video count and its Top Performing Content tab share this
+    cached result, so a query costs one 100-unit search instead of two. When
+    the budget is low only cached results are served.
+    """
+    if not api_key or budget_low(UNIT_COSTS['search']):
+        return None
+
+    params = {
+        "key": api_key,
+        "part": "id",
+        "q": query,
+        "type": "video",
+        "order": order,
+        "maxResults": max_results,
+    }
+    response = get(API_BASE + "search", params=params, timeout=10)
+    if response.status_code != 200:
+        print(f"YouTube search error: {response.status_code}")
+        return None
+
+    data = response.json()
+    return {
+        'total_results': data.get("pageInfo", {}).get("totalResults", 0),
+        'video_ids': [item['id']['videoId'] for item in data.get('items', []) if item.get('id', {}).get('videoId')],
+    }
+
+
+# ============ COMPETITOR SYNC ============
+
+VIDEOS_PER_CALL = 50  # videos.list / channels.list accept up to 50 IDs
+VIDEO_DETAILS_TTL = 15 * 60  # view counts move, so details are only reused briefly
+MAX_VIDEO_DETAILS = 2000  # entries in the in-process video details cache
+UPLOADS_SYNC_INTERVAL = 15 * 60  # how often a channel's uploads playlist is re-polled
+UPLOADS_TTL = 30 * 24 * response_cache.HOUR
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+# Short-lived per-video details live in this bounded in-process LRU rather than
+# the shared response cache, so hundreds of 15-minute rows per page view never
+# evict long-lived entries (LLM answers, iTunes/Spotify lookups) from it
+_video_details = OrderedDict()  # (part, video_id) -> (expires_at, resource)
+_video_details_lock = threading.Lock()
+
+
+def _cached_video(part, video_id):
+    with _video_details_lock:
+        entry = _video_details.get((part, video_id))
+        if entry is None:
+            return None
+        if entry[0] <= time.time():
+            del _video_details[(part, video_id)]
+            return None
+        _video_details.move_to_end((part, video_id))
+        return entry[1]
+
+
+def _remember_videos(part, items):
+    expires_at = time.time() + VIDEO_DETAILS_TTL
+    with _video_details_lock:
+        for item in items:
+            _video_details[(part, item['id'])] = (expires_at, item)
+            _video_details.move_to_end((part, item['id']))
+        while len(_video_details) > MAX_VIDEO_DETAILS:
+            _video_details.popitem(last=False)
+
+
+def get_videos(video_ids, api_key, part="snippet,statistics,contentDetails"):
+    """Fetch video resources in batches of 50, reusing recently fetched ones.
+
+    Returns {video_id: resource}. Costs one unit per 50 uncached IDs.
+    """
+    videos = {}
+    missing = []
+    for video_id in dict.fromkeys(video_ids):
+        if not video_id:
+            continue
+        cached = _cached_video(part, video_id)
+        if cached:
+            videos[video_id] = cached
+        else:
+            missing.append(video_id)
+
+    for batch in _chunks(missing, VIDEOS_PER_CALL):
+        try:
+            response = get(API_BASE + "videos", params={
+                "key": api_key,
+                "id": ",".join(batch),
+                "part": part,
+            }, timeout=10)
+            if response.status_code != 200:
+                print(f"YouTube videos.list error: {response.status_code}")
+                continue
+            items = response.json().get('items', [])
+            for item in items:
+                videos[item['id']] = item
+            _remember_videos(part, items)
+        except Exception as e:
+            print(f"YouTube videos.list error: {e}")
+
+    return videos
+
+
+def get_uploads_playlists(channel_ids, api_key):
+    """Resolve each channel's uploads playlist once (one unit per 50 channels) and remember it"""
+    playlists = {}
+    missing = []
+    for channel_id in channel_ids:
+        cached = response_cache.get("youtube_channels", response_cache.make_key("youtube_channels", channel_id))
+        if cached:
+            playlists[channel_id] = cached
+        else:
+            missing.append(channel_id)
+
+    for batch in _chunks(missing, VIDEOS_PER_CALL):
+        try:
+            response = get(API_BASE + "channels", params={
+                "key": api_key,
+                "id": ",".join(batch),
+                "part": "contentDetails",
+            }, timeout=10)
+            if response.status_code != 200:
+                print(f"YouTube channels.list error: {response.status_code}")
+                continue
+            for item in response.json().get('items', []):
+                playlist_id = item.get('contentDetails', {}).get('relatedPlaylists', {}).get('uploads')
+                if playlist_id:
+                    playlists[item['id']] = playlist_id
+                    response_cache.put("youtube_channels", response_cache.make_key("youtube_channels", item['id']), playlist_id, ttl=UPLOADS_TTL)
+        except Exception as e:
+            print(f"YouTube channels.list error: {e}")
+
+    return playlists
+
+
+def _walk_uploads(playlist_id, api_key, since, known=()):
+    """Page through an uploads playlist newest-first.
+
+    Stops at the first already-known video, at the first upload older than
+    `since`, or at the end of the playlist. Returns (items, exhausted).
+    """
+    items = []
+    page_token = None
+    while True:
+        params = {
+            "key": api_key,
+            "playlistId": playlist_id,
+            "part": "contentDetails",
+            "maxResults": 50,
+        }
+        if page_token:
+            params["pageToken"] = page_token
+        response = get(API_BASE + "playlistItems", params=params, timeout=10)
+        if response.status_code != 200:
+            print(f"YouTube playlistItems.list error: {response.status_code}")
+            return items, False
+
+        data = response.json()
+        for item in data.get('items', []):
+            details = item.get('contentDetails', {})
+            video_id = details.get('videoId')
+            published = details.get('videoPublishedAt', '')
+            if video_id in known:
+                return items, False
+            items.append([video_id, published])
+            if published and since and published[:19] < since:
+                return items, False
+
+        page_token = data.get('nextPageToken')
+        if not page_token:
+            return items, True
+
+
+def sync_channel_uploads(channel_id, playlist_id, api_key, since):
+    """Bring the stored upload list for a channel up to date and return [[video_id, published], ...].
+
+    New uploads are pulled incrementally from the head of the playlist; the
+    playlist is only walked further back when a longer time window than
+    what's stored is requested.
+    """
+    since = since[:19] if since else ''
+    key = response_cache.make_key("competitor_uploads", channel_id)
+    store = response_cache.get("competitor_uploads", key) or {
+        'videos': [], 'covered_since': None, 'complete': False, 'synced_at': 0
+    }
+
+    covered = store['complete'] or (store['covered_since'] is not None and store['covered_since'] <= since)
+    fresh = time.time() - store['synced_at'] < UPLOADS_SYNC_INTERVAL
+    if covered and fresh:
+        return store['videos']
+
+    try:
+        if covered:
+            # Only pull what's been uploaded since the last sync
+            known = {video_id for video_id, _ in store['videos']}
+            new_items, _ = _walk_uploads(playlist_id, api_key, since, known)
+            store['videos'] = new_items + store['videos']
+        else:
+            items, exhausted = _walk_uploads(playlist_id, api_key, since)
+            store['videos'] = items
+            store['covered_since'] = since
+            store['complete'] = exhausted
+    except Exception as e:
+        print(f"YouTube uploads sync error for {channel_id}: {e}")
+        return store['videos']
+
+    store['synced_at'] = time.time()
+    response_cache.put("competitor_uploads", key, store, ttl=UPLOADS_TTL)
+    return store['videos']
+
+
+def get_competitor_videos(channels, api_key, published_after, per_channel):
+    """Top `per_channel` videos by views for each channel, published after the cutoff.
+
+    channels maps display name -> channel ID. Returns [(channel_name, video_resource)].
+    Costs one unit per 50 channels to resolve uploads playlists (once), one
+    per 50 new uploads to sync, and one per 50 videos for stats - instead
+    of a 100-unit search per channel.
+    """
+    since = published_after[:19]
+    playlists = get_uploads_playlists(list(channels.values()), api_key)
+
+    window = {}
+    for channel_name, channel_id in channels.items():
+        if channel_id not in playlists:
+            continue
+        uploads = sync_channel_uploads(channel_id, playlists[channel_id], api_key, since)
+        window[channel_name] = [video_id for video_id, published in uploads if published and published[:19] >= since]
+
+    # One batched stats lookup across every channel
+    videos = get_videos([video_id for ids in window.values() for video_id in ids], api_key)
+
+    results = []
+    for channel_name, video_ids in window.items():
+        channel_videos = [videos[video_id] for video_id in video_ids if video_id in videos]
+        channel_videos.sort(key=lambda v: int(v.get('statistics', {}).get('viewCount', 0)), reverse=True)
+        results.extend((channel_name, video) for video in channel_videos[:per_channel])
+    return results
+
+
+# ============ VIDEO STATS ============
+
+def get_video_stats(video_ids, api_key):
+    """Statistics for a list of videos as {video_id: statistics}.
+
+    Every caller that shows view counts goes through here, so rendering N
+    videos costs ceil(N/50) videos.list calls and repeats within
+    VIDEO_DETAILS_TTL cost nothing.
+    """
+    if not api_key:
+        return {}
+    video_ids = [video_id for video_id in video_ids if video_id and not video_id.startswith('sample')]
+    videos = get_videos(video_ids, api_key, part="statistics")
+    return {video_id: video.get('statistics', {}) for video_id, video in videos.items()}
+
+
+def format_views(statistics):
+    """Format a statistics dict's view count like 1.2M views / 45K views / 999 views"""
+    view_count = (statistics or {}).get('viewCount')
+    if not view_count:
+        return "N/A"
+    try:
+        views = int(view_count)
+    except (TypeError, ValueError):
+        return f"{view_count} views"
+    if views >= 1000000:
+        return f"{views/1000000:.1f}M views"
+    elif views >= 1000:
+        return f"{views/1000:.0f}K views"
+    return f"{views:,} views"
+
+
+def format_date(date_string):
+    """Convert YouTube API date to MM/DD/YY format"""
+    if not date_string or date_string in ['Unknown', 'N/A'] or date_string.startswith('sample'):
+        return date_string
+
+    try:
+        if 'T' in date_string:
+            clean_date = date_string.replace('Z', '').split('T')[0]
+            dt = datetime.strptime(clean_date, '%Y-%m-%d')
+        else:
+            dt = datetime.fromisoformat(date_string.replace('Z', '+00:00'))
+        return dt.strftime('%m/%d/%y')
+    except Exception:
+        return date_string
+
+
+# ============ VIDEO METADATA ============
+
+# ISO 8601 durations as the API returns them: PT1H2M3S, PT45S, P1DT2H...
+DURATION_PATTERN = re.compile(r'^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$')
+DURATION_UNITS = [86400, 3600, 60, 1]
+SHORT_MAX_SECONDS = 180  # YouTube Shorts can run up to three minutes
+
+VIDEO_COLUMNS = ['id', 'title', 'channel', 'thumbnail', 'views', 'likes', 'comments',
+                 'duration', 'is_short', 'url', 'publishedAt']
+
+
+def parse_duration(duration):
+    """Seconds in an ISO 8601 duration, 0 if it can't be parsed"""
+    match = DURATION_PATTERN.match(duration or '')
+    if not match:
+        return 0
+    return sum(int(value or 0) * unit for value, unit in zip(match.groups(), DURATION_UNITS))
+
+
+def is_short(duration_seconds):
+    """Shorts are anything with a known duration up to SHORT_MAX_SECONDS"""
+    return 0 < duration_seconds <= SHORT_MAX_SECONDS
+
+
+def normalize_videos(videos):
+    """Flatten videos.list resources into one typed DataFrame.
+
+    Durations for the whole batch are parsed in a single vectorized pass and
+    classified as shorts, so views can sort and filter the frame without
+    touching the raw payloads again.
+    """
+    rows = []
+    for video in videos:
+        snippet = video.get('snippet', {})
+        statistics = video.get('statistics', {})
+        rows.append((
+            video['id'],
+            snippet.get('title', ''),
+            snippet.get('channelTitle', ''),
+            snippet.get('thumbnails', {}).get('medium', {}).get('url', ''),
+            statistics.get('viewCount', 0),
+            statistics.get('likeCount', 0),
+            statistics.get('commentCount', 0),
+            video.get('contentDetails', {}).get('duration', ''),
+            snippet.get('publishedAt', ''),
+        ))
+
+    frame = pd.DataFrame(rows, columns=['id', 'title', 'channel', 'thumbnail', 'views', 'likes',
+                                        'comments', 'raw_duration', 'publishedAt'])
+    parts = frame['raw_duration'].str.extract(DURATION_PATTERN).fillna(0).astype('int64')
+    frame['duration'] = parts.mul(DURATION_UNITS, axis=1).sum(axis=1).astype('int32')
+    frame['is_short'] = (frame['duration'] > 0) & (frame['duration'] <= SHORT_MAX_SECONDS)
+    for column in ('views', 'likes', 'comments'):
+        frame[column] = pd.to_numeric(frame[column], errors='coerce').fillna(0).astype('int64')
+    frame['channel'] = frame['channel'].astype('category')
+    frame['url'] = "https://www.youtube.com/watch?v=" + frame['id']
+    return frame[VIDEO_COLUMNS]
+
+
+def top_videos(frame, shorts, limit=5):
+    """The most-viewed shorts or long-form videos from a normalized frame, as dicts"""
+    subset = frame[frame['is_short'] == shorts]
+    return subset.nlargest(limit, 'views').to_dict('records')